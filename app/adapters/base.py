@@ -1,22 +1,45 @@
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
-from typing import Iterable
+from pathlib import Path
+from typing import Any, Iterable, Iterator
 
+from app.adapters.batching import chunked
+from app.models.records import AddressRecord
 from app.models.schemas import Address, ContactPoint
 
 
 class AddressUpdateProvider(ABC):
+    # Largest batch the vendor accepts per request; None means no cap.
+    max_batch_size: int | None = None
+    # Bump when the vendor data or rules change so processed rows are re-sent.
+    version: str = "1"
+
     @abstractmethod
     def update(self, addresses: Iterable[Address]) -> list[Address]:
         raise NotImplementedError
 
+    def update_records(self, records: list[AddressRecord]) -> list[AddressRecord]:
+        """Pipeline entry point. Validates into ``Address`` models for
+        ``update``; in-process providers can override it to skip that."""
+        updated = self.update([record.to_address() for record in records])
+        return [AddressRecord.from_address(address) for address in updated]
+
 
 class AddressStandardizer(ABC):
+    max_batch_size: int | None = None
+    version: str = "1"
+
     @abstractmethod
     def standardize(self, addresses: Iterable[Address]) -> list[Address]:
         raise NotImplementedError
 
+    def standardize_records(self, records: list[AddressRecord]) -> list[AddressRecord]:
+        """Pipeline entry point; see ``AddressUpdateProvider.update_records``."""
+        standardized = self.standardize([record.to_address() for record in records])
+        return [AddressRecord.from_address(address) for address in standardized]
+
 
 class AppendVendorClient(ABC):
     @abstractmethod
@@ -27,6 +50,29 @@ class AppendVendorClient(ABC):
     def import_appends(self, payload: str) -> list[ContactPoint]:
         raise NotImplementedError
 
+    def export_file(self, rows: Iterable[dict[str, Any]], path: Path) -> int:
+        """Write address rows to ``path`` as NDJSON, one address per line.
+
+        Rows are plain dicts with the ``Address`` fields, so nothing has to
+        be built or held in memory beyond the current line.
+        """
+        written = 0
+        with path.open("w", encoding="utf-8") as handle:
+            for row in rows:
+                handle.write(json.dumps(row) + "\n")
+                written += 1
+        return written
+
+    def import_file(self, path: Path, batch_size: int = 1000) -> Iterator[list[ContactPoint]]:
+        """Yield appended contacts for an NDJSON handoff file, batch by batch.
+
+        The default feeds each batch of lines to ``import_appends`` as a JSON
+        array, so vendors that only implement the payload methods still work.
+        """
+        with path.open(encoding="utf-8") as handle:
+            for lines in chunked((line for line in handle if line.strip()), batch_size):
+                yield self.import_appends("[" + ",".join(lines) + "]")
+
 
 class RinglessVoicemailClient(ABC):
     @abstractmethod
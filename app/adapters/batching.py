@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def map_batches(
+    func: Callable[[list[T]], R],
+    batches: Iterable[list[T]],
+    max_workers: int,
+) -> Iterator[R]:
+    """Run ``func`` over batches on a thread pool, yielding results in order.
+
+    At most ``max_workers`` calls are in flight, and the next batch is only
+    pulled once a slot frees up, so memory stays bounded by the window.
+    """
+    if max_workers <= 1:
+        for batch in batches:
+            yield func(batch)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight: deque[Future[R]] = deque()
+        for batch in batches:
+            if len(in_flight) >= max_workers:
+                yield in_flight.popleft().result()
+            in_flight.append(executor.submit(func, batch))
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+class RateLimiter:
+    """Spaces calls shared across threads to at most ``per_second``."""
+
+    def __init__(self, per_second: float) -> None:
+        self.interval = 1.0 / per_second
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import time
+from dataclasses import replace
 from datetime import datetime
 from typing import Iterable
 
@@ -12,11 +14,18 @@ from app.adapters.base import (
     RinglessVoicemailClient,
     SMSClient,
 )
+from app.models.records import AddressRecord
 from app.models.schemas import Address, ContactPoint
 
 
 class MockAddressUpdateProvider(AddressUpdateProvider):
+    def __init__(self, latency: float = 0.0, max_batch_size: int | None = None) -> None:
+        self.latency = latency
+        self.max_batch_size = max_batch_size
+
     def update(self, addresses: Iterable[Address]) -> list[Address]:
+        if self.latency:
+            time.sleep(self.latency)
         updated = []
         for address in addresses:
             updated.append(
@@ -29,9 +38,24 @@ class MockAddressUpdateProvider(AddressUpdateProvider):
             )
         return updated
 
+    def update_records(self, records: list[AddressRecord]) -> list[AddressRecord]:
+        if self.latency:
+            time.sleep(self.latency)
+        updated_at = datetime.utcnow().isoformat()
+        return [
+            replace(record, confidence=min(record.confidence + 0.1, 0.95), updated_at=updated_at)
+            for record in records
+        ]
+
 
 class MockAddressStandardizer(AddressStandardizer):
+    def __init__(self, latency: float = 0.0, max_batch_size: int | None = None) -> None:
+        self.latency = latency
+        self.max_batch_size = max_batch_size
+
     def standardize(self, addresses: Iterable[Address]) -> list[Address]:
+        if self.latency:
+            time.sleep(self.latency)
         standardized = []
         for address in addresses:
             standardized.append(
@@ -46,10 +70,25 @@ class MockAddressStandardizer(AddressStandardizer):
             )
         return standardized
 
+    def standardize_records(self, records: list[AddressRecord]) -> list[AddressRecord]:
+        if self.latency:
+            time.sleep(self.latency)
+        updated_at = datetime.utcnow().isoformat()
+        return [
+            replace(
+                record,
+                line1=record.line1.upper(),
+                city=record.city.upper(),
+                state=record.state.upper(),
+                updated_at=updated_at,
+            )
+            for record in records
+        ]
+
 
 class MockAppendVendorClient(AppendVendorClient):
     def export_payload(self, addresses: Iterable[Address]) -> str:
-        rows = [address.model_dump() for address in addresses]
+        rows = [address.model_dump(mode="json") for address in addresses]
         return json.dumps(rows)
 
     def import_appends(self, payload: str) -> list[ContactPoint]:
@@ -80,15 +119,30 @@ class MockAppendVendorClient(AppendVendorClient):
 
 
 class MockRinglessVoicemailClient(RinglessVoicemailClient):
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+
     def send(self, owner_id: str, phone: str, message: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
         return f"rv-{owner_id}-{int(datetime.utcnow().timestamp())}"
 
 
 class MockSMSClient(SMSClient):
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+
     def send(self, owner_id: str, phone: str, message: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
         return f"sms-{owner_id}-{int(datetime.utcnow().timestamp())}"
 
 
 class MockEmailClient(EmailClient):
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+
     def send(self, owner_id: str, email: str, message: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
         return f"email-{owner_id}-{int(datetime.utcnow().timestamp())}"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterable
 
 from app.models.schemas import IntentLabel
 
@@ -10,19 +11,50 @@ class SchedulingLink:
     url: str
 
 
+# Keyword rules in precedence order: the first label with a keyword found in
+# the lower-cased message wins, and anything unmatched is curious.
+INTENT_RULES: tuple[tuple[IntentLabel, tuple[str, ...]], ...] = (
+    (IntentLabel.stop, ("stop", "unsubscribe")),
+    (IntentLabel.not_now, ("not now", "later")),
+    (IntentLabel.never, ("never", "do not contact")),
+    (IntentLabel.interested, ("interested", "yes", "call me")),
+)
+
+
 class IntentClassifier:
+    def __init__(
+        self, rules: tuple[tuple[IntentLabel, tuple[str, ...]], ...] = INTENT_RULES
+    ) -> None:
+        # Flattened once into an ordered keyword table, so classify is a
+        # single walk that stops at the highest-precedence hit.
+        self._keywords = tuple(
+            (keyword, label) for label, keywords in rules for keyword in keywords
+        )
+
     def classify(self, message: str) -> IntentLabel:
         normalized = message.lower()
-        if "stop" in normalized or "unsubscribe" in normalized:
-            return IntentLabel.stop
-        if "not now" in normalized or "later" in normalized:
-            return IntentLabel.not_now
-        if "never" in normalized or "do not contact" in normalized:
-            return IntentLabel.never
-        if "interested" in normalized or "yes" in normalized or "call me" in normalized:
-            return IntentLabel.interested
+        for keyword, label in self._keywords:
+            if keyword in normalized:
+                return label
         return IntentLabel.curious
 
+    def classify_batch(self, messages: Iterable[str]) -> list[IntentLabel]:
+        """Label many messages with the same walk as classify, minus the
+        per-message call and attribute lookups."""
+        keywords = self._keywords
+        curious = IntentLabel.curious
+        labels: list[IntentLabel] = []
+        append = labels.append
+        for message in messages:
+            normalized = message.lower()
+            for keyword, label in keywords:
+                if keyword in normalized:
+                    append(label)
+                    break
+            else:
+                append(curious)
+        return labels
+
 
 class ResponseGenerator:
     def __init__(self, scheduling_link: SchedulingLink) -> None:
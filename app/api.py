@@ -1,13 +1,22 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from functools import partial
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Tuple
+import json
 import logging
 
-from app.pipeline.runner import run_pipeline
-from app.pipeline.steps import dashboard, PipelineConfig
+from app.ai.inbound_handler import IntentClassifier, ResponseGenerator, SchedulingLink
+from app.pipeline.inbound import InboundBatcher
+from app.pipeline.instrumentation import latest_run_report
+from app.pipeline.jobs import PipelineJobRunner, get_job
+from app.pipeline.runner import PipelineBusyError, select_stages
+from app.pipeline.steps import ai_inbound_handler, dashboard, PipelineConfig
 from app.db.database import get_connection
+from app.db.pagination import KeysetListing, decode_cursor
 
 app = FastAPI(
     title="Owner Intelligence API",
@@ -24,10 +33,27 @@ app.add_middleware(
 )
 
 logger = logging.getLogger(__name__)
+job_runner = PipelineJobRunner()
+inbound_batcher = InboundBatcher(
+    partial(
+        ai_inbound_handler,
+        IntentClassifier(),
+        ResponseGenerator(SchedulingLink(url="https://cal.example.com")),
+    )
+)
 
 
 class PipelineRequest(BaseModel):
     sample_dir: str = "app/sample_data"
+    rebuild: bool = False
+    from_stage: Optional[str] = None
+    only_stages: Optional[List[str]] = None
+
+
+class InboundMessage(BaseModel):
+    owner_id: str
+    message: str
+    channel: str = "sms"
 
 
 @app.get("/")
@@ -44,27 +70,83 @@ async def health_check():
     return {"status": "healthy"}
 
 
-@app.post("/pipeline/run")
+@app.post("/pipeline/run", status_code=202)
 async def run_pipeline_endpoint(request: PipelineRequest):
-    """Run the complete pipeline"""
+    """Submit a pipeline run as a background job"""
+    sample_dir = Path(request.sample_dir)
+    if not sample_dir.exists():
+        raise HTTPException(status_code=400, detail="Sample directory not found")
+    try:
+        select_stages(request.from_stage, request.only_stages)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
-        sample_dir = Path(request.sample_dir)
-        if not sample_dir.exists():
-            raise HTTPException(status_code=400, detail="Sample directory not found")
-        
-        run_pipeline(sample_dir)
-        return {"status": "success", "message": "Pipeline completed successfully"}
+        job = await run_in_threadpool(
+            job_runner.submit,
+            sample_dir,
+            rebuild=request.rebuild,
+            from_stage=request.from_stage,
+            only_stages=request.only_stages,
+        )
+    except PipelineBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         logger.error(f"Pipeline error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+    return {"status": job.status, "job_id": job.id}
+
+
+@app.get("/pipeline/jobs/{job_id}")
+def get_pipeline_job(job_id: str):
+    """Get the status and run report of a pipeline job"""
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+@app.get("/pipeline/jobs/{job_id}/progress")
+def get_pipeline_job_progress(job_id: str):
+    """Get the current stage and completion percentage of a pipeline job"""
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.progress()
+
+
+@app.get("/pipeline/runs/latest")
+async def get_latest_run():
+    """Get per-stage timing and row counts for the most recent pipeline run"""
+    try:
+        report = latest_run_report()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if report is None:
+        raise HTTPException(status_code=404, detail="No pipeline runs recorded")
+    return report
+
+
+@app.post("/webhooks/inbound")
+async def receive_inbound(inbound: InboundMessage):
+    """Handle an inbound reply, batched with others arriving at the same time"""
+    try:
+        intent = await inbound_batcher.submit(inbound.model_dump())
+    except Exception as e:
+        logger.error(f"Inbound handler error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "ok", "owner_id": inbound.owner_id, "intent": intent.value}
 
 
 @app.get("/dashboard")
-async def get_dashboard():
-    """Get pipeline dashboard metrics"""
+def get_dashboard(recount: bool = False):
+    """Get pipeline dashboard metrics from the maintained counters.
+
+    recount=true recomputes every metric from the base tables instead.
+    """
     try:
         config = PipelineConfig()
-        results = dashboard(config)
+        results = dashboard(config, recount=recount)
         return {
             "source_records": results.source_records,
             "owner_count": results.owner_count,
@@ -73,30 +155,88 @@ async def get_dashboard():
             "outreach_queued": results.outreach_queued,
             "deliverable_addresses": results.deliverable_addresses,
             "mobile_confirmed": results.mobile_confirmed,
-            "daily_hot_leads": results.daily_hot_leads
+            "daily_hot_leads": results.daily_hot_leads,
+            "refreshed_at": results.refreshed_at,
+            "source": "recount" if recount else "counters"
         }
     except Exception as e:
         logger.error(f"Dashboard error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/owners")
-async def get_owners():
-    """Get list of all owners"""
+OWNER_LISTING = KeysetListing(
+    table="owners",
+    columns=("id", "canonical_name", "created_at", "score"),
+    sort_column="score",
+    tiebreak_column="id",
+)
+HOT_LEAD_LISTING = KeysetListing(
+    table="hot_leads",
+    columns=("owner_id", "reason", "created_at"),
+    sort_column="created_at",
+    tiebreak_column="owner_id",
+)
+MAX_PAGE_SIZE = 1000
+
+
+def list_rows(
+    listing: KeysetListing,
+    key: str,
+    filters: List[Tuple[str, Any]],
+    limit: Optional[int],
+    cursor: Optional[str],
+    fields: Optional[str],
+    output: str,
+):
     try:
-        with get_connection() as conn:
-            owners = conn.execute("SELECT * FROM owners").fetchall()
-            return {"owners": [dict(row) for row in owners]}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        projected = listing.project(fields.split(",") if fields else None)
+        if cursor:
+            decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if output == "ndjson":
+        def stream():
+            with get_connection() as conn:
+                for row in listing.rows(conn, projected, filters, cursor, limit):
+                    yield json.dumps({field: row[field] for field in projected}) + "\n"
+
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+    page_size = max(1, min(limit or 100, MAX_PAGE_SIZE))
+    with get_connection() as conn:
+        rows = listing.rows(conn, projected, filters, cursor, page_size).fetchall()
+    next_cursor = listing.cursor_for(rows[-1]) if len(rows) == page_size else None
+    return {
+        key: [{field: row[field] for field in projected} for row in rows],
+        "next_cursor": next_cursor
+    }
+
+
+@app.get("/owners")
+def get_owners(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    min_score: Optional[float] = None,
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+):
+    """List owners by descending score, one keyset page at a time.
+
+    format=ndjson streams every matching row (or up to limit) from the cursor.
+    """
+    filters = [("score >= ?", min_score)] if min_score is not None else []
+    return list_rows(OWNER_LISTING, "owners", filters, limit, cursor, fields, output)
 
 
 @app.get("/hot-leads")
-async def get_hot_leads():
-    """Get list of hot leads"""
-    try:
-        with get_connection() as conn:
-            leads = conn.execute("SELECT * FROM hot_leads").fetchall()
-            return {"hot_leads": [dict(row) for row in leads]}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+def get_hot_leads(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    since: Optional[str] = None,
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+):
+    """List hot leads newest first, one keyset page at a time"""
+    filters = [("created_at >= ?", since)] if since is not None else []
+    return list_rows(HOT_LEAD_LISTING, "hot_leads", filters, limit, cursor, fields, output)
@@ -0,0 +1,67 @@
+"""Compare serial and chunked/concurrent address vendor calls.
+
+Usage: python -m app.benchmarks.address_providers [ADDRESSES] [LATENCY_SECONDS]
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from app.adapters.mock import MockAddressStandardizer, MockAddressUpdateProvider
+from app.db import database
+from app.pipeline.steps import address_standardize, address_update
+
+VENDOR_CAP = 500
+
+
+def seed_addresses(count: int) -> None:
+    with database.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO addresses (id, owner_id, line1, city, state, postal_code,"
+            " confidence, is_deliverable, updated_at)"
+            " VALUES (?, ?, '1 Main St', 'Canton', 'oh', '44702', 0.5, 1, ?)",
+            [
+                (f"addr-{uuid.uuid4()}", f"own-{index}", "2024-01-01T00:00:00")
+                for index in range(count)
+            ],
+        )
+
+
+def reset_versions() -> None:
+    with database.get_connection() as conn:
+        conn.execute("UPDATE addresses SET update_version = NULL, standardize_version = NULL")
+
+
+def timed(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{label:<40} {time.perf_counter() - start:8.2f}s")
+
+
+def main(count: int, latency: float) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        database.DB_PATH = Path(workdir) / "owners.db"
+        database.run_migrations()
+        seed_addresses(count)
+        provider = MockAddressUpdateProvider(latency=latency, max_batch_size=VENDOR_CAP)
+        standardizer = MockAddressStandardizer(latency=latency, max_batch_size=VENDOR_CAP)
+        print(f"{count} addresses, {latency:.2f}s per vendor request, cap {VENDOR_CAP}")
+        for workers in (1, 4, 16):
+            reset_versions()
+            timed(
+                f"address_update workers={workers}",
+                lambda: address_update(provider, VENDOR_CAP, workers),
+            )
+            timed(
+                f"address_standardize workers={workers}",
+                lambda: address_standardize(standardizer, VENDOR_CAP, workers),
+            )
+        database.close_connections()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 20_000, float(args[1]) if len(args) > 1 else 0.2)
@@ -0,0 +1,97 @@
+"""Per-row cost of the address stages with pydantic models vs slotted records.
+
+Usage: python -m app.benchmarks.address_records [ADDRESSES]
+
+The "pydantic" rows route through the adapters' default ``*_records``
+methods, which validate every row into an ``Address`` and back, as the
+stages did before ``AddressRecord``.
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.adapters.base import AddressStandardizer, AddressUpdateProvider
+from app.adapters.mock import MockAddressStandardizer, MockAddressUpdateProvider
+from app.benchmarks.address_providers import reset_versions, seed_addresses
+from app.db import database
+from app.models.records import AddressRecord
+from app.pipeline.steps import (
+    address_from_row,
+    address_standardize,
+    address_update,
+    score_owners,
+)
+
+
+class PydanticUpdateProvider(MockAddressUpdateProvider):
+    update_records = AddressUpdateProvider.update_records
+
+
+class PydanticStandardizer(MockAddressStandardizer):
+    standardize_records = AddressStandardizer.standardize_records
+
+
+def per_row(label: str, count: int, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<38} {elapsed:>8.2f}s {elapsed / count * 1_000_000:>8.2f} us/row")
+
+
+def main(count: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        database.DB_PATH = Path(workdir) / "owners.db"
+        database.run_migrations()
+        seed_addresses(count)
+        with database.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO owners (id, canonical_name, created_at, score)"
+                " SELECT DISTINCT owner_id, owner_id, updated_at, 0 FROM addresses"
+            )
+            conn.commit()
+        print(f"{count} addresses")
+        with database.get_connection() as conn:
+            rows = conn.execute("SELECT * FROM addresses").fetchall()
+        provider, standardizer = MockAddressUpdateProvider(), MockAddressStandardizer()
+        per_row(
+            "row objects + update (pydantic)",
+            count,
+            lambda: provider.update([address_from_row(row) for row in rows]),
+        )
+        per_row(
+            "row objects + update (records)",
+            count,
+            lambda: provider.update_records([AddressRecord.from_row(row) for row in rows]),
+        )
+        per_row(
+            "row objects + standardize (pydantic)",
+            count,
+            lambda: standardizer.standardize([address_from_row(row) for row in rows]),
+        )
+        per_row(
+            "row objects + standardize (records)",
+            count,
+            lambda: standardizer.standardize_records([AddressRecord.from_row(row) for row in rows]),
+        )
+        print("full stages, including the SQL reads and writes:")
+        for label, provider, standardizer in (
+            ("pydantic", PydanticUpdateProvider(), PydanticStandardizer()),
+            ("records", MockAddressUpdateProvider(), MockAddressStandardizer()),
+        ):
+            reset_versions()
+            per_row(f"address_update ({label})", count, lambda: address_update(provider, 500, 1))
+            per_row(
+                f"address_standardize ({label})",
+                count,
+                lambda: address_standardize(standardizer, 500, 1),
+            )
+        # score_owners is a single set-based UPDATE and builds no row objects.
+        per_row("score_owners (SQL)", count, score_owners)
+        database.close_connections()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,95 @@
+"""Compare the in-memory JSON append handoff with the streaming NDJSON one.
+
+Usage: python -m app.benchmarks.append_handoff [ADDRESSES]
+
+Peak memory is traced with tracemalloc, so absolute timings are inflated;
+compare the two rows against each other.
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+from app.adapters.mock import MockAppendVendorClient
+from app.db import database
+from app.pipeline.steps import address_from_row, export_for_append, import_appends
+
+
+def seed_addresses(count: int) -> None:
+    with database.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO addresses (id, owner_id, line1, city, state, postal_code,"
+            " confidence, is_deliverable, updated_at)"
+            " VALUES (?, ?, '1 MAIN ST', 'CANTON', 'OH', '44702', 0.7, 1, ?)",
+            [
+                (f"addr-{uuid.uuid4()}", f"own-{uuid.uuid4()}", "2024-01-01T00:00:00")
+                for _ in range(count)
+            ],
+        )
+        conn.commit()
+
+
+def in_memory_handoff(client: MockAppendVendorClient, path: Path) -> None:
+    """The previous flow: one JSON document built, written and parsed whole."""
+    with database.get_connection() as conn:
+        rows = conn.execute(
+            "SELECT * FROM addresses WHERE confidence >= ? AND is_deliverable = 1", (0.6,)
+        ).fetchall()
+        payload = client.export_payload([address_from_row(row) for row in rows])
+        path.write_text(payload)
+        for contact in client.import_appends(payload):
+            conn.execute(
+                "INSERT OR REPLACE INTO contacts (id, owner_id, value, contact_type,"
+                " phone_type, confidence, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    contact.id,
+                    contact.owner_id,
+                    contact.value,
+                    contact.contact_type,
+                    contact.phone_type,
+                    contact.confidence,
+                    contact.updated_at.isoformat(),
+                ),
+            )
+        conn.commit()
+
+
+def streaming_handoff(client: MockAppendVendorClient, path: Path) -> None:
+    export_for_append(client, path, 0.6)
+    import_appends(client, path)
+
+
+def measure(label: str, func) -> None:
+    with database.get_connection() as conn:
+        conn.execute("DELETE FROM contacts")
+        conn.commit()
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {elapsed:>8.2f}s {peak / 1_000_000:>10.1f} MB peak")
+
+
+def main(count: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        database.DB_PATH = Path(workdir) / "owners.db"
+        database.run_migrations()
+        seed_addresses(count)
+        client = MockAppendVendorClient()
+        print(f"{count} exported addresses")
+        measure("in-memory", lambda: in_memory_handoff(client, Path(workdir) / "export.json"))
+        measure("streaming", lambda: streaming_handoff(client, Path(workdir) / "export.ndjson"))
+        with database.get_connection() as conn:
+            contacts = conn.execute("SELECT COUNT(*) AS count FROM contacts").fetchone()["count"]
+        assert contacts == 2 * count, "streaming import lost contacts"
+        database.close_connections()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
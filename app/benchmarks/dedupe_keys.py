@@ -0,0 +1,88 @@
+"""Measure the per-comparison cost of dedupe scoring with precomputed match keys.
+
+Pairs are drawn the way the blocking index produces them: each name is scored
+against the candidates it shares a prefix token with, over the synthetic mix of
+people, trusts, LLCs and estates.
+
+Usage: python -m app.benchmarks.dedupe_keys [RECORDS]
+"""
+from __future__ import annotations
+
+import re
+import sys
+import time
+
+from app.synthetic import source_rows
+from app.scoring.dedupe import OwnerMatchIndex, frozen_gc, match_key, match_score
+
+DEFAULT_RECORDS = 50_000
+
+
+def legacy_normalize(name: str) -> str:
+    return " ".join(re.sub(r"[^A-Za-z0-9 ]", " ", name).upper().split())
+
+
+def legacy_dedupe_score(name_a: str, name_b: str) -> float:
+    # dedupe_score before match keys: normalize and tokenize on every call.
+    a = legacy_normalize(name_a)
+    b = legacy_normalize(name_b)
+    if a == b:
+        return 1.0
+    tokens_a = set(a.split())
+    tokens_b = set(b.split())
+    if not tokens_a or not tokens_b:
+        return 0.0
+    overlap = len(tokens_a & tokens_b) / max(len(tokens_a), len(tokens_b))
+    return round(overlap, 2)
+
+
+def candidate_pairs(names: list[str]) -> list[tuple[str, str]]:
+    index = OwnerMatchIndex()
+    pairs: list[tuple[str, str]] = []
+    with frozen_gc():
+        for name in names:
+            key = match_key(name)
+            pairs.extend((name, names[position]) for position in index.candidates(key))
+            index.add(key, name)
+    return pairs
+
+
+def time_pairs(pairs: list[tuple[str, str]], score) -> tuple[float, float]:
+    start = time.perf_counter()
+    total = 0.0
+    for name_a, name_b in pairs:
+        total += score(name_a, name_b)
+    return time.perf_counter() - start, total
+
+
+def main(records: int) -> None:
+    names = [row["owner_name"] for row in source_rows(records)]
+    pairs = candidate_pairs(names)
+    print(f"{len(names)} names, {len(set(names))} distinct, {len(pairs)} candidate pairs")
+
+    legacy_elapsed, legacy_total = time_pairs(pairs, legacy_dedupe_score)
+    match_key.cache_clear()
+    keyed_elapsed, keyed_total = time_pairs(
+        pairs, lambda a, b: match_score(match_key(a), match_key(b))
+    )
+    assert legacy_total == keyed_total, "match keys changed scores"
+
+    key_pairs = [(match_key(a), match_key(b)) for a, b in pairs]
+    start = time.perf_counter()
+    for key_a, key_b in key_pairs:
+        match_score(key_a, key_b)
+    precomputed_elapsed = time.perf_counter() - start
+
+    cache = match_key.cache_info()
+    print(f"match_key cache: {cache.hits} hits, {cache.misses} misses")
+    print(f"{'path':<28} {'seconds':>10} {'us/pair':>10}")
+    for label, elapsed in (
+        ("normalize per call", legacy_elapsed),
+        ("cached match_key", keyed_elapsed),
+        ("precomputed keys", precomputed_elapsed),
+    ):
+        print(f"{label:<28} {elapsed:>10.2f} {elapsed / len(pairs) * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECORDS)
@@ -0,0 +1,46 @@
+"""Compare serial owner resolution with the process-pool partitioned run.
+
+Usage: python -m app.benchmarks.dedupe_parallel [RECORDS] [WORKERS ...]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+from app.synthetic import source_rows
+from app.pipeline.identity import partition_records, resolve_owners, resolve_owners_parallel
+from app.scoring.dedupe import OwnerMatchIndex, frozen_gc, match_key
+
+DEFAULT_RECORDS = 500_000
+
+
+def main(records: int, worker_counts: list[int]) -> None:
+    rows = [{**row, "id": f"src-{position}"} for position, row in enumerate(source_rows(records))]
+    print(f"{records} records, {os.cpu_count()} cpus")
+
+    match_key.cache_clear()
+    start = time.perf_counter()
+    with frozen_gc():
+        serial_owners = len(resolve_owners(OwnerMatchIndex(), rows)[0])
+    serial = time.perf_counter() - start
+    print(f"{'workers':>8} {'partition s':>12} {'total s':>10} {'speedup':>8}")
+    print(f"{'serial':>8} {'':>12} {serial:>10.2f} {1.0:>8.2f}")
+
+    for workers in worker_counts:
+        match_key.cache_clear()
+        start = time.perf_counter()
+        partition_records([], rows, "blocking_token", workers)
+        partitioning = time.perf_counter() - start
+
+        match_key.cache_clear()
+        start = time.perf_counter()
+        owners = len(resolve_owners_parallel([], rows, workers)[0])
+        elapsed = time.perf_counter() - start
+        assert owners == serial_owners, "parallel run changed merge decisions"
+        print(f"{workers:>8} {partitioning:>12.2f} {elapsed:>10.2f} {serial / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(args[0] if args else DEFAULT_RECORDS, args[1:] or [2, 4, 8])
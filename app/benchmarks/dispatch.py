@@ -0,0 +1,65 @@
+"""Measure outbound dispatch throughput against latency-injected mock clients.
+
+Usage: python -m app.benchmarks.dispatch [ROWS] [LATENCY_SECONDS]
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from app.adapters.mock import MockEmailClient, MockRinglessVoicemailClient, MockSMSClient
+from app.db import database
+from app.pipeline.dispatch import ChannelLimits, dispatch_outreach
+from app.pipeline.steps import queue_entry
+
+CHANNELS = {
+    "sms": ("phone", MockSMSClient),
+    "email": ("email", MockEmailClient),
+    "ringless_voicemail": ("phone", MockRinglessVoicemailClient),
+}
+
+
+def seed_queue(count: int) -> None:
+    due = (datetime.utcnow() - timedelta(minutes=1)).isoformat()
+    channels = list(CHANNELS)
+    with database.get_connection() as conn:
+        conn.execute("DELETE FROM outreach_queue")
+        conn.execute("DELETE FROM contact_attempts")
+        conn.executemany(
+            "INSERT INTO outreach_queue (id, owner_id, channel, payload, scheduled_for, status)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                queue_entry(
+                    f"own-{index}",
+                    channels[index % len(channels)],
+                    {CHANNELS[channels[index % len(channels)]][0]: f"target-{index}"},
+                    due,
+                )
+                for index in range(count)
+            ],
+        )
+        conn.commit()
+
+
+def main(count: int, latency: float) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        database.DB_PATH = Path(workdir) / "owners.db"
+        database.run_migrations()
+        clients = {channel: client(latency=latency) for channel, (_, client) in CHANNELS.items()}
+        print(f"{count} queued rows, {latency:.3f}s per send, no rate limits")
+        for concurrency in (1, 8, 32):
+            seed_queue(count)
+            limits = {channel: ChannelLimits(concurrency=concurrency) for channel in CHANNELS}
+            stats = dispatch_outreach(clients, limits)
+            print(
+                f"concurrency={concurrency:<3} {stats.sent:>7} sent"
+                f" {stats.seconds:>8.2f}s {stats.sends_per_second:>10.0f} sends/s"
+            )
+        database.close_connections()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 3_000, float(args[1]) if len(args) > 1 else 0.05)
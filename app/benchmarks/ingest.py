@@ -0,0 +1,52 @@
+"""Measure streaming CSV ingest throughput and peak memory.
+
+Usage: python -m app.benchmarks.ingest [ROWS] [BATCH_SIZE]
+"""
+from __future__ import annotations
+
+import csv
+import logging
+import resource
+import sys
+import tempfile
+from pathlib import Path
+
+from app.synthetic import source_rows
+from app.db import database
+from app.pipeline.steps import ingest
+
+DEFAULT_ROWS = 5_000_000
+FIELDS = [
+    "owner_name", "source_type", "source_id", "address_line1",
+    "city", "state", "postal_code",
+]
+
+
+def write_csv(path: Path, rows: int) -> None:
+    with path.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(source_rows(rows))
+
+
+def main(rows: int, batch_size: int) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = Path(workdir) / "leases.csv"
+        write_csv(csv_path, rows)
+        database.DB_PATH = Path(workdir) / "owners.db"
+        database.run_migrations()
+        stats = ingest([csv_path], batch_size)
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"ingested {stats.rows} rows in {stats.seconds:.1f}s "
+        f"({stats.rows_per_second:.0f} rows/s, batch {batch_size}, peak RSS {peak_mb:.0f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(
+        args[0] if args else DEFAULT_ROWS,
+        args[1] if len(args) > 1 else 5000,
+    )
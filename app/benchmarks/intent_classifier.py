@@ -0,0 +1,37 @@
+"""Measure inbound intent classification throughput.
+
+Usage: python -m app.benchmarks.intent_classifier [MESSAGES]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable
+
+from app.ai.inbound_handler import IntentClassifier
+from app.models.schemas import IntentLabel
+from app.synthetic import chained_classify, inbound_messages
+
+DEFAULT_MESSAGES = 1_000_000
+
+
+def timed(label: str, run: Callable[[], list[IntentLabel]], count: int) -> list[IntentLabel]:
+    start = time.perf_counter()
+    labels = run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>16} {elapsed:>8.2f}s {count / elapsed:>12.0f} msg/s")
+    return labels
+
+
+def main(count: int) -> None:
+    messages = list(inbound_messages(count))
+    classifier = IntentClassifier()
+    print(f"{count} messages, {len(set(messages))} distinct")
+    baseline = timed("rule chain", lambda: [chained_classify(m) for m in messages], count)
+    single = timed("classify", lambda: [classifier.classify(m) for m in messages], count)
+    batch = timed("classify_batch", lambda: classifier.classify_batch(messages), count)
+    assert baseline == single == batch, "classifier changed labels"
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MESSAGES)
@@ -0,0 +1,79 @@
+"""Compare per-object, columnar and SQL owner scoring.
+
+Usage: python -m app.benchmarks.scoring [ADDRESSES]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.db import database
+from app.pipeline.steps import address_from_row, score_owners, score_owners_columnar
+from app.scoring.address import address_score
+from app.scoring.batch import AddressColumns, address_scores, max_by_owner
+
+
+def seed(count: int) -> None:
+    rng = random.Random(5)
+    owners = max(1, count // 3)
+    with database.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO owners (id, canonical_name, created_at, score) VALUES (?, ?, '', 0)",
+            [(f"own-{index}", f"Owner {index}") for index in range(owners)],
+        )
+        conn.executemany(
+            "INSERT INTO addresses (id, owner_id, line1, city, state, postal_code,"
+            " confidence, is_deliverable, updated_at)"
+            " VALUES (?, ?, '1 MAIN ST', 'CANTON', 'OH', '44702', ?, ?, '2024-01-01T00:00:00')",
+            [
+                (f"addr-{index}", f"own-{rng.randrange(owners)}", rng.random(), rng.random() < 0.7)
+                for index in range(count)
+            ],
+        )
+        conn.commit()
+
+
+def per_object(rows) -> dict[str, float]:
+    best: dict[str, float] = {}
+    for row in rows:
+        address = address_from_row(row)
+        score = address_score(address)
+        if score > best.get(address.owner_id, -1.0):
+            best[address.owner_id] = score
+    return best
+
+
+def columnar(rows) -> dict[str, float]:
+    columns = AddressColumns.from_rows(rows)
+    return max_by_owner(columns.owner_id, address_scores(columns))
+
+
+def timed(label: str, count: int, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:>8.2f}s {elapsed / count * 1_000_000:>8.2f} us/address")
+    return result
+
+
+def main(count: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        database.DB_PATH = Path(workdir) / "owners.db"
+        database.run_migrations()
+        seed(count)
+        with database.get_connection() as conn:
+            rows = conn.execute("SELECT * FROM addresses").fetchall()
+        print(f"{count} addresses")
+        scalar = timed("per-object address_score", count, lambda: per_object(rows))
+        batch = timed("columnar address_scores", count, lambda: columnar(rows))
+        assert scalar == batch, "columnar scores differ from address_score"
+        timed("score_owners (SQL)", count, score_owners)
+        timed("score_owners_columnar", count, score_owners_columnar)
+        database.close_connections()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
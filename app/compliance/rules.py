@@ -7,11 +7,19 @@ def is_suppressed(suppression_map: dict[str, str], owner_id: str) -> bool:
     return owner_id in suppression_map
 
 
+def outreach_window_start(window_days: int) -> datetime:
+    return datetime.utcnow() - timedelta(days=window_days)
+
+
+def under_frequency_cap(recent_attempts: int, max_attempts: int) -> bool:
+    return recent_attempts < max_attempts
+
+
 def should_allow_outreach(
     attempts: list[datetime],
     max_attempts: int,
     window_days: int,
 ) -> bool:
-    window_start = datetime.utcnow() - timedelta(days=window_days)
+    window_start = outreach_window_start(window_days)
     recent_attempts = [attempt for attempt in attempts if attempt >= window_start]
-    return len(recent_attempts) < max_attempts
+    return under_frequency_cap(len(recent_attempts), max_attempts)
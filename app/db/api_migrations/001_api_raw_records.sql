@@ -0,0 +1,6 @@
+CREATE TABLE IF NOT EXISTS api_raw_records (
+    id TEXT PRIMARY KEY,
+    owner_name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
@@ -0,0 +1,26 @@
+CREATE TABLE IF NOT EXISTS api_owners (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    owner_key TEXT NOT NULL UNIQUE,
+    owner_name TEXT NOT NULL,
+    mailing_address TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS api_owner_records (
+    record_id TEXT PRIMARY KEY,
+    owner_id TEXT NOT NULL,
+    FOREIGN KEY(record_id) REFERENCES api_raw_records(id),
+    FOREIGN KEY(owner_id) REFERENCES api_owners(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_api_owner_records_owner
+    ON api_owner_records (owner_id);
+
+CREATE TABLE IF NOT EXISTS api_owner_attributes (
+    owner_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (owner_id, kind, value),
+    FOREIGN KEY(owner_id) REFERENCES api_owners(id)
+) WITHOUT ROWID;
@@ -0,0 +1,6 @@
+-- How far the upload API's dedupe fold has read api_raw_records.
+CREATE TABLE IF NOT EXISTS pipeline_watermarks (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+);
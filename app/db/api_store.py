@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from app.db.database import get_connection, get_watermark, run_migrations, set_watermark
+
+# Kept apart from the pipeline's owners.db, which a rebuild deletes.
+DB_PATH = Path("app/db/api.db")
+MIGRATIONS_DIR = Path("app/db/api_migrations")
+DEDUPE_WATERMARK = "api_dedupe"
+FOLD_BATCH_SIZE = 1000
+
+
+@dataclass
+class FoldResult:
+    records_folded: int
+    owners_created: int
+    duplicates_collapsed: int
+
+
+def migrate() -> None:
+    run_migrations(DB_PATH, MIGRATIONS_DIR)
+
+
+class SQLiteOwnerStore:
+    """Raw records and canonical owners for the upload API, kept in SQLite.
+
+    Every gunicorn worker sees the same data, and owners are looked up by
+    their unique dedupe key so each fold only touches newly ingested records.
+    The data lives in its own file (``DB_PATH``), so pipeline rebuilds leave
+    it alone.
+    """
+
+    def add_raw_records(self, records: Iterable[dict[str, Any]]) -> None:
+        created_at = datetime.utcnow().isoformat()
+        with get_connection(DB_PATH) as conn:
+            conn.executemany(
+                "INSERT INTO api_raw_records (id, owner_name, data, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                [
+                    (record["_record_id"], record["owner_name"], json.dumps(record), created_at)
+                    for record in records
+                ],
+            )
+
+    def count_raw_records(self) -> int:
+        return self._count("api_raw_records")
+
+    def count_owners(self) -> int:
+        return self._count("api_owners")
+
+    def _count(self, table: str) -> int:
+        with get_connection(DB_PATH) as conn:
+            return conn.execute(f"SELECT COUNT(*) AS count FROM {table}").fetchone()["count"]
+
+    def fold_new_records(self, make_key: Callable[[dict[str, Any]], str]) -> FoldResult:
+        result = FoldResult(records_folded=0, owners_created=0, duplicates_collapsed=0)
+        with get_connection(DB_PATH) as conn:
+            # Take the write lock before reading the watermark so two workers
+            # can never fold the same records.
+            conn.execute("BEGIN IMMEDIATE")
+            watermark = get_watermark(conn, DEDUPE_WATERMARK)
+            while True:
+                rows = conn.execute(
+                    "SELECT rowid, id, data FROM api_raw_records"
+                    " WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (watermark, FOLD_BATCH_SIZE),
+                ).fetchall()
+                if not rows:
+                    break
+                watermark = rows[-1]["rowid"]
+                for row in rows:
+                    self._fold_record(conn, json.loads(row["data"]), make_key, result)
+            set_watermark(conn, DEDUPE_WATERMARK, watermark)
+        return result
+
+    def _fold_record(
+        self,
+        conn,
+        record: dict[str, Any],
+        make_key: Callable[[dict[str, Any]], str],
+        result: FoldResult,
+    ) -> None:
+        result.records_folded += 1
+        key = make_key(record)
+        if not key:
+            return
+        existing = conn.execute(
+            "SELECT id FROM api_owners WHERE owner_key = ?", (key,)
+        ).fetchone()
+        if existing is None:
+            owner_id = str(uuid.uuid4())
+            conn.execute(
+                "INSERT INTO api_owners (id, owner_key, owner_name, mailing_address, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    owner_id,
+                    key,
+                    record.get("owner_name", ""),
+                    record.get("mailing_address", ""),
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+            result.owners_created += 1
+        else:
+            owner_id = existing["id"]
+            result.duplicates_collapsed += 1
+        conn.execute(
+            "INSERT OR IGNORE INTO api_owner_records (record_id, owner_id) VALUES (?, ?)",
+            (record["_record_id"], owner_id),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO api_owner_attributes (owner_id, kind, value)"
+            " VALUES (?, ?, ?)",
+            [
+                (owner_id, kind, record[field])
+                for kind, field in (("counties", "county"), ("sources", "source"))
+                if record.get(field)
+            ],
+        )
+
+    def list_owners(
+        self, limit: int, cursor: int | None = None
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        with get_connection(DB_PATH) as conn:
+            rows = conn.execute(
+                "SELECT seq, id, owner_name, mailing_address FROM api_owners"
+                " WHERE seq > ? ORDER BY seq LIMIT ?",
+                (cursor or 0, limit),
+            ).fetchall()
+            if not rows:
+                return [], None
+            owners = {
+                row["id"]: {
+                    "owner_id": row["id"],
+                    "owner_name": row["owner_name"],
+                    "mailing_address": row["mailing_address"],
+                    "counties": [],
+                    "sources": [],
+                    "records": [],
+                }
+                for row in rows
+            }
+            placeholders = ", ".join("?" for _ in owners)
+            for attribute in conn.execute(
+                "SELECT owner_id, kind, value FROM api_owner_attributes"
+                f" WHERE owner_id IN ({placeholders}) ORDER BY owner_id, kind, value",
+                list(owners),
+            ):
+                owners[attribute["owner_id"]][attribute["kind"]].append(attribute["value"])
+            for record in conn.execute(
+                "SELECT owner_id, record_id FROM api_owner_records"
+                f" WHERE owner_id IN ({placeholders}) ORDER BY rowid",
+                list(owners),
+            ):
+                owners[record["owner_id"]]["records"].append(record["record_id"])
+        next_cursor = rows[-1]["seq"] if len(rows) == limit else None
+        return list(owners.values()), next_cursor
+
+    def reset(self) -> None:
+        with get_connection(DB_PATH) as conn:
+            for table in (
+                "api_owner_attributes",
+                "api_owner_records",
+                "api_owners",
+                "api_raw_records",
+            ):
+                conn.execute(f"DELETE FROM {table}")
+            conn.execute("DELETE FROM pipeline_watermarks WHERE name = ?", (DEDUPE_WATERMARK,))
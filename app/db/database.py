@@ -1,33 +1,224 @@
 from __future__ import annotations
 
+import fcntl
+import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 DB_PATH = Path("app/db/owners.db")
 MIGRATIONS_DIR = Path("app/db/migrations")
 
+POOL_SIZE = 8
+BUSY_TIMEOUT_SECONDS = 30.0
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+    "temp_store": "MEMORY",
+    # INSERT OR REPLACE only fires DELETE triggers for the rows it replaces
+    # when this is on; the dashboard counter triggers depend on it.
+    "recursive_triggers": "ON",
+}
 
-def get_connection() -> sqlite3.Connection:
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
 
+class ConnectionPool:
+    """Reusable connections to one SQLite file.
 
-def initialize_db() -> None:
-    with get_connection() as conn:
+    Connections are created with ``check_same_thread=False`` and handed to one
+    thread at a time. WAL mode lets readers run while a pipeline stage holds
+    the write lock, and the busy timeout makes concurrent writers wait instead
+    of failing with "database is locked".
+
+    Each connection remembers which file it opened. If the path has since been
+    replaced (a rebuild in this or another process), the connection is closed
+    instead of being handed out or returned to the pool.
+    """
+
+    def __init__(self, path: Path, size: int = POOL_SIZE) -> None:
+        self.path = path
+        self.size = size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._files: dict[sqlite3.Connection, tuple[int, int] | None] = {}
+
+    def _file_identity(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        self._files.pop(conn, None)
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in PRAGMAS.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        self._files[conn] = self._file_identity()
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        current = self._file_identity()
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            if self._files.get(conn) == current:
+                return conn
+            self._discard(conn)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        if (
+            self._idle.qsize() < self.size
+            and self._files.get(conn) == self._file_identity()
+        ):
+            self._idle.put(conn)
+        else:
+            self._discard(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+@dataclass
+class QueryCounters:
+    """SQL activity seen on pooled connections while ``count_queries`` is active."""
+
+    statements: int = 0
+    rows_read: int = 0
+    rows_written: int = 0
+    # Stages may share one set of counters across worker threads.
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def _on_statement(self, statement: str) -> None:
+        with self._lock:
+            self.statements += 1
+
+    def _row_factory(self, cursor: sqlite3.Cursor, row: tuple) -> sqlite3.Row:
+        with self._lock:
+            self.rows_read += 1
+        return sqlite3.Row(cursor, row)
+
+    def attach(self, conn: sqlite3.Connection) -> int:
+        conn.set_trace_callback(self._on_statement)
+        conn.row_factory = self._row_factory
+        return conn.total_changes
+
+    def detach(self, conn: sqlite3.Connection, changes_before: int) -> None:
+        with self._lock:
+            self.rows_written += conn.total_changes - changes_before
+        conn.set_trace_callback(None)
+        conn.row_factory = sqlite3.Row
+
+
+_query_counters: ContextVar[QueryCounters | None] = ContextVar(
+    "query_counters", default=None
+)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounters]:
+    counters = QueryCounters()
+    token = _query_counters.set(counters)
+    try:
+        yield counters
+    finally:
+        _query_counters.reset(token)
+
+
+_pools: dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(path: Path | None = None) -> ConnectionPool:
+    path = path or DB_PATH
+    with _pools_lock:
+        pool = _pools.get(path)
+        if pool is None:
+            pool = _pools[path] = ConnectionPool(path)
+        return pool
+
+
+@contextmanager
+def get_connection(path: Path | None = None) -> Iterator[sqlite3.Connection]:
+    pool = get_pool(path)
+    conn = pool.acquire()
+    counters = _query_counters.get()
+    if counters is not None:
+        changes_before = counters.attach(conn)
+    try:
+        with conn:
+            yield conn
+    finally:
+        if counters is not None:
+            counters.detach(conn, changes_before)
+        pool.release(conn)
+
+
+def close_connections() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def drop_database() -> None:
+    close_connections()
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{DB_PATH}{suffix}").unlink(missing_ok=True)
+
+
+def initialize_db(path: Path | None = None) -> None:
+    with get_connection(path) as conn:
         conn.execute(
             "CREATE TABLE IF NOT EXISTS schema_migrations (id TEXT PRIMARY KEY)"
         )
 
 
-def run_migrations() -> None:
-    initialize_db()
-    with get_connection() as conn:
+@contextmanager
+def migration_lock() -> Iterator[None]:
+    # Serializes migrations across gunicorn workers that start at the same time.
+    lock_path = DB_PATH.parent / "migrations.lock"
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("w") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        yield
+
+
+def run_migrations(path: Path | None = None, migrations_dir: Path | None = None) -> None:
+    """Apply pending migrations, by default the pipeline's to ``DB_PATH``."""
+    with migration_lock():
+        _apply_migrations(path, migrations_dir or MIGRATIONS_DIR)
+
+
+def _apply_migrations(path: Path | None, migrations_dir: Path) -> None:
+    initialize_db(path)
+    with get_connection(path) as conn:
         applied = {
             row["id"] for row in conn.execute("SELECT id FROM schema_migrations")
         }
-        migrations = sorted(MIGRATIONS_DIR.glob("*.sql"))
+        migrations = sorted(migrations_dir.glob("*.sql"))
         for migration in migrations:
             if migration.name in applied:
                 continue
@@ -36,3 +227,31 @@ def run_migrations() -> None:
                 "INSERT INTO schema_migrations (id) VALUES (?)", (migration.name,)
             )
         conn.commit()
+
+
+def get_watermark(conn: sqlite3.Connection, name: str) -> int:
+    row = conn.execute(
+        "SELECT position FROM pipeline_watermarks WHERE name = ?", (name,)
+    ).fetchone()
+    return row["position"] if row else 0
+
+
+def set_watermark(conn: sqlite3.Connection, name: str, position: int) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO pipeline_watermarks (name, position, updated_at)"
+        " VALUES (?, ?, ?)",
+        (name, position, datetime.utcnow().isoformat()),
+    )
+
+
+def bump_counter(
+    conn: sqlite3.Connection, metric: str, delta: int, bucket: float = 0
+) -> None:
+    """Adjust a dashboard counter for writes that no trigger maintains."""
+    conn.execute(
+        "INSERT INTO dashboard_counters (metric, bucket, count, updated_at)"
+        " VALUES (?, ?, ?, ?)"
+        " ON CONFLICT (metric, bucket) DO UPDATE SET"
+        " count = count + excluded.count, updated_at = excluded.updated_at",
+        (metric, bucket, delta, datetime.utcnow().isoformat()),
+    )
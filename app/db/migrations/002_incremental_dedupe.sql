@@ -0,0 +1,13 @@
+CREATE TABLE IF NOT EXISTS source_record_owners (
+    source_record_id TEXT PRIMARY KEY,
+    owner_id TEXT NOT NULL,
+    resolved_at TEXT NOT NULL,
+    FOREIGN KEY(source_record_id) REFERENCES source_records(id),
+    FOREIGN KEY(owner_id) REFERENCES owners(id)
+);
+
+CREATE TABLE IF NOT EXISTS pipeline_watermarks (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+);
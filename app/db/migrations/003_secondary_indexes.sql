@@ -0,0 +1,29 @@
+CREATE INDEX IF NOT EXISTS idx_addresses_owner
+    ON addresses (owner_id, confidence, is_deliverable);
+
+CREATE INDEX IF NOT EXISTS idx_addresses_deliverable
+    ON addresses (is_deliverable, confidence);
+
+CREATE INDEX IF NOT EXISTS idx_contacts_owner
+    ON contacts (owner_id);
+
+CREATE INDEX IF NOT EXISTS idx_contacts_type
+    ON contacts (contact_type, phone_type, confidence);
+
+CREATE INDEX IF NOT EXISTS idx_contact_attempts_owner
+    ON contact_attempts (owner_id, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_outreach_queue_owner
+    ON outreach_queue (owner_id, status);
+
+CREATE INDEX IF NOT EXISTS idx_outreach_queue_status
+    ON outreach_queue (status, scheduled_for);
+
+CREATE INDEX IF NOT EXISTS idx_inbound_messages_owner
+    ON inbound_messages (owner_id, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_hot_leads_created
+    ON hot_leads (created_at);
+
+CREATE INDEX IF NOT EXISTS idx_source_record_owners_owner
+    ON source_record_owners (owner_id);
@@ -0,0 +1,3 @@
+ALTER TABLE addresses ADD COLUMN update_version TEXT;
+
+ALTER TABLE addresses ADD COLUMN standardize_version TEXT;
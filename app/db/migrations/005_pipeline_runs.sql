@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS pipeline_runs (
+    id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    report TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_runs_started
+    ON pipeline_runs (started_at);
@@ -0,0 +1,22 @@
+ALTER TABLE pipeline_runs ADD COLUMN stages TEXT NOT NULL DEFAULT '[]';
+
+CREATE TABLE IF NOT EXISTS pipeline_stage_runs (
+    run_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    error TEXT,
+    PRIMARY KEY (run_id, stage),
+    FOREIGN KEY(run_id) REFERENCES pipeline_runs(id)
+);
+
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    modified_ns INTEGER NOT NULL,
+    rows INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (path, size, modified_ns)
+);
@@ -0,0 +1,12 @@
+CREATE TABLE IF NOT EXISTS pipeline_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    submitted_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    current_stage TEXT,
+    completed_stages INTEGER NOT NULL DEFAULT 0,
+    total_stages INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    report TEXT
+);
@@ -0,0 +1,7 @@
+CREATE INDEX IF NOT EXISTS idx_owners_score
+    ON owners (score, id);
+
+DROP INDEX IF EXISTS idx_hot_leads_created;
+
+CREATE INDEX IF NOT EXISTS idx_hot_leads_created
+    ON hot_leads (created_at, owner_id);
@@ -0,0 +1,217 @@
+CREATE TABLE IF NOT EXISTS dashboard_counters (
+    metric TEXT NOT NULL,
+    bucket REAL NOT NULL,
+    count INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (metric, bucket)
+) WITHOUT ROWID;
+
+-- source_records is append-only and written in large batches, so ingest
+-- bumps its counter once per batch instead of paying for a per-row trigger.
+
+CREATE TRIGGER IF NOT EXISTS trg_owners_count_insert
+AFTER INSERT ON owners
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'owners', 0, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_owners_count_delete
+AFTER DELETE ON owners
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'owners', 0, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_outreach_queue_count_insert
+AFTER INSERT ON outreach_queue
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'outreach_queue', 0, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_outreach_queue_count_delete
+AFTER DELETE ON outreach_queue
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'outreach_queue', 0, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_addresses_count_insert
+AFTER INSERT ON addresses
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'addresses', 0, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'deliverable_addresses', NEW.confidence, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE NEW.is_deliverable = 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_addresses_count_delete
+AFTER DELETE ON addresses
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'addresses', 0, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'deliverable_addresses', OLD.confidence, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE OLD.is_deliverable = 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_addresses_count_update
+AFTER UPDATE OF confidence, is_deliverable ON addresses
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'deliverable_addresses', OLD.confidence, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE OLD.is_deliverable = 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'deliverable_addresses', NEW.confidence, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE NEW.is_deliverable = 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_contacts_count_insert
+AFTER INSERT ON contacts
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'contacts', 0, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'mobile_contacts', NEW.confidence, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE NEW.contact_type = 'phone' AND NEW.phone_type = 'mobile'
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_contacts_count_delete
+AFTER DELETE ON contacts
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'contacts', 0, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'mobile_contacts', OLD.confidence, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE OLD.contact_type = 'phone' AND OLD.phone_type = 'mobile'
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_contacts_count_update
+AFTER UPDATE OF contact_type, phone_type, confidence ON contacts
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'mobile_contacts', OLD.confidence, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE OLD.contact_type = 'phone' AND OLD.phone_type = 'mobile'
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'mobile_contacts', NEW.confidence, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE NEW.contact_type = 'phone' AND NEW.phone_type = 'mobile'
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_hot_leads_count_insert
+AFTER INSERT ON hot_leads
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'hot_leads_hourly', CAST(strftime('%s', NEW.created_at) AS INTEGER) / 3600, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_hot_leads_count_delete
+AFTER DELETE ON hot_leads
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'hot_leads_hourly', CAST(strftime('%s', OLD.created_at) AS INTEGER) / 3600, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_hot_leads_count_update
+AFTER UPDATE OF created_at ON hot_leads
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'hot_leads_hourly', CAST(strftime('%s', OLD.created_at) AS INTEGER) / 3600, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'hot_leads_hourly', CAST(strftime('%s', NEW.created_at) AS INTEGER) / 3600, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+-- Backfill from rows that existed before the triggers.
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'source_records', 0, COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now') FROM source_records
+WHERE 1
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'owners', 0, COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now') FROM owners
+WHERE 1
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'addresses', 0, COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now') FROM addresses
+WHERE 1
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'contacts', 0, COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now') FROM contacts
+WHERE 1
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'outreach_queue', 0, COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now') FROM outreach_queue
+WHERE 1
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'deliverable_addresses', confidence, COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now') FROM addresses WHERE is_deliverable = 1
+GROUP BY confidence
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'mobile_contacts', confidence, COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now') FROM contacts WHERE contact_type = 'phone' AND phone_type = 'mobile'
+GROUP BY confidence
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'hot_leads_hourly', CAST(strftime('%s', created_at) AS INTEGER) / 3600, COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now') FROM hot_leads
+GROUP BY CAST(strftime('%s', created_at) AS INTEGER) / 3600
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
@@ -0,0 +1,9 @@
+ALTER TABLE inbound_messages ADD COLUMN intent TEXT;
+
+-- Running per-owner totals folded in by hot_lead_router from its watermark.
+CREATE TABLE IF NOT EXISTS owner_message_stats (
+    owner_id TEXT PRIMARY KEY,
+    message_count INTEGER NOT NULL,
+    last_intent TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+) WITHOUT ROWID;
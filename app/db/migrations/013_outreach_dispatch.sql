@@ -0,0 +1,6 @@
+-- Claim bookkeeping for the outbound dispatcher. A row moves
+-- queued -> sending (claimed) -> sent | failed, or -> abandoned when a
+-- claim outlives its timeout and the send outcome is unknown.
+ALTER TABLE outreach_queue ADD COLUMN claim_id TEXT;
+ALTER TABLE outreach_queue ADD COLUMN claimed_at TEXT;
+ALTER TABLE outreach_queue ADD COLUMN provider_message_id TEXT;
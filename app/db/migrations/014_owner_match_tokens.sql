@@ -0,0 +1,10 @@
+-- Persistent blocking postings for the dedupe match index: one row per
+-- (prefix token, token count) an owner name is indexed under. Filled by
+-- dedupe_identity, which indexes owners past the owner_match_tokens
+-- watermark, so existing owners are backfilled on the next run.
+CREATE TABLE IF NOT EXISTS owner_match_tokens (
+    token TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    owner_rowid INTEGER NOT NULL,
+    PRIMARY KEY (token, size, owner_rowid)
+) WITHOUT ROWID;
@@ -0,0 +1,20 @@
+-- Track each source file once by path, with a digest of the rows ingested so
+-- far, so a file that only gained rows resumes after its ingested prefix.
+-- Rows carried over from 006 have no digest; their prefix is trusted.
+CREATE TABLE ingested_files_by_path (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    modified_ns INTEGER NOT NULL,
+    rows INTEGER NOT NULL,
+    prefix_sha256 TEXT,
+    completed INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+INSERT INTO ingested_files_by_path (path, size, modified_ns, rows, completed, updated_at)
+SELECT path, size, modified_ns, MAX(rows), completed, updated_at
+FROM ingested_files
+GROUP BY path;
+
+DROP TABLE ingested_files;
+ALTER TABLE ingested_files_by_path RENAME TO ingested_files;
@@ -0,0 +1,111 @@
+-- Bucket the confidence counters on a fixed 0.001 grid instead of by exact
+-- value, so continuous vendor confidences keep the counter table at no more
+-- than 1001 rows per metric. dashboard() counts the cell holding the
+-- configured threshold exactly from the base table.
+DELETE FROM dashboard_counters WHERE metric IN ('deliverable_addresses', 'mobile_contacts');
+
+DROP TRIGGER IF EXISTS trg_addresses_count_insert;
+CREATE TRIGGER trg_addresses_count_insert
+AFTER INSERT ON addresses
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'addresses', 0, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'deliverable_addresses', CAST(NEW.confidence * 1000 AS INTEGER), 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE NEW.is_deliverable = 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+DROP TRIGGER IF EXISTS trg_addresses_count_delete;
+CREATE TRIGGER trg_addresses_count_delete
+AFTER DELETE ON addresses
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'addresses', 0, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'deliverable_addresses', CAST(OLD.confidence * 1000 AS INTEGER), -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE OLD.is_deliverable = 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+DROP TRIGGER IF EXISTS trg_addresses_count_update;
+CREATE TRIGGER trg_addresses_count_update
+AFTER UPDATE OF confidence, is_deliverable ON addresses
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'deliverable_addresses', CAST(OLD.confidence * 1000 AS INTEGER), -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE OLD.is_deliverable = 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'deliverable_addresses', CAST(NEW.confidence * 1000 AS INTEGER), 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE NEW.is_deliverable = 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+DROP TRIGGER IF EXISTS trg_contacts_count_insert;
+CREATE TRIGGER trg_contacts_count_insert
+AFTER INSERT ON contacts
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'contacts', 0, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'mobile_contacts', CAST(NEW.confidence * 1000 AS INTEGER), 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE NEW.contact_type = 'phone' AND NEW.phone_type = 'mobile'
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+DROP TRIGGER IF EXISTS trg_contacts_count_delete;
+CREATE TRIGGER trg_contacts_count_delete
+AFTER DELETE ON contacts
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'contacts', 0, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'mobile_contacts', CAST(OLD.confidence * 1000 AS INTEGER), -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE OLD.contact_type = 'phone' AND OLD.phone_type = 'mobile'
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+DROP TRIGGER IF EXISTS trg_contacts_count_update;
+CREATE TRIGGER trg_contacts_count_update
+AFTER UPDATE OF contact_type, phone_type, confidence ON contacts
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'mobile_contacts', CAST(OLD.confidence * 1000 AS INTEGER), -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE OLD.contact_type = 'phone' AND OLD.phone_type = 'mobile'
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'mobile_contacts', CAST(NEW.confidence * 1000 AS INTEGER), 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE NEW.contact_type = 'phone' AND NEW.phone_type = 'mobile'
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'deliverable_addresses', CAST(confidence * 1000 AS INTEGER), COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now') FROM addresses WHERE is_deliverable = 1
+GROUP BY CAST(confidence * 1000 AS INTEGER)
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'mobile_contacts', CAST(confidence * 1000 AS INTEGER), COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now') FROM contacts WHERE contact_type = 'phone' AND phone_type = 'mobile'
+GROUP BY CAST(confidence * 1000 AS INTEGER)
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
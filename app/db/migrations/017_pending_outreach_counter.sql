@@ -0,0 +1,45 @@
+-- Dispatch leaves sent, failed and abandoned rows in outreach_queue, so the
+-- dashboard counts only rows still pending (queued or sending). The counter
+-- follows status transitions instead of inserts and deletes.
+DROP TRIGGER IF EXISTS trg_outreach_queue_count_insert;
+DROP TRIGGER IF EXISTS trg_outreach_queue_count_delete;
+DELETE FROM dashboard_counters WHERE metric = 'outreach_queue';
+
+CREATE TRIGGER trg_outreach_pending_count_insert
+AFTER INSERT ON outreach_queue
+WHEN NEW.status IN ('queued', 'sending')
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'outreach_pending', 0, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER trg_outreach_pending_count_delete
+AFTER DELETE ON outreach_queue
+WHEN OLD.status IN ('queued', 'sending')
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'outreach_pending', 0, -1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER trg_outreach_pending_count_update
+AFTER UPDATE OF status ON outreach_queue
+WHEN (NEW.status IN ('queued', 'sending')) != (OLD.status IN ('queued', 'sending'))
+BEGIN
+    INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+    SELECT 'outreach_pending', 0, CASE WHEN NEW.status IN ('queued', 'sending') THEN 1 ELSE -1 END,
+        strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    WHERE 1
+    ON CONFLICT (metric, bucket) DO UPDATE SET
+        count = count + excluded.count, updated_at = excluded.updated_at;
+END;
+
+INSERT INTO dashboard_counters (metric, bucket, count, updated_at)
+SELECT 'outreach_pending', 0, COUNT(*), strftime('%Y-%m-%dT%H:%M:%f', 'now')
+FROM outreach_queue WHERE status IN ('queued', 'sending')
+ON CONFLICT (metric, bucket) DO UPDATE SET count = excluded.count;
@@ -0,0 +1,7 @@
+-- Address stages look up rows whose provider version is missing or differs
+-- from the current one; these keep that lookup off a full table scan.
+CREATE INDEX IF NOT EXISTS idx_addresses_update_version
+    ON addresses (update_version);
+
+CREATE INDEX IF NOT EXISTS idx_addresses_standardize_version
+    ON addresses (standardize_version);
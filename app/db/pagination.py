@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import base64
+import json
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+
+@dataclass(frozen=True)
+class KeysetListing:
+    """A table listed newest/highest first by ``(sort_column, tiebreak_column)``.
+
+    Pages continue strictly after the last row's key, so each page is an index
+    range scan whatever its depth.
+    """
+
+    table: str
+    columns: tuple[str, ...]
+    sort_column: str
+    tiebreak_column: str
+
+    def project(self, fields: list[str] | None) -> list[str]:
+        if not fields:
+            return list(self.columns)
+        unknown = [field for field in fields if field not in self.columns]
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+        return fields
+
+    def rows(
+        self,
+        conn: sqlite3.Connection,
+        fields: list[str],
+        filters: list[tuple[str, Any]],
+        cursor: str | None,
+        limit: int | None,
+    ) -> Iterator[sqlite3.Row]:
+        selected = list(dict.fromkeys([*fields, self.sort_column, self.tiebreak_column]))
+        clauses = [clause for clause, _ in filters]
+        params = [value for _, value in filters]
+        if cursor:
+            clauses.append(f"({self.sort_column}, {self.tiebreak_column}) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+        sql = f"SELECT {', '.join(selected)} FROM {self.table}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {self.sort_column} DESC, {self.tiebreak_column} DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return conn.execute(sql, params)
+
+    def cursor_for(self, row: sqlite3.Row) -> str:
+        return encode_cursor([row[self.sort_column], row[self.tiebreak_column]])
+
+
+def encode_cursor(values: list[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != 2:
+        raise ValueError("Invalid cursor")
+    return values
@@ -1,22 +1,39 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, UploadFile, File
 from fastapi.responses import JSONResponse
 import csv
 import io
 import os
+import time
 import uuid
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+from app.db import api_store
+from app.db.api_store import SQLiteOwnerStore
+from app.db.database import run_migrations
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    run_migrations()
+    api_store.migrate()
+    yield
+
 
 app = FastAPI(
     title="Owner Intelligence API",
     version="1.0.1",
-    description="Minimal working pipeline: ingest CSV -> dedupe -> list canonical owners"
+    description="Minimal working pipeline: ingest CSV -> dedupe -> list canonical owners",
+    lifespan=lifespan,
 )
 
 # -------------------------
-# In-memory storage (for now)
+# Storage
 # -------------------------
-RAW_RECORDS: List[Dict[str, Any]] = []
-OWNERS: Dict[str, Dict[str, Any]] = {}
+# Raw records and canonical owners live in SQLite (api_store.DB_PATH), shared
+# by every worker.
+STORE = SQLiteOwnerStore()
+INGEST_BATCH_SIZE = 1000
 
 def normalize_name(name: str) -> str:
     if not name:
@@ -49,7 +66,7 @@ def health():
     return {"ok": True}
 
 @app.post("/ingest")
-async def ingest(file: UploadFile = File(...)):
+def ingest(file: UploadFile = File(...)):
     """
     Upload a CSV with at least:
       owner_name
@@ -57,102 +74,90 @@ async def ingest(file: UploadFile = File(...)):
       mailing_address
       county
       source
+
+    The upload is decoded and parsed incrementally from the spooled upload
+    file and written to SQLite in batches, so memory use does not grow with
+    the file size.
     """
     if not file.filename.lower().endswith(".csv"):
         return JSONResponse(status_code=400, content={"error": "Please upload a .csv file"})
 
-    content = await file.read()
+    started = time.perf_counter()
+    text = io.TextIOWrapper(file.file, encoding="utf-8", errors="ignore", newline="")
     try:
-        text = content.decode("utf-8", errors="ignore")
-    except Exception:
-        return JSONResponse(status_code=400, content={"error": "Could not decode file as utf-8"})
-
-    reader = csv.DictReader(io.StringIO(text))
-    if not reader.fieldnames:
-        return JSONResponse(status_code=400, content={"error": "CSV appears empty or has no headers"})
-
-    count = 0
-    for row in reader:
-        # Clean keys to lowercase
-        cleaned = { (k or "").strip().lower(): (v or "").strip() for k, v in row.items() }
-
-        # Force required column
-        if not cleaned.get("owner_name"):
-            continue
-
-        # Store raw record with an id
-        cleaned["_record_id"] = str(uuid.uuid4())
-        RAW_RECORDS.append(cleaned)
-        count += 1
-
+        reader = csv.DictReader(text)
+        if not reader.fieldnames:
+            return JSONResponse(status_code=400, content={"error": "CSV appears empty or has no headers"})
+
+        count = 0
+        batch: List[Dict[str, Any]] = []
+        for row in reader:
+            # Clean keys to lowercase
+            cleaned = { (k or "").strip().lower(): (v or "").strip() for k, v in row.items() }
+
+            # Force required column
+            if not cleaned.get("owner_name"):
+                continue
+
+            # Store raw record with an id
+            cleaned["_record_id"] = str(uuid.uuid4())
+            batch.append(cleaned)
+            if len(batch) >= INGEST_BATCH_SIZE:
+                STORE.add_raw_records(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            STORE.add_raw_records(batch)
+            count += len(batch)
+        total = STORE.count_raw_records()
+        bytes_read = file.file.tell()
+    finally:
+        # Leave closing the upload to FastAPI.
+        text.detach()
+
+    seconds = time.perf_counter() - started
     return {
         "status": "ok",
         "ingested": count,
-        "total_raw_records": len(RAW_RECORDS),
-        "expected_headers": ["owner_name", "mailing_address", "county", "source"]
+        "total_raw_records": total,
+        "expected_headers": ["owner_name", "mailing_address", "county", "source"],
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(count / seconds, 1) if seconds else None,
+        "megabytes_per_second": round(bytes_read / 1_000_000 / seconds, 2) if seconds else None,
     }
 
 @app.post("/dedupe/run")
 def run_dedupe():
     """
-    Collapses RAW_RECORDS into canonical OWNERS using make_owner_key().
+    Folds raw records ingested since the last run into canonical owners,
+    matched on make_owner_key().
     """
-    global OWNERS
-    OWNERS = {}
-
-    duplicates_collapsed = 0
-
-    for r in RAW_RECORDS:
-        key = make_owner_key(r)
-        if not key:
-            continue
-
-        if key not in OWNERS:
-            owner_id = str(uuid.uuid4())
-            OWNERS[key] = {
-                "owner_id": owner_id,
-                "owner_name": r.get("owner_name", ""),
-                "mailing_address": r.get("mailing_address", ""),
-                "counties": set([r.get("county", "")]) if r.get("county") else set(),
-                "sources": set([r.get("source", "")]) if r.get("source") else set(),
-                "records": [r["_record_id"]],
-            }
-        else:
-            duplicates_collapsed += 1
-            OWNERS[key]["records"].append(r["_record_id"])
-            if r.get("county"):
-                OWNERS[key]["counties"].add(r.get("county"))
-            if r.get("source"):
-                OWNERS[key]["sources"].add(r.get("source"))
-
-    # Convert sets to lists for JSON
-    for k in list(OWNERS.keys()):
-        OWNERS[k]["counties"] = sorted([c for c in OWNERS[k]["counties"] if c])
-        OWNERS[k]["sources"] = sorted([s for s in OWNERS[k]["sources"] if s])
-
+    result = STORE.fold_new_records(make_owner_key)
     return {
         "status": "ok",
-        "raw_records": len(RAW_RECORDS),
-        "canonical_owners": len(OWNERS),
-        "duplicates_collapsed": duplicates_collapsed
+        "raw_records": STORE.count_raw_records(),
+        "records_folded": result.records_folded,
+        "canonical_owners": STORE.count_owners(),
+        "duplicates_collapsed": result.duplicates_collapsed
     }
 
 @app.get("/owners")
-def list_owners(limit: int = 50):
+def list_owners(limit: int = 50, cursor: Optional[int] = None):
     """
-    Lists canonical owners after /dedupe/run.
+    Lists canonical owners after /dedupe/run, one page at a time.
+    Pass the returned next_cursor to fetch the following page.
     """
-    items = list(OWNERS.values())[: max(1, min(limit, 500))]
+    items, next_cursor = STORE.list_owners(max(1, min(limit, 500)), cursor)
     return {
         "count": len(items),
-        "owners": items
+        "owners": items,
+        "next_cursor": next_cursor
     }
 
 @app.post("/reset")
 def reset_all():
     """
-    Clears in-memory records (useful for testing).
+    Clears stored records and owners (useful for testing).
     """
-    RAW_RECORDS.clear()
-    OWNERS.clear()
+    STORE.reset()
     return {"status": "ok", "message": "cleared"}
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.models.schemas import Address
+
+
+@dataclass(slots=True)
+class AddressRecord:
+    """Unvalidated address row for pipeline hot paths.
+
+    Mirrors ``Address`` but keeps ``updated_at`` as the stored ISO string.
+    Convert with ``to_address`` wherever data crosses into code that expects
+    the validated model.
+    """
+
+    id: str
+    owner_id: str
+    line1: str
+    city: str
+    state: str
+    postal_code: str
+    confidence: float
+    is_deliverable: bool
+    updated_at: str
+
+    @classmethod
+    def from_row(cls, row) -> AddressRecord:
+        return cls(
+            row["id"],
+            row["owner_id"],
+            row["line1"],
+            row["city"],
+            row["state"],
+            row["postal_code"],
+            row["confidence"],
+            bool(row["is_deliverable"]),
+            row["updated_at"],
+        )
+
+    @classmethod
+    def from_address(cls, address: Address) -> AddressRecord:
+        return cls(
+            address.id,
+            address.owner_id,
+            address.line1,
+            address.city,
+            address.state,
+            address.postal_code,
+            address.confidence,
+            address.is_deliverable,
+            address.updated_at.isoformat(),
+        )
+
+    def to_address(self) -> Address:
+        return Address(
+            id=self.id,
+            owner_id=self.owner_id,
+            line1=self.line1,
+            city=self.city,
+            state=self.state,
+            postal_code=self.postal_code,
+            confidence=self.confidence,
+            is_deliverable=self.is_deliverable,
+            updated_at=datetime.fromisoformat(self.updated_at),
+        )
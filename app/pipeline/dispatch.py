@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Union
+
+from app.adapters.base import EmailClient, RinglessVoicemailClient, SMSClient
+from app.adapters.batching import RateLimiter
+from app.db.database import get_connection
+
+logger = logging.getLogger(__name__)
+
+OutboundClient = Union[SMSClient, EmailClient, RinglessVoicemailClient]
+
+OUTREACH_MESSAGE = (
+    "Hi, we're reaching out about your mineral interests and would be glad to "
+    "make an offer. Reply STOP to opt out."
+)
+# Which payload field each channel sends to.
+CHANNEL_TARGETS = {"sms": "phone", "ringless_voicemail": "phone", "email": "email"}
+
+
+@dataclass(frozen=True)
+class ChannelLimits:
+    concurrency: int = 4
+    per_second: float | None = None
+
+
+DEFAULT_CHANNEL_LIMITS = {
+    "sms": ChannelLimits(concurrency=8, per_second=20),
+    "email": ChannelLimits(concurrency=8, per_second=50),
+    "ringless_voicemail": ChannelLimits(concurrency=4, per_second=5),
+}
+
+
+@dataclass
+class DispatchStats:
+    claimed: int = 0
+    sent: int = 0
+    failed: int = 0
+    abandoned: int = 0
+    seconds: float = 0.0
+
+    @property
+    def sends_per_second(self) -> float:
+        return self.sent / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class SendResult:
+    queue_id: str
+    owner_id: str
+    channel: str
+    provider_message_id: str | None = None
+    error: str | None = None
+
+
+def abandon_stale_claims(timeout_minutes: int) -> int:
+    """Close out rows left ``sending`` by a worker that never recorded them.
+
+    The provider may or may not have accepted the message, so the row is
+    never sent again; it is logged as an unconfirmed attempt so it still
+    counts against the owner's frequency cap.
+    """
+    cutoff = (datetime.utcnow() - timedelta(minutes=timeout_minutes)).isoformat()
+    now = datetime.utcnow().isoformat()
+    with get_connection() as conn:
+        stale = conn.execute(
+            "UPDATE outreach_queue SET status = 'abandoned'"
+            " WHERE status = 'sending' AND claimed_at < ?"
+            " RETURNING owner_id, channel",
+            (cutoff,),
+        ).fetchall()
+        conn.executemany(
+            "INSERT INTO contact_attempts (id, owner_id, channel, status, created_at)"
+            " VALUES (?, ?, ?, 'unconfirmed', ?)",
+            [
+                (f"attempt-{uuid.uuid4()}", row["owner_id"], row["channel"], now)
+                for row in stale
+            ],
+        )
+        conn.commit()
+    return len(stale)
+
+
+def claim_due(channels: list[str], limit: int) -> tuple[str, list]:
+    """Mark up to ``limit`` due rows as ``sending`` and return them.
+
+    The claim is committed before anything is sent, so a row is only ever
+    handed to one worker.
+    """
+    claim_id = f"claim-{uuid.uuid4()}"
+    now = datetime.utcnow().isoformat()
+    placeholders = ", ".join("?" for _ in channels)
+    with get_connection() as conn:
+        rows = conn.execute(
+            f"""
+            UPDATE outreach_queue SET status = 'sending', claim_id = ?, claimed_at = ?
+            WHERE id IN (
+                SELECT q.id FROM outreach_queue q
+                WHERE q.status = 'queued' AND q.scheduled_for <= ?
+                  AND q.channel IN ({placeholders})
+                  AND NOT EXISTS (SELECT 1 FROM suppression s WHERE s.owner_id = q.owner_id)
+                ORDER BY q.scheduled_for
+                LIMIT ?
+            )
+            RETURNING id, owner_id, channel, payload
+            """,
+            (claim_id, now, now, *channels, limit),
+        ).fetchall()
+        conn.commit()
+    return claim_id, rows
+
+
+def send_one(
+    client: OutboundClient, limiter: RateLimiter | None, row, message: str
+) -> SendResult:
+    result = SendResult(queue_id=row["id"], owner_id=row["owner_id"], channel=row["channel"])
+    target = json.loads(row["payload"]).get(CHANNEL_TARGETS[row["channel"]])
+    if not target:
+        result.error = "missing target"
+        return result
+    if limiter is not None:
+        limiter.wait()
+    try:
+        result.provider_message_id = client.send(row["owner_id"], target, message)
+    except Exception as exc:
+        result.error = str(exc) or type(exc).__name__
+    return result
+
+
+def record_results(claim_id: str, results: list[SendResult]) -> None:
+    now = datetime.utcnow().isoformat()
+    with get_connection() as conn:
+        conn.executemany(
+            "UPDATE outreach_queue SET status = ?, provider_message_id = ?"
+            " WHERE id = ? AND claim_id = ?",
+            [
+                ("failed" if r.error else "sent", r.provider_message_id, r.queue_id, claim_id)
+                for r in results
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO contact_attempts (id, owner_id, channel, status, created_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    f"attempt-{uuid.uuid4()}",
+                    r.owner_id,
+                    r.channel,
+                    f"failed:{r.error}" if r.error else f"sent:{r.provider_message_id}",
+                    now,
+                )
+                for r in results
+            ],
+        )
+        conn.commit()
+
+
+def dispatch_channel(
+    channel: str,
+    client: OutboundClient,
+    limits: ChannelLimits,
+    batch_size: int,
+    message: str,
+) -> DispatchStats:
+    stats = DispatchStats()
+    limiter = RateLimiter(limits.per_second) if limits.per_second else None
+    with ThreadPoolExecutor(max_workers=max(1, limits.concurrency)) as executor:
+        while True:
+            claim_id, rows = claim_due([channel], batch_size)
+            if not rows:
+                break
+            futures: list[Future[SendResult]] = [
+                executor.submit(send_one, client, limiter, row, message) for row in rows
+            ]
+            results = [future.result() for future in futures]
+            record_results(claim_id, results)
+            stats.claimed += len(rows)
+            stats.failed += sum(1 for result in results if result.error)
+            stats.sent += sum(1 for result in results if not result.error)
+    return stats
+
+
+def dispatch_outreach(
+    clients: dict[str, OutboundClient],
+    limits: dict[str, ChannelLimits] | None = None,
+    batch_size: int = 500,
+    claim_timeout_minutes: int = 15,
+    message: str = OUTREACH_MESSAGE,
+) -> DispatchStats:
+    """Send every due queue row through the client for its channel.
+
+    Channels are dispatched side by side, each with a thread pool sized to
+    its concurrency cap and its own rate limiter, so a slow channel does not
+    hold up the others.
+    """
+    limits = {**DEFAULT_CHANNEL_LIMITS, **(limits or {})}
+    started = time.perf_counter()
+    stats = DispatchStats(abandoned=abandon_stale_claims(claim_timeout_minutes))
+    with ThreadPoolExecutor(max_workers=max(1, len(clients))) as executor:
+        # Each channel runs in a copy of this context, so the stage's query
+        # counters see its claims and results.
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                dispatch_channel,
+                channel,
+                client,
+                limits.get(channel, ChannelLimits()),
+                batch_size,
+                message,
+            )
+            for channel, client in clients.items()
+        ]
+        for future in futures:
+            channel_stats = future.result()
+            stats.claimed += channel_stats.claimed
+            stats.sent += channel_stats.sent
+            stats.failed += channel_stats.failed
+    stats.seconds = time.perf_counter() - started
+    logger.info(
+        "dispatch_outreach: %d sent, %d failed, %d abandoned (%.0f sends/s)",
+        stats.sent,
+        stats.failed,
+        stats.abandoned,
+        stats.sends_per_second,
+    )
+    return stats
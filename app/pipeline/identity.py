@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import heapq
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+from app.scoring.dedupe import MatchKey, OwnerMatchIndex, frozen_gc, match_key
+
+Resolved = tuple[list[tuple], list[tuple], list[tuple]]
+Partition = tuple[list[tuple[str, str]], list[Mapping[str, Any]]]
+
+# A strategy maps a name to the keys it must share a partition under; names
+# with a key in common (directly or through other names) land together.
+# Matching compares names only, so a strategy must give any two names that
+# could match a common key, or the parallel run would diverge from serial.
+PARTITION_STRATEGIES: dict[str, Callable[[OwnerMatchIndex, MatchKey], Iterable[str]]] = {
+    "blocking_token": OwnerMatchIndex.blocking_tokens,
+}
+
+
+def resolve_owners(index: OwnerMatchIndex, records: Sequence[Mapping[str, Any]]) -> Resolved:
+    """Match records in order against ``index``, adding an owner for each miss.
+
+    Returns the new owner, address and source-link rows to insert.
+    """
+    owners = []
+    addresses = []
+    links = []
+    for record in records:
+        name = record["owner_name"]
+        key = match_key(name)
+        owner_id = index.match(key)
+        if owner_id is None:
+            owner_id = f"own-{uuid.uuid4()}"
+            index.add(key, owner_id)
+            owners.append((owner_id, name, datetime.utcnow().isoformat(), 0.0))
+        addresses.append(
+            (
+                f"addr-{uuid.uuid4()}",
+                owner_id,
+                record["address_line1"],
+                record["city"],
+                record["state"],
+                record["postal_code"],
+                0.5,
+                1,
+                datetime.utcnow().isoformat(),
+            )
+        )
+        links.append((record["id"], owner_id, datetime.utcnow().isoformat()))
+    return owners, addresses, links
+
+
+def partition_records(
+    owners: Sequence[tuple[str, str]],
+    records: Sequence[Mapping[str, Any]],
+    strategy: str,
+    partitions: int,
+) -> list[Partition]:
+    """Split existing owners and new records into independent partitions.
+
+    Keys from ``strategy`` are unioned into connected groups, so no record
+    can match an owner or record outside its group. Groups are packed into
+    at most ``partitions`` partitions, largest first, and each partition
+    keeps owners and records in their original order. Existing owners in
+    groups without new records are left out.
+    """
+    try:
+        block = PARTITION_STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError(f"Unknown dedupe partition strategy: {strategy}") from None
+
+    index = OwnerMatchIndex()
+    parent: dict[str, str] = {}
+
+    def find(key: str) -> str:
+        parent.setdefault(key, key)
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def union(name: str) -> str:
+        first, *rest = block(index, match_key(name))
+        root = find(first)
+        for key in rest:
+            other = find(key)
+            if other != root:
+                parent[other] = root
+        return first
+
+    owner_keys = [union(name) for _, name in owners]
+    record_keys = [union(record["owner_name"]) for record in records]
+    record_groups = [find(key) for key in record_keys]
+    owner_groups = [find(key) for key in owner_keys]
+
+    sizes: dict[str, int] = {}
+    for group in record_groups:
+        sizes[group] = sizes.get(group, 0) + 1
+    for group in owner_groups:
+        if group in sizes:
+            sizes[group] += 1
+
+    # Dicts keep first-seen order, so ties break on the earliest record.
+    loads = [(0, slot) for slot in range(max(1, min(partitions, len(sizes))))]
+    slots: dict[str, int] = {}
+    for group, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        load, slot = heapq.heappop(loads)
+        slots[group] = slot
+        heapq.heappush(loads, (load + size, slot))
+
+    split: list[Partition] = [([], []) for _ in loads]
+    for owner, group in zip(owners, owner_groups):
+        if group in slots:
+            split[slots[group]][0].append(owner)
+    for record, group in zip(records, record_groups):
+        split[slots[group]][1].append(record)
+    return split
+
+
+def _resolve_partition(owners: list[tuple[str, str]], records: list[Mapping[str, Any]]) -> Resolved:
+    with frozen_gc():
+        index = OwnerMatchIndex()
+        for owner_id, name in owners:
+            index.add(match_key(name), owner_id)
+        return resolve_owners(index, records)
+
+
+def resolve_owners_parallel(
+    owners: Sequence[tuple[str, str]],
+    records: Sequence[dict[str, Any]],
+    workers: int,
+    strategy: str = "blocking_token",
+) -> Resolved:
+    """Resolve records like ``resolve_owners`` across a process pool.
+
+    ``owners`` are the existing ``(id, canonical_name)`` rows in insertion
+    order. Every record lands on the same owner (new or existing) as in the
+    serial run, and the rows come back in the serial order; only the ids
+    generated for new owners differ.
+    """
+    partitions = partition_records(owners, records, strategy, workers)
+    if len(partitions) == 1:
+        return _resolve_partition(*partitions[0])
+    # Spawned rather than forked: dedupe runs on pipeline job threads, and a
+    # fork can copy another thread's held lock (connection pool, logging).
+    with ProcessPoolExecutor(
+        max_workers=len(partitions), mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        results = list(executor.map(_resolve_partition, *zip(*partitions)))
+
+    position = {record["id"]: offset for offset, record in enumerate(records)}
+    created: dict[str, tuple] = {}
+    resolved: list[tuple[tuple, tuple]] = []
+    for new_owners, addresses, links in results:
+        created.update((owner[0], owner) for owner in new_owners)
+        resolved.extend(zip(links, addresses))
+    resolved.sort(key=lambda pair: position[pair[0][0]])
+
+    merged_owners = []
+    for link, _ in resolved:
+        owner = created.pop(link[1], None)
+        if owner is not None:
+            merged_owners.append(owner)
+    return (
+        merged_owners,
+        [address for _, address in resolved],
+        [link for link, _ in resolved],
+    )
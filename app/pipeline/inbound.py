@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable
+
+Handler = Callable[[list[dict[str, str]]], list[Any]]
+
+
+class InboundBatcher:
+    """Coalesces webhook messages arriving within ``window_seconds`` into one
+    call of ``handle``, which runs in a worker thread.
+
+    A batch is flushed early once it reaches ``max_batch_size``. Each caller
+    gets back the handler's result for its own message.
+    """
+
+    def __init__(
+        self,
+        handle: Handler,
+        window_seconds: float = 0.05,
+        max_batch_size: int = 1000,
+    ) -> None:
+        self.handle = handle
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._pending: list[tuple[dict[str, str], asyncio.Future]] = []
+        self._timer: asyncio.Task | None = None
+
+    async def submit(self, message: dict[str, str]) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((message, future))
+        if len(self._pending) >= self.max_batch_size:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            loop.create_task(self._flush(self._take()))
+        elif self._timer is None:
+            self._timer = loop.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.window_seconds)
+        self._timer = None
+        await self._flush(self._take())
+
+    def _take(self) -> list[tuple[dict[str, str], asyncio.Future]]:
+        batch, self._pending = self._pending, []
+        return batch
+
+    async def _flush(self, batch: list[tuple[dict[str, str], asyncio.Future]]) -> None:
+        if not batch:
+            return
+        messages = [message for message, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, self.handle, messages
+            )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
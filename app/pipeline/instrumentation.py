@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Iterator
+
+from app.db.database import count_queries, get_connection
+
+
+@dataclass
+class StageMetrics:
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+    rows_read: int
+    rows_written: int
+    sql_statements: int
+    peak_rss_mb: float
+    error: str | None = None
+
+
+@dataclass
+class RunReport:
+    started_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    finished_at: str | None = None
+    stages: list[StageMetrics] = field(default_factory=list)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Record metrics for the enclosed stage, including one that fails."""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        error = None
+        with count_queries() as counters:
+            try:
+                yield
+            except BaseException as exc:
+                error = str(exc) or type(exc).__name__
+                raise
+            finally:
+                self.stages.append(
+                    StageMetrics(
+                        name=name,
+                        wall_seconds=round(time.perf_counter() - wall_start, 6),
+                        cpu_seconds=round(time.process_time() - cpu_start, 6),
+                        rows_read=counters.rows_read,
+                        rows_written=counters.rows_written,
+                        sql_statements=counters.statements,
+                        peak_rss_mb=peak_rss_mb(),
+                        error=error,
+                    )
+                )
+
+    def finish(self) -> None:
+        self.finished_at = datetime.utcnow().isoformat()
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, payload: str) -> RunReport:
+        data = json.loads(payload)
+        return cls(
+            started_at=data["started_at"],
+            finished_at=data.get("finished_at"),
+            stages=[StageMetrics(**stage) for stage in data.get("stages", [])],
+        )
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is the process high-water mark: kilobytes on Linux, bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def latest_run_report() -> dict | None:
+    with get_connection() as conn:
+        row = conn.execute(
+            "SELECT id, report FROM pipeline_runs ORDER BY started_at DESC LIMIT 1"
+        ).fetchone()
+    if row is None:
+        return None
+    return {"run_id": row["id"], **json.loads(row["report"])}
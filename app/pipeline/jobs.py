@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any
+
+from app.db.database import get_connection, run_migrations
+from app.pipeline.runner import PipelineBusyError, acquire_run_lock, run_pipeline
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineJob:
+    id: str
+    status: str
+    submitted_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    current_stage: str | None = None
+    completed_stages: int = 0
+    total_stages: int = 0
+    error: str | None = None
+    report: dict | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def progress(self) -> dict[str, Any]:
+        percent = (
+            round(100 * self.completed_stages / self.total_stages, 1)
+            if self.total_stages
+            else 0.0
+        )
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "current_stage": self.current_stage,
+            "completed_stages": self.completed_stages,
+            "total_stages": self.total_stages,
+            "percent": percent,
+        }
+
+
+def save_job(job: PipelineJob) -> None:
+    with get_connection() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO pipeline_jobs (
+                id, status, submitted_at, started_at, finished_at, current_stage,
+                completed_stages, total_stages, error, report
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                job.id,
+                job.status,
+                job.submitted_at,
+                job.started_at,
+                job.finished_at,
+                job.current_stage,
+                job.completed_stages,
+                job.total_stages,
+                job.error,
+                json.dumps(job.report) if job.report is not None else None,
+            ),
+        )
+        conn.commit()
+
+
+def get_job(job_id: str) -> PipelineJob | None:
+    with get_connection() as conn:
+        row = conn.execute("SELECT * FROM pipeline_jobs WHERE id = ?", (job_id,)).fetchone()
+    if row is None:
+        return None
+    data = dict(row)
+    data["report"] = json.loads(data["report"]) if data["report"] else None
+    return PipelineJob(**data)
+
+
+class PipelineJobRunner:
+    """Runs pipeline jobs on a background thread, one at a time per database.
+
+    Each job holds the run lock from ``acquire_run_lock`` from submission
+    until it finishes, so a submission fails fast while another job, another
+    gunicorn worker or a CLI run is writing to the same database.
+    """
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline")
+
+    def submit(self, sample_dir: Path, **options: Any) -> PipelineJob:
+        lock = acquire_run_lock()
+        try:
+            run_migrations()
+            job = PipelineJob(
+                id=f"job-{uuid.uuid4()}",
+                status="queued",
+                submitted_at=datetime.utcnow().isoformat(),
+            )
+            save_job(job)
+            self._executor.submit(self._run, job, lock, sample_dir, options)
+        except BaseException:
+            lock.close()
+            raise
+        return job
+
+    def _run(
+        self, job: PipelineJob, lock: IO, sample_dir: Path, options: dict[str, Any]
+    ) -> None:
+        def on_stage(stage: str, completed: int, total: int) -> None:
+            job.current_stage = stage
+            job.completed_stages = completed
+            job.total_stages = total
+            save_job(job)
+
+        try:
+            job.status = "running"
+            job.started_at = datetime.utcnow().isoformat()
+            save_job(job)
+            report = run_pipeline(sample_dir, on_stage=on_stage, run_lock=lock, **options)
+            job.status = "succeeded"
+            job.current_stage = None
+            job.completed_stages = job.total_stages
+            job.report = report.to_dict()
+        except Exception as exc:
+            logger.exception("pipeline job %s failed", job.id)
+            job.status = "failed"
+            job.error = str(exc)
+        finally:
+            job.finished_at = datetime.utcnow().isoformat()
+            try:
+                run_migrations()
+                save_job(job)
+            finally:
+                lock.close()
+
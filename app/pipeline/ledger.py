@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from app.db.database import get_connection
+from app.pipeline.instrumentation import RunReport
+
+
+@dataclass
+class PipelineRun:
+    id: str
+    stages: list[str]
+    report: RunReport = field(default_factory=RunReport)
+    completed: set[str] = field(default_factory=set)
+
+
+def start_run(stages: list[str]) -> PipelineRun:
+    run = PipelineRun(id=f"run-{uuid.uuid4()}", stages=stages)
+    with get_connection() as conn:
+        conn.execute(
+            "INSERT INTO pipeline_runs (id, started_at, finished_at, report, stages)"
+            " VALUES (?, ?, NULL, ?, ?)",
+            (run.id, run.report.started_at, run.report.to_json(), json.dumps(stages)),
+        )
+        conn.commit()
+    return run
+
+
+def find_unfinished_run(stages: list[str]) -> PipelineRun | None:
+    """Return the latest unfinished run over exactly ``stages``, if any.
+
+    Runs over a different stage selection are never resumed, so a failed
+    partial run cannot stand in for a full one.
+    """
+    with get_connection() as conn:
+        row = conn.execute(
+            "SELECT id, stages, report FROM pipeline_runs"
+            " WHERE finished_at IS NULL AND stages = ?"
+            " ORDER BY started_at DESC LIMIT 1",
+            (json.dumps(stages),),
+        ).fetchone()
+        if row is None:
+            return None
+        completed = {
+            stage["stage"]
+            for stage in conn.execute(
+                "SELECT stage FROM pipeline_stage_runs WHERE run_id = ? AND status = 'completed'",
+                (row["id"],),
+            )
+        }
+    return PipelineRun(
+        id=row["id"],
+        stages=json.loads(row["stages"]),
+        report=RunReport.from_json(row["report"]),
+        completed=completed,
+    )
+
+
+def mark_stage(run_id: str, stage: str, status: str, error: str | None = None) -> None:
+    now = datetime.utcnow().isoformat()
+    with get_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO pipeline_stage_runs (run_id, stage, status, started_at, finished_at, error)
+            VALUES (?, ?, ?, ?, NULL, NULL)
+            ON CONFLICT (run_id, stage) DO UPDATE SET
+                status = excluded.status,
+                finished_at = CASE WHEN excluded.status = 'running' THEN NULL ELSE ? END,
+                error = ?
+            """,
+            (run_id, stage, status, now, now, error),
+        )
+        conn.commit()
+
+
+def save_report(run: PipelineRun) -> None:
+    with get_connection() as conn:
+        conn.execute(
+            "UPDATE pipeline_runs SET finished_at = ?, report = ? WHERE id = ?",
+            (run.report.finished_at, run.report.to_json(), run.id),
+        )
+        conn.commit()
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import fcntl
+from dataclasses import dataclass
 from pathlib import Path
+from typing import IO, Callable
 
 from app.adapters.mock import (
     MockAddressStandardizer,
     MockAddressUpdateProvider,
     MockAppendVendorClient,
+    MockEmailClient,
+    MockRinglessVoicemailClient,
+    MockSMSClient,
 )
 from app.ai.inbound_handler import IntentClassifier, ResponseGenerator, SchedulingLink
-from app.db.database import DB_PATH, get_connection, run_migrations
+from app.db import database
+from app.db.database import drop_database, get_connection, run_migrations
+from app.pipeline.dispatch import dispatch_outreach
+from app.pipeline.instrumentation import RunReport
+from app.pipeline.ledger import find_unfinished_run, mark_stage, save_report, start_run
 from app.pipeline.steps import (
     PipelineConfig,
     ai_inbound_handler,
@@ -22,29 +32,219 @@ from app.pipeline.steps import (
     hot_lead_router,
     outreach_queue,
     score_owners,
+    score_owners_columnar,
 )
 
 
-def run_pipeline(sample_dir: Path) -> None:
-    if DB_PATH.exists():
-        DB_PATH.unlink()
-    run_migrations()
-    ingest([sample_dir / "leases.csv", sample_dir / "permits.csv"])
-    dedupe_identity()
-    address_update(MockAddressUpdateProvider())
-    address_standardize(MockAddressStandardizer())
-    score_owners()
-    config = PipelineConfig()
-    payload = export_for_append(
+APPEND_HANDOFF_FILE = "append_export.ndjson"
+
+
+class PipelineBusyError(RuntimeError):
+    pass
+
+
+@dataclass
+class PipelineContext:
+    sample_dir: Path
+    config: PipelineConfig
+
+
+def stage_ingest(context: PipelineContext) -> None:
+    ingest(
+        [context.sample_dir / "leases.csv", context.sample_dir / "permits.csv"],
+        context.config.ingest_batch_size,
+    )
+
+
+def stage_dedupe_identity(context: PipelineContext) -> None:
+    dedupe_identity(context.config.dedupe_workers, context.config.dedupe_partition)
+
+
+def stage_address_update(context: PipelineContext) -> None:
+    address_update(
+        MockAddressUpdateProvider(),
+        context.config.vendor_batch_size,
+        context.config.vendor_concurrency,
+    )
+
+
+def stage_address_standardize(context: PipelineContext) -> None:
+    address_standardize(
+        MockAddressStandardizer(),
+        context.config.vendor_batch_size,
+        context.config.vendor_concurrency,
+    )
+
+
+def stage_score_owners(context: PipelineContext) -> None:
+    if context.config.score_engine == "columnar":
+        score_owners_columnar()
+    else:
+        score_owners()
+
+
+def stage_export_for_append(context: PipelineContext) -> None:
+    export_for_append(
         MockAppendVendorClient(),
-        sample_dir / "append_export.json",
-        config.address_confidence_threshold,
+        context.sample_dir / APPEND_HANDOFF_FILE,
+        context.config.address_confidence_threshold,
+    )
+
+
+def stage_import_appends(context: PipelineContext) -> None:
+    import_appends(MockAppendVendorClient(), context.sample_dir / APPEND_HANDOFF_FILE)
+
+
+def stage_outreach_queue(context: PipelineContext) -> None:
+    outreach_queue(context.config)
+
+
+def stage_dispatch_outreach(context: PipelineContext) -> None:
+    dispatch_outreach(
+        {
+            "sms": MockSMSClient(),
+            "email": MockEmailClient(),
+            "ringless_voicemail": MockRinglessVoicemailClient(),
+        },
+        batch_size=context.config.dispatch_batch_size,
+        claim_timeout_minutes=context.config.dispatch_claim_timeout_minutes,
     )
-    import_appends(MockAppendVendorClient(), payload)
-    outreach_queue(config)
+
+
+def stage_ai_inbound_handler(context: PipelineContext) -> None:
+    ai_inbound_handler(
+        IntentClassifier(),
+        ResponseGenerator(SchedulingLink(url="https://cal.example.com")),
+        sample_inbound_messages(),
+    )
+
+
+def stage_hot_lead_router(context: PipelineContext) -> None:
+    hot_lead_router()
+
+
+STAGES: dict[str, Callable[[PipelineContext], None]] = {
+    "ingest": stage_ingest,
+    "dedupe_identity": stage_dedupe_identity,
+    "address_update": stage_address_update,
+    "address_standardize": stage_address_standardize,
+    "score_owners": stage_score_owners,
+    "export_for_append": stage_export_for_append,
+    "import_appends": stage_import_appends,
+    "outreach_queue": stage_outreach_queue,
+    "dispatch_outreach": stage_dispatch_outreach,
+    "ai_inbound_handler": stage_ai_inbound_handler,
+    "hot_lead_router": stage_hot_lead_router,
+}
+
+
+def select_stages(
+    from_stage: str | None = None, only_stages: list[str] | None = None
+) -> list[str]:
+    names = list(STAGES)
+    unknown = [
+        name for name in [from_stage, *(only_stages or [])] if name and name not in STAGES
+    ]
+    if unknown:
+        raise ValueError(f"Unknown pipeline stage(s): {', '.join(unknown)}")
+    if from_stage:
+        names = names[names.index(from_stage) :]
+    if only_stages:
+        names = [name for name in names if name in only_stages]
+    return names
+
+
+def run_pipeline(
+    sample_dir: Path,
+    config: PipelineConfig | None = None,
+    rebuild: bool = False,
+    from_stage: str | None = None,
+    only_stages: list[str] | None = None,
+    on_stage: Callable[[str, int, int], None] | None = None,
+    run_lock: IO | None = None,
+) -> RunReport:
+    """Run the pipeline stages, recording each completion in the run ledger.
+
+    Without a stage selection, an unfinished previous full run is resumed
+    after its last completed stage; failed partial runs are never resumed.
+    ``rebuild`` drops the database first. ``on_stage`` is called with the
+    stage name and progress counts as each stage starts.
+
+    The run holds the database's run lock throughout and raises
+    ``PipelineBusyError`` if another run has it. A caller that already took
+    the lock with ``acquire_run_lock`` passes it as ``run_lock``.
+    """
+    lock = run_lock or acquire_run_lock()
+    try:
+        return _run_pipeline(sample_dir, config, rebuild, from_stage, only_stages, on_stage)
+    finally:
+        if run_lock is None:
+            lock.close()
+
+
+def _run_pipeline(
+    sample_dir: Path,
+    config: PipelineConfig | None,
+    rebuild: bool,
+    from_stage: str | None,
+    only_stages: list[str] | None,
+    on_stage: Callable[[str, int, int], None] | None,
+) -> RunReport:
+    context = PipelineContext(sample_dir=sample_dir, config=config or PipelineConfig())
+    if rebuild:
+        drop_database()
+    run_migrations()
+    stages = select_stages(from_stage, only_stages)
+    run = None
+    if not rebuild and from_stage is None and not only_stages:
+        run = find_unfinished_run(stages)
+    if run is None:
+        run = start_run(stages)
+    for name in run.stages:
+        if name in run.completed:
+            continue
+        if on_stage is not None:
+            on_stage(name, len(run.completed), len(run.stages))
+        mark_stage(run.id, name, "running")
+        try:
+            with run.report.stage(name):
+                STAGES[name](context)
+        except Exception as exc:
+            mark_stage(run.id, name, "failed", str(exc))
+            save_report(run)
+            raise
+        mark_stage(run.id, name, "completed")
+        run.completed.add(name)
+    with run.report.stage("dashboard"):
+        results = dashboard(context.config)
+    run.report.finish()
+    save_report(run)
+    print("Pipeline Dashboard")
+    print(f"Source records: {results.source_records}")
+    print(f"Owners: {results.owner_count}")
+    print(f"Addresses: {results.addresses}")
+    print(f"Contacts: {results.contacts}")
+    print(f"Outreach queued: {results.outreach_queued}")
+    print(f"Deliverable addresses: {results.deliverable_addresses}")
+    print(f"Mobile confirmed: {results.mobile_confirmed}")
+    print(f"Daily hot leads: {results.daily_hot_leads}")
+    print("Stage timings")
+    for stage in run.report.stages:
+        print(
+            f"{stage.name}: {stage.wall_seconds:.3f}s wall, {stage.cpu_seconds:.3f}s cpu,"
+            f" {stage.rows_read} read, {stage.rows_written} written,"
+            f" {stage.sql_statements} statements"
+        )
+    return run.report
+
+
+def sample_inbound_messages() -> list[dict[str, str]]:
+    # The demo replies are injected once; later runs leave them alone.
     with get_connection() as conn:
+        if conn.execute("SELECT 1 FROM inbound_messages LIMIT 1").fetchone():
+            return []
         owner_ids = [
-            row["id"] for row in conn.execute("SELECT id FROM owners").fetchall()
+            row["id"] for row in conn.execute("SELECT id FROM owners LIMIT 3").fetchall()
         ]
     inbound_messages = []
     if owner_ids:
@@ -71,19 +271,21 @@ def run_pipeline(sample_dir: Path) -> None:
                 "message": "STOP",
             }
         )
-    ai_inbound_handler(
-        IntentClassifier(),
-        ResponseGenerator(SchedulingLink(url="https://cal.example.com")),
-        inbound_messages,
-    )
-    hot_lead_router()
-    results = dashboard(config)
-    print("Pipeline Dashboard")
-    print(f"Source records: {results.source_records}")
-    print(f"Owners: {results.owner_count}")
-    print(f"Addresses: {results.addresses}")
-    print(f"Contacts: {results.contacts}")
-    print(f"Outreach queued: {results.outreach_queued}")
-    print(f"Deliverable addresses: {results.deliverable_addresses}")
-    print(f"Mobile confirmed: {results.mobile_confirmed}")
-    print(f"Daily hot leads: {results.daily_hot_leads}")
+    return inbound_messages
+
+
+def acquire_run_lock() -> IO:
+    """Take the ``flock`` that keeps runs against one database one at a time.
+
+    The lock lives in a file next to the database, so it holds across threads
+    and processes (API workers and the CLI alike). Close the handle to release it.
+    """
+    lock_path = database.DB_PATH.parent / "pipeline.lock"
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    handle = lock_path.open("w")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        handle.close()
+        raise PipelineBusyError("A pipeline run is already in progress")
+    return handle
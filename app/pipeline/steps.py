@@ -1,25 +1,43 @@
 from __future__ import annotations
 
+import calendar
 import csv
+import hashlib
 import json
+import logging
+import time
 import uuid
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
 
 from app.adapters.base import (
     AddressStandardizer,
     AddressUpdateProvider,
     AppendVendorClient,
 )
+from app.adapters.batching import map_batches
 from app.ai.inbound_handler import IntentClassifier, ResponseGenerator
-from app.compliance.rules import is_suppressed, should_allow_outreach
-from app.db.database import get_connection
+from app.compliance.rules import outreach_window_start, under_frequency_cap
+from app.db.database import bump_counter, get_connection, get_watermark, set_watermark
+from app.models.records import AddressRecord
 from app.models.schemas import Address, IntentLabel
-from app.scoring.address import address_score
-from app.scoring.dedupe import dedupe_score, normalize_name
-from app.scoring.hot_lead import is_hot_lead
+from app.pipeline.identity import resolve_owners, resolve_owners_parallel
+from app.scoring.address import ADDRESS_BONUSES, AddressBonus, address_score_sql
+from app.scoring.dedupe import OwnerMatchIndex, frozen_gc, match_key
+from app.scoring.batch import AddressColumns, address_scores, hot_lead_flags, max_by_owner
+
+
+DEDUPE_WATERMARK = "dedupe_identity"
+HOT_LEAD_WATERMARK = "hot_lead_router"
+MATCH_TOKENS_WATERMARK = "owner_match_tokens"
+# Queue rows that are still going to be (or are being) sent.
+PENDING_QUEUE_STATUSES = ("queued", "sending")
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -28,6 +46,15 @@ class PipelineConfig:
     window_days: int = 7
     sms_confidence_threshold: float = 0.7
     address_confidence_threshold: float = 0.6
+    ingest_batch_size: int = 5000
+    vendor_batch_size: int = 500
+    vendor_concurrency: int = 4
+    dispatch_batch_size: int = 500
+    dispatch_claim_timeout_minutes: int = 15
+    dedupe_workers: int = 1
+    dedupe_partition: str = "blocking_token"
+    # "sql" scores in one UPDATE; "columnar" scores in Python (score_owners_columnar).
+    score_engine: str = "sql"
 
 
 @dataclass
@@ -40,384 +67,787 @@ class PipelineResult:
     deliverable_addresses: int
     mobile_confirmed: int
     daily_hot_leads: int
+    refreshed_at: str | None = None
+
+
+@dataclass
+class IngestStats:
+    rows: int = 0
+    seconds: float = 0.0
 
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
 
-def ingest(csv_paths: list[Path]) -> None:
+
+@dataclass
+class AddressStageStats:
+    changed: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+
+
+def ingest(csv_paths: list[Path], batch_size: int = 5000) -> IngestStats:
+    """Load CSV source files, resuming each after the rows already ingested.
+
+    Files are expected to only grow. Each checkpoint stores the row count and
+    a digest of those rows; a file whose ingested prefix no longer matches
+    is rejected rather than loaded twice.
+    """
+    stats = IngestStats()
     with get_connection() as conn:
         for path in csv_paths:
-            with path.open() as handle:
+            file_stat = path.stat()
+            name = str(path.resolve())
+            done = conn.execute(
+                "SELECT size, modified_ns, rows, prefix_sha256, completed FROM ingested_files"
+                " WHERE path = ?",
+                (name,),
+            ).fetchone()
+            if (
+                done is not None
+                and done["completed"]
+                and (done["size"], done["modified_ns"])
+                == (file_stat.st_size, file_stat.st_mtime_ns)
+            ):
+                logger.info("ingest %s: already ingested, skipping", path.name)
+                continue
+            skip = done["rows"] if done is not None else 0
+            digest = hashlib.sha256()
+            before = stats.rows
+            with path.open(newline="") as handle:
                 reader = csv.DictReader(handle)
-                for row in reader:
-                    record_id = f"src-{uuid.uuid4()}"
-                    conn.execute(
-                        """
-                        INSERT INTO source_records (
-                            id, owner_name, source_type, source_id, address_line1,
-                            city, state, postal_code, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            record_id,
-                            row["owner_name"],
-                            row["source_type"],
-                            row["source_id"],
-                            row["address_line1"],
-                            row["city"],
-                            row["state"],
-                            row["postal_code"],
-                            datetime.utcnow().isoformat(),
-                        ),
+                for row in islice(reader, skip):
+                    digest.update(row_digest(row))
+                if done is not None and done["prefix_sha256"] not in (None, digest.hexdigest()):
+                    raise ValueError(
+                        f"{path.name} changed within its first {skip} ingested rows;"
+                        " source files may only be appended to"
+                    )
+
+                def digested(rows: Iterable[dict[str, str]]) -> Iterator[dict[str, str]]:
+                    for row in rows:
+                        digest.update(row_digest(row))
+                        yield row
+
+                def checkpoint(conn, rows: int, completed: bool = False) -> None:
+                    record_ingested_file(
+                        conn, name, file_stat, skip + rows, digest.hexdigest(), completed
                     )
+
+                ingest_rows(conn, digested(reader), batch_size, stats, path.name, checkpoint)
+            checkpoint(conn, stats.rows - before, True)
+            conn.commit()
+    return stats
+
+
+def row_digest(row: dict[str, str]) -> bytes:
+    return json.dumps(list(row.values())).encode() + b"\n"
+
+
+def record_ingested_file(
+    conn, path: str, file_stat, rows: int, prefix_sha256: str, completed: bool
+) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO ingested_files"
+        " (path, size, modified_ns, rows, prefix_sha256, completed, updated_at)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            path,
+            file_stat.st_size,
+            file_stat.st_mtime_ns,
+            rows,
+            prefix_sha256,
+            int(completed),
+            datetime.utcnow().isoformat(),
+        ),
+    )
+
+
+def ingest_rows(
+    conn,
+    rows: Iterable[dict[str, str]],
+    batch_size: int = 5000,
+    stats: IngestStats | None = None,
+    label: str = "rows",
+    checkpoint: Callable[[Any, int], None] | None = None,
+) -> IngestStats:
+    stats = stats or IngestStats()
+    prefix = f"src-{uuid.uuid4()}"
+    position = 0
+    rows = iter(rows)
+    while True:
+        started = time.perf_counter()
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        created_at = datetime.utcnow().isoformat()
+        conn.executemany(
+            """
+            INSERT INTO source_records (
+                id, owner_name, source_type, source_id, address_line1,
+                city, state, postal_code, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    f"{prefix}-{position + offset}",
+                    row["owner_name"],
+                    row["source_type"],
+                    row["source_id"],
+                    row["address_line1"],
+                    row["city"],
+                    row["state"],
+                    row["postal_code"],
+                    created_at,
+                )
+                for offset, row in enumerate(batch)
+            ],
+        )
+        position += len(batch)
+        bump_counter(conn, "source_records", len(batch))
+        if checkpoint is not None:
+            checkpoint(conn, position)
         conn.commit()
+        stats.rows += len(batch)
+        stats.seconds += time.perf_counter() - started
+        logger.info(
+            "ingest %s: %d rows (%.0f rows/s)", label, stats.rows, stats.rows_per_second
+        )
+    return stats
+
 
+def index_owner_tokens(conn) -> int:
+    """Store blocking postings for owners added since the last call."""
+    watermark = get_watermark(conn, MATCH_TOKENS_WATERMARK)
+    rows = conn.execute(
+        "SELECT rowid, canonical_name FROM owners WHERE rowid > ? ORDER BY rowid",
+        (watermark,),
+    ).fetchall()
+    if not rows:
+        return 0
+    index = OwnerMatchIndex()
+    conn.executemany(
+        "INSERT OR IGNORE INTO owner_match_tokens (token, size, owner_rowid) VALUES (?, ?, ?)",
+        [
+            (token, size, row["rowid"])
+            for row in rows
+            for token, size in index.posting_keys(match_key(row["canonical_name"]))
+        ],
+    )
+    set_watermark(conn, MATCH_TOKENS_WATERMARK, rows[-1]["rowid"])
+    return len(rows)
+
+
+def candidate_owners(conn, records: list) -> list[tuple[str, str]]:
+    """Existing owners that any of ``records`` could match, in insertion order.
+
+    Only owners stored under one of the records' lookup keys are read, so the
+    work grows with the delta rather than with the whole owner base.
+    """
+    index = OwnerMatchIndex()
+    keys = {
+        pair
+        for record in records
+        for pair in index.lookup_keys(match_key(record["owner_name"]))
+    }
+    return [
+        (row["id"], row["canonical_name"])
+        for row in conn.execute(
+            """
+            SELECT o.id, o.canonical_name
+            FROM (
+                SELECT DISTINCT t.owner_rowid
+                FROM json_each(?) j
+                JOIN owner_match_tokens t
+                  ON t.token = j.value ->> 0 AND t.size = j.value ->> 1
+            ) c
+            JOIN owners o ON o.rowid = c.owner_rowid
+            ORDER BY o.rowid
+            """,
+            (json.dumps(sorted(keys)),),
+        )
+    ]
 
-def dedupe_identity() -> None:
+
+def load_owner_index(conn, records: list) -> OwnerMatchIndex:
+    index = OwnerMatchIndex()
+    for owner_id, name in candidate_owners(conn, records):
+        index.add(match_key(name), owner_id)
+    return index
+
+
+def dedupe_identity(workers: int = 1, partition: str = "blocking_token") -> None:
+    """Fold source records added since the last run into canonical owners.
+
+    With ``workers`` > 1 records are split by the ``partition`` strategy and
+    resolved in a process pool; owners and links match the serial run.
+    """
     with get_connection() as conn:
-        records = conn.execute("SELECT * FROM source_records").fetchall()
-        owners = []
-        owner_map: dict[str, str] = {}
-        for record in records:
-            name = record["owner_name"]
-            normalized = normalize_name(name)
-            existing_owner_id = None
-            for key, owner_id in owner_map.items():
-                if dedupe_score(normalized, key) >= 0.9:
-                    existing_owner_id = owner_id
-                    break
-            if existing_owner_id is None:
-                owner_id = f"own-{uuid.uuid4()}"
-                owner_map[normalized] = owner_id
-                owners.append((owner_id, name, datetime.utcnow().isoformat(), 0.0))
-            else:
-                owner_id = existing_owner_id
-            address_id = f"addr-{uuid.uuid4()}"
-            conn.execute(
-                """
-                INSERT INTO addresses (
-                    id, owner_id, line1, city, state, postal_code,
-                    confidence, is_deliverable, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    address_id,
-                    owner_id,
-                    record["address_line1"],
-                    record["city"],
-                    record["state"],
-                    record["postal_code"],
-                    0.5,
-                    1,
-                    datetime.utcnow().isoformat(),
-                ),
+        watermark = get_watermark(conn, DEDUPE_WATERMARK)
+        records = conn.execute(
+            "SELECT rowid, * FROM source_records WHERE rowid > ? ORDER BY rowid",
+            (watermark,),
+        ).fetchall()
+        if not records:
+            return
+        index_owner_tokens(conn)
+        if workers > 1:
+            owners, addresses, links = resolve_owners_parallel(
+                candidate_owners(conn, records),
+                [dict(record) for record in records],
+                workers,
+                partition,
             )
+        else:
+            with frozen_gc():
+                index = load_owner_index(conn, records)
+                owners, addresses, links = resolve_owners(index, records)
         conn.executemany(
             "INSERT INTO owners (id, canonical_name, created_at, score) VALUES (?, ?, ?, ?)",
             owners,
         )
+        conn.executemany(
+            """
+            INSERT INTO addresses (
+                id, owner_id, line1, city, state, postal_code,
+                confidence, is_deliverable, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            addresses,
+        )
+        conn.executemany(
+            "INSERT INTO source_record_owners (source_record_id, owner_id, resolved_at)"
+            " VALUES (?, ?, ?)",
+            links,
+        )
+        index_owner_tokens(conn)
+        set_watermark(conn, DEDUPE_WATERMARK, records[-1]["rowid"])
         conn.commit()
 
 
-def address_update(provider: AddressUpdateProvider) -> None:
-    with get_connection() as conn:
-        rows = conn.execute("SELECT * FROM addresses").fetchall()
-        addresses = [
-            Address(
-                id=row["id"],
-                owner_id=row["owner_id"],
-                line1=row["line1"],
-                city=row["city"],
-                state=row["state"],
-                postal_code=row["postal_code"],
-                confidence=row["confidence"],
-                is_deliverable=bool(row["is_deliverable"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-            )
-            for row in rows
-        ]
-        updated = provider.update(addresses)
-        for address in updated:
-            conn.execute(
-                """
-                UPDATE addresses
-                SET line1 = ?, city = ?, state = ?, postal_code = ?, confidence = ?,
-                    is_deliverable = ?, updated_at = ?
-                WHERE id = ?
-                """,
-                (
-                    address.line1,
-                    address.city,
-                    address.state,
-                    address.postal_code,
-                    address.confidence,
-                    int(address.is_deliverable),
-                    address.updated_at.isoformat(),
-                    address.id,
-                ),
-            )
+def address_from_row(row) -> Address:
+    return Address(
+        id=row["id"],
+        owner_id=row["owner_id"],
+        line1=row["line1"],
+        city=row["city"],
+        state=row["state"],
+        postal_code=row["postal_code"],
+        confidence=row["confidence"],
+        is_deliverable=bool(row["is_deliverable"]),
+        updated_at=datetime.fromisoformat(row["updated_at"]),
+    )
+
+
+def dirty_address_rowids(conn, version_column: str, version: str) -> list[int]:
+    # Three ranges rather than IS NOT, so each is a search of the version index.
+    rows = conn.execute(
+        f"SELECT rowid FROM addresses WHERE {version_column} IS NULL"
+        f" OR {version_column} < ? OR {version_column} > ?",
+        (version, version),
+    ).fetchall()
+    return sorted(row["rowid"] for row in rows)
+
+
+def iter_address_batches(
+    conn, rowids: list[int], batch_size: int
+) -> Iterator[list[AddressRecord]]:
+    for start in range(0, len(rowids), batch_size):
+        rows = conn.execute(
+            "SELECT rowid, * FROM addresses"
+            " WHERE rowid IN (SELECT value FROM json_each(?)) ORDER BY rowid",
+            (json.dumps(rowids[start : start + batch_size]),),
+        ).fetchall()
+        yield [AddressRecord.from_row(row) for row in rows]
+
+
+def vendor_batch_size(max_batch_size: int | None, batch_size: int) -> int:
+    return min(batch_size, max_batch_size) if max_batch_size else batch_size
+
+
+def provider_version(provider: AddressUpdateProvider | AddressStandardizer) -> str:
+    return f"{type(provider).__name__}:{provider.version}"
+
+
+def refresh_addresses(
+    conn,
+    call: Callable[[list[AddressRecord]], list[AddressRecord]],
+    fields: tuple[str, ...],
+    version_column: str,
+    version: str,
+    batch_size: int,
+    max_workers: int,
+    invalidates: tuple[str, ...] = (),
+) -> AddressStageStats:
+    """Run changed-since-``version`` addresses through ``call`` and write back.
+
+    Rows whose ``fields`` change also get each ``invalidates`` version column
+    cleared, so stages that depend on those fields see the row again.
+    """
+    rowids = dirty_address_rowids(conn, version_column, version)
+    total = conn.execute(
+        "SELECT COALESCE(SUM(count), 0) AS count FROM dashboard_counters WHERE metric = ?",
+        ("addresses",),
+    ).fetchone()["count"]
+    stats = AddressStageStats(skipped=total - len(rowids))
+    assignments = ", ".join(
+        [f"{field} = ?" for field in fields] + [f"{column} = NULL" for column in invalidates]
+    )
+    batches = iter_address_batches(conn, rowids, batch_size)
+    for originals, results in map_batches(
+        lambda batch: (batch, call(batch)), batches, max_workers
+    ):
+        before = {address.id: address for address in originals}
+        changed = []
+        unchanged = []
+        for address in results:
+            values = tuple(getattr(address, field) for field in fields)
+            original = before.get(address.id)
+            if original is not None and values == tuple(
+                getattr(original, field) for field in fields
+            ):
+                unchanged.append((version, address.id))
+            else:
+                changed.append((*values, address.updated_at, version, address.id))
+        conn.executemany(
+            f"UPDATE addresses SET {assignments}, updated_at = ?, {version_column} = ?"
+            " WHERE id = ?",
+            changed,
+        )
+        conn.executemany(
+            f"UPDATE addresses SET {version_column} = ? WHERE id = ?", unchanged
+        )
         conn.commit()
+        stats.changed += len(changed)
+        stats.unchanged += len(unchanged)
+    return stats
 
 
-def address_standardize(standardizer: AddressStandardizer) -> None:
+def address_update(
+    provider: AddressUpdateProvider, batch_size: int = 500, max_workers: int = 4
+) -> AddressStageStats:
     with get_connection() as conn:
-        rows = conn.execute("SELECT * FROM addresses").fetchall()
-        addresses = [
-            Address(
-                id=row["id"],
-                owner_id=row["owner_id"],
-                line1=row["line1"],
-                city=row["city"],
-                state=row["state"],
-                postal_code=row["postal_code"],
-                confidence=row["confidence"],
-                is_deliverable=bool(row["is_deliverable"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-            )
-            for row in rows
-        ]
-        standardized = standardizer.standardize(addresses)
-        for address in standardized:
-            conn.execute(
-                """
-                UPDATE addresses
-                SET line1 = ?, city = ?, state = ?, postal_code = ?, updated_at = ?
-                WHERE id = ?
-                """,
-                (
-                    address.line1,
-                    address.city,
-                    address.state,
-                    address.postal_code,
-                    address.updated_at.isoformat(),
-                    address.id,
-                ),
-            )
+        stats = refresh_addresses(
+            conn,
+            provider.update_records,
+            ("line1", "city", "state", "postal_code", "confidence", "is_deliverable"),
+            "update_version",
+            provider_version(provider),
+            vendor_batch_size(provider.max_batch_size, batch_size),
+            max_workers,
+            invalidates=("standardize_version",),
+        )
+    logger.info(
+        "address_update: %d changed, %d unchanged, %d skipped",
+        stats.changed,
+        stats.unchanged,
+        stats.skipped,
+    )
+    return stats
+
+
+def address_standardize(
+    standardizer: AddressStandardizer, batch_size: int = 500, max_workers: int = 4
+) -> AddressStageStats:
+    with get_connection() as conn:
+        stats = refresh_addresses(
+            conn,
+            standardizer.standardize_records,
+            ("line1", "city", "state", "postal_code"),
+            "standardize_version",
+            provider_version(standardizer),
+            vendor_batch_size(standardizer.max_batch_size, batch_size),
+            max_workers,
+        )
+    logger.info(
+        "address_standardize: %d changed, %d unchanged, %d skipped",
+        stats.changed,
+        stats.unchanged,
+        stats.skipped,
+    )
+    return stats
+
+
+def score_owners(bonuses: list[AddressBonus] = ADDRESS_BONUSES) -> None:
+    with get_connection() as conn:
+        conn.execute(
+            f"""
+            UPDATE owners SET score = scored.score
+            FROM (
+                SELECT owner_id, MAX({address_score_sql(bonuses)}) AS score
+                FROM addresses
+                GROUP BY owner_id
+            ) AS scored
+            WHERE owners.id = scored.owner_id
+            """
+        )
         conn.commit()
 
 
-def score_owners() -> None:
+def score_owners_columnar(bonuses: list[AddressBonus] = ADDRESS_BONUSES) -> int:
+    """score_owners computed in Python over column arrays instead of SQL.
+
+    Gives the same scores; useful for bonus rules that are awkward to
+    express as SQL conditions.
+    """
     with get_connection() as conn:
-        owners = conn.execute("SELECT id FROM owners").fetchall()
-        for owner in owners:
-            address_rows = conn.execute(
-                "SELECT * FROM addresses WHERE owner_id = ?", (owner["id"],)
-            ).fetchall()
-            if not address_rows:
-                continue
-            scores = []
-            for row in address_rows:
-                address = Address(
-                    id=row["id"],
-                    owner_id=row["owner_id"],
-                    line1=row["line1"],
-                    city=row["city"],
-                    state=row["state"],
-                    postal_code=row["postal_code"],
-                    confidence=row["confidence"],
-                    is_deliverable=bool(row["is_deliverable"]),
-                    updated_at=datetime.fromisoformat(row["updated_at"]),
-                )
-                scores.append(address_score(address))
-            conn.execute(
-                "UPDATE owners SET score = ? WHERE id = ?",
-                (max(scores), owner["id"]),
-            )
+        columns = AddressColumns.from_rows(
+            conn.execute("SELECT owner_id, confidence, is_deliverable FROM addresses")
+        )
+        best = max_by_owner(columns.owner_id, address_scores(columns, bonuses))
+        conn.executemany(
+            "UPDATE owners SET score = ? WHERE id = ?",
+            [(score, owner_id) for owner_id, score in best.items()],
+        )
         conn.commit()
+    return len(best)
+
+
+EXPORT_COLUMNS = (
+    "id", "owner_id", "line1", "city", "state", "postal_code",
+    "confidence", "is_deliverable", "updated_at",
+)
+CONTACT_UPSERT = """
+    INSERT INTO contacts (id, owner_id, value, contact_type, phone_type, confidence, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        owner_id = excluded.owner_id,
+        value = excluded.value,
+        contact_type = excluded.contact_type,
+        phone_type = excluded.phone_type,
+        confidence = excluded.confidence,
+        updated_at = excluded.updated_at
+"""
 
 
 def export_for_append(
     client: AppendVendorClient, output_path: Path, confidence_threshold: float
-) -> str:
+) -> int:
     with get_connection() as conn:
         rows = conn.execute(
-            "SELECT * FROM addresses WHERE confidence >= ? AND is_deliverable = 1",
+            f"SELECT {', '.join(EXPORT_COLUMNS)} FROM addresses"
+            " WHERE confidence >= ? AND is_deliverable = 1",
             (confidence_threshold,),
-        ).fetchall()
-        addresses = [
-            Address(
-                id=row["id"],
-                owner_id=row["owner_id"],
-                line1=row["line1"],
-                city=row["city"],
-                state=row["state"],
-                postal_code=row["postal_code"],
-                confidence=row["confidence"],
-                is_deliverable=bool(row["is_deliverable"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-            )
-            for row in rows
-        ]
-        payload = client.export_payload(addresses)
-    output_path.write_text(payload)
-    return payload
+        )
+        exported = client.export_file(
+            (
+                {**dict(zip(EXPORT_COLUMNS, row)), "is_deliverable": bool(row["is_deliverable"])}
+                for row in rows
+            ),
+            output_path,
+        )
+    logger.info("export_for_append: %d addresses to %s", exported, output_path)
+    return exported
 
 
-def import_appends(client: AppendVendorClient, payload: str) -> None:
-    contacts = client.import_appends(payload)
+def import_appends(client: AppendVendorClient, input_path: Path, batch_size: int = 1000) -> int:
+    imported = 0
     with get_connection() as conn:
-        for contact in contacts:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO contacts (
-                    id, owner_id, value, contact_type, phone_type, confidence, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    contact.id,
-                    contact.owner_id,
-                    contact.value,
-                    contact.contact_type,
-                    contact.phone_type,
-                    contact.confidence,
-                    contact.updated_at.isoformat(),
-                ),
+        for contacts in client.import_file(input_path, batch_size):
+            conn.executemany(
+                CONTACT_UPSERT,
+                [
+                    (
+                        contact.id,
+                        contact.owner_id,
+                        contact.value,
+                        contact.contact_type,
+                        contact.phone_type,
+                        contact.confidence,
+                        contact.updated_at.isoformat(),
+                    )
+                    for contact in contacts
+                ],
             )
+            imported += len(contacts)
         conn.commit()
+    logger.info("import_appends: %d contacts from %s", imported, input_path)
+    return imported
 
 
 def outreach_queue(config: PipelineConfig) -> None:
+    window_start = outreach_window_start(config.window_days).isoformat()
+    scheduled_for = (datetime.utcnow() + timedelta(minutes=5)).isoformat()
+    pending = ", ".join("?" for _ in PENDING_QUEUE_STATUSES)
     with get_connection() as conn:
-        owners = conn.execute("SELECT id FROM owners").fetchall()
-        suppression = {
-            row["owner_id"]: row["reason"]
-            for row in conn.execute("SELECT owner_id, reason FROM suppression")
-        }
-        for owner in owners:
-            owner_id = owner["id"]
-            if is_suppressed(suppression, owner_id):
-                continue
-            attempts = conn.execute(
-                "SELECT created_at FROM contact_attempts WHERE owner_id = ?",
-                (owner_id,),
-            ).fetchall()
-            attempt_times = [
-                datetime.fromisoformat(row["created_at"]) for row in attempts
-            ]
-            if not should_allow_outreach(
-                attempt_times, config.max_attempts, config.window_days
-            ):
+        contacts = conn.execute(
+            f"""
+            SELECT c.owner_id, c.value, c.contact_type, c.phone_type, c.confidence,
+                   (
+                       SELECT COUNT(*) FROM contact_attempts a
+                       WHERE a.owner_id = c.owner_id AND a.created_at >= ?
+                   ) AS recent_attempts
+            FROM contacts c
+            JOIN owners o ON o.id = c.owner_id
+            LEFT JOIN suppression s ON s.owner_id = c.owner_id
+            WHERE s.owner_id IS NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM outreach_queue q
+                  WHERE q.owner_id = c.owner_id AND q.status IN ({pending})
+              )
+            """,
+            (window_start, *PENDING_QUEUE_STATUSES),
+        ).fetchall()
+        entries = []
+        for contact in contacts:
+            if not under_frequency_cap(contact["recent_attempts"], config.max_attempts):
                 continue
-            contact_rows = conn.execute(
-                "SELECT * FROM contacts WHERE owner_id = ?", (owner_id,)
-            ).fetchall()
-            for contact in contact_rows:
-                if contact["contact_type"] == "phone":
-                    if (
-                        contact["phone_type"] == "mobile"
-                        and contact["confidence"] >= config.sms_confidence_threshold
-                    ):
-                        queue_outreach(
-                            conn,
-                            owner_id,
-                            "sms",
-                            {"phone": contact["value"]},
-                        )
-                    queue_outreach(
-                        conn,
+            owner_id = contact["owner_id"]
+            if contact["contact_type"] == "phone":
+                if (
+                    contact["phone_type"] == "mobile"
+                    and contact["confidence"] >= config.sms_confidence_threshold
+                ):
+                    entries.append(
+                        queue_entry(owner_id, "sms", {"phone": contact["value"]}, scheduled_for)
+                    )
+                entries.append(
+                    queue_entry(
                         owner_id,
                         "ringless_voicemail",
                         {"phone": contact["value"]},
+                        scheduled_for,
                     )
-                if contact["contact_type"] == "email":
-                    queue_outreach(
-                        conn,
-                        owner_id,
-                        "email",
-                        {"email": contact["value"]},
-                    )
+                )
+            if contact["contact_type"] == "email":
+                entries.append(
+                    queue_entry(owner_id, "email", {"email": contact["value"]}, scheduled_for)
+                )
+        conn.executemany(
+            """
+            INSERT INTO outreach_queue (id, owner_id, channel, payload, scheduled_for, status)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            entries,
+        )
         conn.commit()
 
 
+def queue_entry(
+    owner_id: str, channel: str, payload: dict[str, str], scheduled_for: str
+) -> tuple[str, str, str, str, str, str]:
+    return (
+        f"queue-{uuid.uuid4()}",
+        owner_id,
+        channel,
+        json.dumps(payload),
+        scheduled_for,
+        "queued",
+    )
+
+
 def queue_outreach(conn, owner_id: str, channel: str, payload: dict[str, str]) -> None:
-    queue_id = f"queue-{uuid.uuid4()}"
     conn.execute(
         """
         INSERT INTO outreach_queue (id, owner_id, channel, payload, scheduled_for, status)
         VALUES (?, ?, ?, ?, ?, ?)
         """,
-        (
-            queue_id,
+        queue_entry(
             owner_id,
             channel,
-            json.dumps(payload),
+            payload,
             (datetime.utcnow() + timedelta(minutes=5)).isoformat(),
-            "queued",
         ),
     )
 
 
+SUPPRESSING_INTENTS = (IntentLabel.stop, IntentLabel.never)
+
+
 def ai_inbound_handler(
     classifier: IntentClassifier,
     responder: ResponseGenerator,
     inbound_messages: list[dict[str, str]],
-) -> None:
+) -> list[IntentLabel]:
+    intents = classifier.classify_batch(inbound["message"] for inbound in inbound_messages)
+    replies = {intent: f"auto_reply:{responder.draft(intent)}" for intent in set(intents)}
+    now = datetime.utcnow().isoformat()
+    # Later messages win, as they would if each were applied in turn.
+    suppressed = {
+        inbound["owner_id"]: intent.value
+        for inbound, intent in zip(inbound_messages, intents)
+        if intent in SUPPRESSING_INTENTS
+    }
     with get_connection() as conn:
-        for inbound in inbound_messages:
-            owner_id = inbound["owner_id"]
-            message = inbound["message"]
-            intent = classifier.classify(message)
-            conn.execute(
-                "INSERT INTO inbound_messages (id, owner_id, channel, message, created_at)"
-                " VALUES (?, ?, ?, ?, ?)",
+        conn.executemany(
+            "INSERT INTO inbound_messages (id, owner_id, channel, message, intent, created_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [
                 (
                     f"inbound-{uuid.uuid4()}",
-                    owner_id,
+                    inbound["owner_id"],
                     inbound["channel"],
-                    message,
-                    datetime.utcnow().isoformat(),
-                ),
-            )
-            if intent in {IntentLabel.stop, IntentLabel.never}:
-                conn.execute(
-                    "INSERT OR REPLACE INTO suppression (owner_id, reason, created_at)"
-                    " VALUES (?, ?, ?)",
-                    (owner_id, intent.value, datetime.utcnow().isoformat()),
-                )
-                conn.execute(
-                    "DELETE FROM outreach_queue WHERE owner_id = ?", (owner_id,)
+                    inbound["message"],
+                    intent.value,
+                    now,
                 )
-            response = responder.draft(intent)
+                for inbound, intent in zip(inbound_messages, intents)
+            ],
+        )
+        if suppressed:
+            conn.executemany(
+                "INSERT OR REPLACE INTO suppression (owner_id, reason, created_at)"
+                " VALUES (?, ?, ?)",
+                [(owner_id, reason, now) for owner_id, reason in suppressed.items()],
+            )
             conn.execute(
-                "INSERT INTO contact_attempts (id, owner_id, channel, status, created_at)"
-                " VALUES (?, ?, ?, ?, ?)",
+                # Only pending sends are cancelled; sent and in-flight rows are history.
+                "DELETE FROM outreach_queue WHERE status = 'queued'"
+                " AND owner_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(suppressed)),),
+            )
+        conn.executemany(
+            "INSERT INTO contact_attempts (id, owner_id, channel, status, created_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [
                 (
                     f"attempt-{uuid.uuid4()}",
-                    owner_id,
+                    inbound["owner_id"],
                     inbound["channel"],
-                    f"auto_reply:{response}",
-                    datetime.utcnow().isoformat(),
-                ),
-            )
+                    replies[intent],
+                    now,
+                )
+                for inbound, intent in zip(inbound_messages, intents)
+            ],
+        )
         conn.commit()
+    return intents
 
 
 def hot_lead_router() -> None:
     with get_connection() as conn:
+        watermark = get_watermark(conn, HOT_LEAD_WATERMARK)
         inbound = conn.execute(
-            "SELECT owner_id, message FROM inbound_messages"
+            "SELECT rowid, owner_id, message, intent FROM inbound_messages"
+            " WHERE rowid > ? ORDER BY rowid",
+            (watermark,),
         ).fetchall()
+        if not inbound:
+            return
+        # Messages stored before intents were persisted are labelled once here.
+        unlabeled = [row for row in inbound if row["intent"] is None]
+        labels = IntentClassifier().classify_batch(row["message"] for row in unlabeled)
+        backfilled = {row["rowid"]: label for row, label in zip(unlabeled, labels)}
+        conn.executemany(
+            "UPDATE inbound_messages SET intent = ? WHERE rowid = ?",
+            [(label.value, rowid) for rowid, label in backfilled.items()],
+        )
+
         counts = defaultdict(int)
         intents: dict[str, IntentLabel] = {}
-        classifier = IntentClassifier()
-        for message in inbound:
-            owner_id = message["owner_id"]
+        for row in inbound:
+            owner_id = row["owner_id"]
             counts[owner_id] += 1
-            intents[owner_id] = classifier.classify(message["message"])
-        for owner_id, count in counts.items():
-            intent = intents[owner_id]
-            if is_hot_lead(intent, count):
-                conn.execute(
-                    "INSERT OR REPLACE INTO hot_leads (owner_id, reason, created_at)"
-                    " VALUES (?, ?, ?)",
-                    (
-                        owner_id,
-                        f"intent:{intent.value}|messages:{count}",
-                        datetime.utcnow().isoformat(),
-                    ),
-                )
+            intents[owner_id] = backfilled.get(row["rowid"]) or IntentLabel(row["intent"])
+        now = datetime.utcnow().isoformat()
+        conn.executemany(
+            """
+            INSERT INTO owner_message_stats (owner_id, message_count, last_intent, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (owner_id) DO UPDATE SET
+                message_count = message_count + excluded.message_count,
+                last_intent = excluded.last_intent,
+                updated_at = excluded.updated_at
+            """,
+            [(owner_id, count, intents[owner_id].value, now) for owner_id, count in counts.items()],
+        )
+
+        touched = conn.execute(
+            "SELECT owner_id, message_count, last_intent FROM owner_message_stats"
+            " WHERE owner_id IN (SELECT owner_id FROM inbound_messages WHERE rowid > ?)",
+            (watermark,),
+        ).fetchall()
+        flags = hot_lead_flags(
+            [row["last_intent"] for row in touched], [row["message_count"] for row in touched]
+        )
+        leads = [
+            (
+                row["owner_id"],
+                f"intent:{row['last_intent']}|messages:{row['message_count']}",
+                now,
+            )
+            for row, hot in zip(touched, flags)
+            if hot
+        ]
+        conn.executemany(
+            "INSERT OR REPLACE INTO hot_leads (owner_id, reason, created_at) VALUES (?, ?, ?)",
+            leads,
+        )
+        set_watermark(conn, HOT_LEAD_WATERMARK, inbound[-1]["rowid"])
         conn.commit()
 
 
-def dashboard(config: PipelineConfig) -> PipelineResult:
+COUNTER_METRICS = ("source_records", "owners", "addresses", "contacts", "outreach_pending")
+# Confidence counters are bucketed into cells of 1 / CONFIDENCE_GRID (migration 016).
+CONFIDENCE_GRID = 1000
+
+
+def dashboard(config: PipelineConfig, recount: bool = False) -> PipelineResult:
+    if recount:
+        return recount_dashboard(config)
+    cutoff = datetime.utcnow() - timedelta(days=1)
+    cutoff_hour = calendar.timegm(cutoff.timetuple()) // 3600
+    next_hour = datetime.utcfromtimestamp((cutoff_hour + 1) * 3600)
+    with get_connection() as conn:
+        totals = {
+            row["metric"]: row["count"]
+            for row in conn.execute(
+                f"SELECT metric, SUM(count) AS count FROM dashboard_counters"
+                f" WHERE metric IN ({','.join('?' * len(COUNTER_METRICS))}) GROUP BY metric",
+                COUNTER_METRICS,
+            )
+        }
+
+        def bucket_total(metric: str, condition: str, value) -> int:
+            return conn.execute(
+                f"SELECT COALESCE(SUM(count), 0) AS count FROM dashboard_counters"
+                f" WHERE metric = ? AND bucket {condition} ?",
+                (metric, value),
+            ).fetchone()["count"]
+
+        def threshold_total(metric: str, threshold: float, count_sql: str) -> int:
+            # Whole cells above the threshold's cell come from the counters;
+            # the cell containing the threshold is counted exactly via the index.
+            cell = int(threshold * CONFIDENCE_GRID)
+            return bucket_total(metric, ">", cell) + conn.execute(
+                f"{count_sql} AND confidence >= ? AND confidence < ?"
+                f" AND CAST(confidence * {CONFIDENCE_GRID} AS INTEGER) = ?",
+                (threshold, (cell + 2) / CONFIDENCE_GRID, cell),
+            ).fetchone()["count"]
+
+        # Whole hours after the cutoff come from the hourly buckets; the
+        # partial hour containing the cutoff is counted exactly via the index.
+        hot_leads = bucket_total("hot_leads_hourly", ">", cutoff_hour) + conn.execute(
+            "SELECT COUNT(*) as count FROM hot_leads WHERE created_at >= ? AND created_at < ?",
+            (cutoff.isoformat(), next_hour.isoformat()),
+        ).fetchone()["count"]
+        refreshed_at = conn.execute(
+            "SELECT MAX(updated_at) AS updated_at FROM dashboard_counters"
+        ).fetchone()["updated_at"]
+        return PipelineResult(
+            source_records=totals.get("source_records", 0),
+            owner_count=totals.get("owners", 0),
+            addresses=totals.get("addresses", 0),
+            contacts=totals.get("contacts", 0),
+            outreach_queued=totals.get("outreach_pending", 0),
+            deliverable_addresses=threshold_total(
+                "deliverable_addresses",
+                config.address_confidence_threshold,
+                "SELECT COUNT(*) AS count FROM addresses WHERE is_deliverable = 1",
+            ),
+            mobile_confirmed=threshold_total(
+                "mobile_contacts",
+                config.sms_confidence_threshold,
+                "SELECT COUNT(*) AS count FROM contacts"
+                " WHERE contact_type = 'phone' AND phone_type = 'mobile'",
+            ),
+            daily_hot_leads=hot_leads,
+            refreshed_at=refreshed_at,
+        )
+
+
+def recount_dashboard(config: PipelineConfig) -> PipelineResult:
     with get_connection() as conn:
         source_records = conn.execute(
             "SELECT COUNT(*) as count FROM source_records"
@@ -431,6 +861,8 @@ def dashboard(config: PipelineConfig) -> PipelineResult:
         ).fetchone()["count"]
         outreach_queued = conn.execute(
             "SELECT COUNT(*) as count FROM outreach_queue"
+            f" WHERE status IN ({', '.join('?' for _ in PENDING_QUEUE_STATUSES)})",
+            PENDING_QUEUE_STATUSES,
         ).fetchone()["count"]
         deliverable = conn.execute(
             "SELECT COUNT(*) as count FROM addresses WHERE confidence >= ? AND is_deliverable = 1",
@@ -454,4 +886,5 @@ def dashboard(config: PipelineConfig) -> PipelineResult:
             deliverable_addresses=deliverable,
             mobile_confirmed=mobile,
             daily_hot_leads=hot_leads,
+            refreshed_at=datetime.utcnow().isoformat(),
         )
@@ -1,9 +1,34 @@
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 
-from app.pipeline.runner import run_pipeline
+from app.pipeline.runner import STAGES, PipelineBusyError, run_pipeline
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the owner intelligence pipeline")
+    parser.add_argument("--sample-dir", type=Path, default=Path("app/sample_data"))
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="drop the database and rebuild everything from scratch",
+    )
+    parser.add_argument("--from-stage", choices=list(STAGES))
+    parser.add_argument(
+        "--only-stage", action="append", choices=list(STAGES), dest="only_stages"
+    )
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    run_pipeline(Path("app/sample_data"))
+    args = parse_args()
+    try:
+        run_pipeline(
+            args.sample_dir,
+            rebuild=args.rebuild,
+            from_stage=args.from_stage,
+            only_stages=args.only_stages,
+        )
+    except PipelineBusyError as exc:
+        raise SystemExit(str(exc)) from None
@@ -1,10 +1,49 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Sequence
+
 from app.models.schemas import Address
 
+if TYPE_CHECKING:
+    from app.scoring.batch import AddressColumns
+
+
+@dataclass(frozen=True)
+class AddressBonus:
+    """A score bonus, expressed per address, per column batch and as a SQL
+    condition on addresses."""
+
+    name: str
+    bonus: float
+    condition_sql: str
+    applies: Callable[[Address], bool]
+    column_mask: Callable[[AddressColumns], Sequence[int]]
+
 
-def address_score(address: Address) -> float:
+ADDRESS_BONUSES = [
+    AddressBonus(
+        name="deliverable",
+        bonus=0.1,
+        condition_sql="is_deliverable = 1",
+        applies=lambda address: address.is_deliverable,
+        column_mask=lambda columns: columns.is_deliverable,
+    ),
+]
+
+
+def address_score(address: Address, bonuses: list[AddressBonus] = ADDRESS_BONUSES) -> float:
     score = address.confidence
-    if address.is_deliverable:
-        score += 0.1
+    for rule in bonuses:
+        if rule.applies(address):
+            score += rule.bonus
     return min(score, 1.0)
+
+
+def address_score_sql(bonuses: list[AddressBonus] = ADDRESS_BONUSES) -> str:
+    # Terms are added left to right like address_score, so results are identical.
+    terms = ["confidence"] + [
+        f"(CASE WHEN {rule.condition_sql} THEN {rule.bonus!r} ELSE 0.0 END)"
+        for rule in bonuses
+    ]
+    return f"MIN({' + '.join(terms)}, 1.0)"
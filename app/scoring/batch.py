@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Sequence
+
+from app.models.schemas import IntentLabel
+from app.scoring.address import ADDRESS_BONUSES, AddressBonus
+from app.scoring.hot_lead import is_hot_lead
+
+
+@dataclass
+class AddressColumns:
+    """Address fields needed for scoring, one typed array per column."""
+
+    owner_id: list[str] = field(default_factory=list)
+    confidence: array = field(default_factory=lambda: array("d"))
+    is_deliverable: array = field(default_factory=lambda: array("b"))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable) -> AddressColumns:
+        columns = cls()
+        for row in rows:
+            columns.owner_id.append(row["owner_id"])
+            columns.confidence.append(row["confidence"])
+            columns.is_deliverable.append(bool(row["is_deliverable"]))
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.owner_id)
+
+
+def address_scores(
+    columns: AddressColumns, bonuses: list[AddressBonus] = ADDRESS_BONUSES
+) -> array:
+    """Column-at-a-time ``address_score``.
+
+    Each bonus is applied as one pass over the whole column, in the same
+    order and with the same float operations as the scalar function, so the
+    results are bit-for-bit identical.
+    """
+    scores = array("d", columns.confidence)
+    for rule in bonuses:
+        bonus = rule.bonus
+        hits = rule.column_mask(columns)
+        scores = array("d", [score + bonus if hit else score for score, hit in zip(scores, hits)])
+    # Written as min(score, 1.0) evaluates it.
+    return array("d", [1.0 if 1.0 < score else score for score in scores])
+
+
+def max_by_owner(owner_ids: Sequence[str], scores: Sequence[float]) -> dict[str, float]:
+    best: dict[str, float] = {}
+    get = best.get
+    for owner_id, score in zip(owner_ids, scores):
+        current = get(owner_id)
+        if current is None or score > current:
+            best[owner_id] = score
+    return best
+
+
+def hot_lead_flags(
+    intents: Sequence[IntentLabel | str], message_counts: Sequence[int]
+) -> list[bool]:
+    """``is_hot_lead`` over parallel intent and message-count columns."""
+    return [
+        is_hot_lead(IntentLabel(intent), count) for intent, count in zip(intents, message_counts)
+    ]
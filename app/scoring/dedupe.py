@@ -1,21 +1,225 @@
 from __future__ import annotations
 
+import gc
 import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator
 
+DEDUPE_THRESHOLD = 0.9
+# Owner names repeat heavily across leases and permits; the caches are
+# bounded so a full rebuild over millions of names cannot grow them.
+NAME_CACHE_SIZE = 32_768
+# How many names an index takes between gc.freeze calls under frozen_gc.
+GC_FREEZE_INTERVAL = 50_000
 
+_NON_ALNUM = re.compile(r"[^A-Za-z0-9 ]")
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def normalize_name(name: str) -> str:
-    normalized = re.sub(r"[^A-Za-z0-9 ]", " ", name).upper()
-    return " ".join(normalized.split())
+    return " ".join(_NON_ALNUM.sub(" ", name).upper().split())
 
 
-def dedupe_score(name_a: str, name_b: str) -> float:
-    norm_a = normalize_name(name_a)
-    norm_b = normalize_name(name_b)
-    if norm_a == norm_b:
+@dataclass(frozen=True, slots=True)
+class MatchKey:
+    """A normalized owner name and its token set, computed once per name."""
+
+    normalized: str
+    tokens: frozenset[str]
+
+    @classmethod
+    def from_normalized(cls, normalized: str) -> MatchKey:
+        return cls(normalized, frozenset(normalized.split()))
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def match_key(name: str) -> MatchKey:
+    return MatchKey.from_normalized(normalize_name(name))
+
+
+def match_score(key_a: MatchKey, key_b: MatchKey) -> float:
+    if key_a.normalized == key_b.normalized:
         return 1.0
-    tokens_a = set(norm_a.split())
-    tokens_b = set(norm_b.split())
+    tokens_a = key_a.tokens
+    tokens_b = key_b.tokens
     if not tokens_a or not tokens_b:
         return 0.0
     overlap = len(tokens_a & tokens_b) / max(len(tokens_a), len(tokens_b))
     return round(overlap, 2)
+
+
+def dedupe_score(name_a: str, name_b: str) -> float:
+    return match_score(match_key(name_a), match_key(name_b))
+
+
+_frozen_lock = threading.Lock()
+_frozen_depth = 0
+
+
+@contextmanager
+def frozen_gc() -> Iterator[None]:
+    """Keep a growing match index out of the collector's full collections.
+
+    An index over a large owner base holds one frozenset per owner, and each
+    full collection rescans all of them, which costs more than the matching
+    itself. Inside this block ``gc.freeze`` moves the objects that exist into
+    the permanent generation, and ``OwnerMatchIndex`` freezes again every
+    ``GC_FREEZE_INTERVAL`` names. Collection keeps running for other threads.
+    Everything is unfrozen when the outermost block exits, so cyclic garbage
+    frozen along the way is still collected.
+    """
+    global _frozen_depth
+    with _frozen_lock:
+        _frozen_depth += 1
+        gc.freeze()
+    try:
+        yield
+    finally:
+        with _frozen_lock:
+            _frozen_depth -= 1
+            if not _frozen_depth:
+                gc.unfreeze()
+
+
+@lru_cache(maxsize=256)
+def _min_overlap(size: int, threshold: float) -> int:
+    # Smallest shared-token count that can still round up to the threshold
+    # for a name with `size` tokens; the partner can only push it lower.
+    for overlap in range(1, size + 1):
+        if round(overlap / size, 2) >= threshold:
+            return overlap
+    return size
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _prefix_tokens(tokens: frozenset[str], threshold: float) -> tuple[str, ...]:
+    # Cached per token set: a name is looked up and then usually added.
+    ordered = sorted(tokens)
+    return tuple(ordered[: len(ordered) - _min_overlap(len(ordered), threshold) + 1])
+
+
+@lru_cache(maxsize=4096)
+def _sizes_compatible(size_a: int, size_b: int, threshold: float) -> bool:
+    # The overlap can never exceed the smaller token set.
+    return round(min(size_a, size_b) / max(size_a, size_b), 2) >= threshold
+
+
+@lru_cache(maxsize=256)
+def _compatible_sizes(size: int, threshold: float) -> tuple[int, ...]:
+    # Rounding lets the ratio dip just under the threshold, hence the margin.
+    low = max(1, int(size * threshold) - 1)
+    high = int(size / threshold) + 2
+    return tuple(
+        other for other in range(low, high + 1) if _sizes_compatible(size, other, threshold)
+    )
+
+
+class OwnerMatchIndex:
+    """Blocking index over normalized owner names.
+
+    Names are indexed under a prefix of their sorted tokens (prefix filtering)
+    and bucketed by token count, so only names that share a prefix token and
+    have a compatible length are ever scored. Candidates are scored with
+    ``match_score`` in insertion order, which keeps the first-match-wins
+    behaviour of a linear scan over every known owner.
+
+    Names may be passed as ``MatchKey`` objects or as normalized strings.
+    """
+
+    def __init__(self, threshold: float = DEDUPE_THRESHOLD) -> None:
+        self.threshold = threshold
+        self._keys: list[MatchKey] = []
+        self._owner_ids: list[str] = []
+        self._postings: dict[tuple[str, int], list[int]] = {}
+        self._sizes: set[int] = set()
+        self._compatible: dict[int, list[int]] = {}
+        self._empty: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: MatchKey | str, owner_id: str) -> None:
+        key = _as_key(key)
+        position = len(self._keys)
+        self._keys.append(key)
+        self._owner_ids.append(owner_id)
+        if _frozen_depth and position % GC_FREEZE_INTERVAL == GC_FREEZE_INTERVAL - 1:
+            gc.freeze()
+        tokens = key.tokens
+        if not tokens:
+            if self._empty is None:
+                self._empty = position
+            return
+        size = len(tokens)
+        if size not in self._sizes:
+            self._sizes.add(size)
+            self._compatible.clear()
+        for token in _prefix_tokens(tokens, self.threshold):
+            self._postings.setdefault((token, size), []).append(position)
+
+    def blocking_tokens(self, key: MatchKey | str) -> tuple[str, ...]:
+        """Tokens a name is indexed under.
+
+        Two names that share none of these can never be each other's
+        candidates. Empty names all block together under ``""``.
+        """
+        tokens = _as_key(key).tokens
+        if not tokens:
+            return ("",)
+        return _prefix_tokens(tokens, self.threshold)
+
+    def posting_keys(self, key: MatchKey | str) -> list[tuple[str, int]]:
+        """``(token, token count)`` pairs a name is stored under."""
+        tokens = _as_key(key).tokens
+        if not tokens:
+            return [("", 0)]
+        size = len(tokens)
+        return [(token, size) for token in _prefix_tokens(tokens, self.threshold)]
+
+    def lookup_keys(self, key: MatchKey | str) -> list[tuple[str, int]]:
+        """``(token, token count)`` pairs that hold every candidate for a name.
+
+        Owners stored under none of these can never match it, so a persistent
+        copy of ``posting_keys`` can be loaded just for the names at hand.
+        """
+        tokens = _as_key(key).tokens
+        if not tokens:
+            return [("", 0)]
+        sizes = _compatible_sizes(len(tokens), self.threshold)
+        return [
+            (token, other)
+            for token in _prefix_tokens(tokens, self.threshold)
+            for other in sizes
+        ]
+
+    def candidates(self, key: MatchKey | str) -> list[int]:
+        tokens = _as_key(key).tokens
+        if not tokens:
+            return [] if self._empty is None else [self._empty]
+        size = len(tokens)
+        sizes = self._compatible.get(size)
+        if sizes is None:
+            sizes = self._compatible[size] = [
+                other
+                for other in self._sizes
+                if _sizes_compatible(size, other, self.threshold)
+            ]
+        positions: set[int] = set()
+        for token in _prefix_tokens(tokens, self.threshold):
+            for other in sizes:
+                positions.update(self._postings.get((token, other), ()))
+        return sorted(positions)
+
+    def match(self, key: MatchKey | str) -> str | None:
+        key = _as_key(key)
+        for position in self.candidates(key):
+            if match_score(key, self._keys[position]) >= self.threshold:
+                return self._owner_ids[position]
+        return None
+
+
+def _as_key(key: MatchKey | str) -> MatchKey:
+    return key if isinstance(key, MatchKey) else MatchKey.from_normalized(key)
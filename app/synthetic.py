@@ -0,0 +1,115 @@
+"""Synthetic owner records and inbound replies, shared by tests and benchmarks."""
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from app.models.schemas import IntentLabel
+
+FIRST_NAMES = [
+    "JANET", "ROBERT", "MARY", "JAMES", "LINDA", "MICHAEL", "PATRICIA", "DAVID",
+    "BARBARA", "WILLIAM", "SUSAN", "RICHARD", "KAREN", "THOMAS", "NANCY", "DONALD",
+]
+LAST_NAMES = [
+    "MILLER", "BARKER", "SMITH", "JOHNSON", "WILLIAMS", "BROWN", "JONES", "DAVIS",
+    "WILSON", "ANDERSON", "TAYLOR", "THOMAS", "MOORE", "MARTIN", "JACKSON", "WHITE",
+    "HARRIS", "CLARK", "LEWIS", "WALKER", "HALL", "ALLEN", "YOUNG", "KING",
+]
+ENTITY_WORDS = [
+    "RIDGE", "CREEK", "VALLEY", "PRAIRIE", "MESA", "CANYON", "BASIN", "RIVER",
+    "OAK", "PINE", "CEDAR", "EAGLE", "HAWK", "STONE", "IRON", "SILVER",
+]
+STREETS = ["ELM", "OAK", "MAIN", "RIDGE", "MAPLE", "CEDAR", "PARK", "LAKE", "HILL"]
+STREET_TYPES = ["ST", "STREET", "RD", "ROAD", "AVE", "DR", "LN"]
+CITIES = [
+    ("CANTON", "OH", "447"), ("MARIETTA", "OH", "457"), ("MIDLAND", "TX", "797"),
+    ("ODESSA", "TX", "797"), ("TULSA", "OK", "741"), ("WILLISTON", "ND", "588"),
+    ("CASPER", "WY", "826"), ("FARMINGTON", "NM", "874"),
+]
+
+
+def owner_name(rng: random.Random) -> str:
+    """Draw an owner name from a mix of people, trusts, LLCs and estates."""
+    roll = rng.random()
+    first = rng.choice(FIRST_NAMES)
+    last = rng.choice(LAST_NAMES)
+    suffix = rng.randint(1, 250_000)
+    if roll < 0.45:
+        middle = f" {rng.choice('ABCDEFGHJKLMRST')}." if rng.random() < 0.3 else ""
+        return f"{first}{middle} {last} {suffix}"
+    if roll < 0.65:
+        return f"{last} {suffix} Family Trust"
+    if roll < 0.85:
+        words = " ".join(rng.sample(ENTITY_WORDS, 2))
+        return f"{words} {suffix} Minerals, LLC"
+    return f"Estate of {first} {last} {suffix}"
+
+
+def source_rows(count: int, seed: int = 7) -> Iterator[dict[str, str]]:
+    """Yield ``count`` source-record shaped rows with realistic duplication."""
+    rng = random.Random(seed)
+    seen: list[str] = []
+    for index in range(count):
+        if seen and rng.random() < 0.3:
+            name = rng.choice(seen)
+        else:
+            name = owner_name(rng)
+            if len(seen) < 10_000:
+                seen.append(name)
+        city, state, zip_prefix = rng.choice(CITIES)
+        yield {
+            "owner_name": name,
+            "source_type": "lease" if index % 2 == 0 else "permit",
+            "source_id": f"SYN-{index}",
+            "address_line1": (
+                f"{rng.randint(1, 9999)} {rng.choice(STREETS)} {rng.choice(STREET_TYPES)}"
+            ),
+            "city": city,
+            "state": state,
+            "postal_code": f"{zip_prefix}{rng.randint(0, 99):02d}",
+        }
+
+
+CANNED_REPLIES = [
+    "STOP", "Stop", "Yes", "yes", "YES please", "Who is this?", "Not now",
+    "Unsubscribe", "Call me", "Never", "Maybe later", "What's the offer?",
+]
+REPLY_OPENERS = [
+    "Hi, this is {first}.", "{first} {last} here.", "Got your letter.", "Hello,",
+]
+REPLY_BODIES = [
+    "I'm interested in hearing an offer on the {county} county acreage.",
+    "Please do not contact me about the {county} county minerals again.",
+    "Can you call me after 5pm? The lease in {county} county expires soon.",
+    "Not now, we are still settling my father's estate in {county} county.",
+    "How did you get my number? I never signed anything in {county} county.",
+    "What is the per-acre price you pay in {county} county?",
+]
+COUNTIES = ["Reeves", "Midland", "Loving", "Williams", "McKenzie", "Weld", "Kingfisher"]
+
+
+def inbound_messages(count: int, seed: int = 11) -> Iterator[str]:
+    """Yield SMS replies: mostly short canned answers, the rest free text."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        if rng.random() < 0.6:
+            yield rng.choice(CANNED_REPLIES)
+            continue
+        names = {"first": rng.choice(FIRST_NAMES).title(), "last": rng.choice(LAST_NAMES).title()}
+        opener = rng.choice(REPLY_OPENERS).format(**names)
+        body = rng.choice(REPLY_BODIES).format(county=rng.choice(COUNTIES))
+        yield f"{opener} {body} Ref {rng.randint(1, 999_999)}"
+
+
+def chained_classify(message: str) -> IntentLabel:
+    """The original hand-written intent rule chain, kept as the reference."""
+    normalized = message.lower()
+    if "stop" in normalized or "unsubscribe" in normalized:
+        return IntentLabel.stop
+    if "not now" in normalized or "later" in normalized:
+        return IntentLabel.not_now
+    if "never" in normalized or "do not contact" in normalized:
+        return IntentLabel.never
+    if "interested" in normalized or "yes" in normalized or "call me" in normalized:
+        return IntentLabel.interested
+    return IntentLabel.curious
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import pytest
+
+from app.db import api_store, database
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "owners.db")
+    monkeypatch.setattr(api_store, "DB_PATH", tmp_path / "api.db")
+    database.run_migrations()
+    api_store.migrate()
+    yield database
+    database.close_connections()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app import api, main
+from app.db import database
+
+CSV = (
+    "Owner_Name,Mailing_Address,County,Source\n"
+    "Janet Miller,123 Elm St,Stark,lease\n"
+    "janet  miller,123 Elm St,Wayne,permit\n"
+    ",no owner,Stark,lease\n"
+    '"Barker, Family Trust","45 Ridge Rd\nUnit 2",Washington,lease\n'
+)
+
+
+def upload(text: str, filename: str = "owners.csv") -> UploadFile:
+    return UploadFile(file=io.BytesIO(text.encode("utf-8")), filename=filename)
+
+
+def test_ingest_streams_rows_into_storage(db, monkeypatch):
+    monkeypatch.setattr(main, "INGEST_BATCH_SIZE", 2)
+    result = main.ingest(upload(CSV))
+    assert result["ingested"] == 3
+    assert result["total_raw_records"] == 3
+    assert result["rows_per_second"] > 0
+
+    dedupe = main.run_dedupe()
+    assert dedupe["canonical_owners"] == 2
+    assert dedupe["duplicates_collapsed"] == 1
+
+
+def test_dedupe_folds_only_new_records_and_owners_page_by_cursor(db):
+    main.ingest(upload(CSV))
+    assert main.run_dedupe()["records_folded"] == 3
+    assert main.run_dedupe()["records_folded"] == 0
+
+    main.ingest(upload("owner_name,mailing_address,county\nJanet Miller,123 Elm St,Summit\nNew Owner,,\n"))
+    dedupe = main.run_dedupe()
+    assert dedupe["records_folded"] == 2
+    assert dedupe["duplicates_collapsed"] == 1
+    assert dedupe["canonical_owners"] == 3
+
+    first = main.list_owners(limit=2)
+    assert first["count"] == 2
+    janet = first["owners"][0]
+    assert janet["counties"] == ["Stark", "Summit", "Wayne"]
+    assert janet["sources"] == ["lease", "permit"]
+    assert len(janet["records"]) == 3
+    second = main.list_owners(limit=2, cursor=first["next_cursor"])
+    assert [owner["owner_name"] for owner in second["owners"]] == ["New Owner"]
+    assert second["next_cursor"] is None
+
+    # A pipeline rebuild leaves uploaded records and owners alone.
+    database.drop_database()
+    database.run_migrations()
+    assert main.list_owners(limit=3)["count"] == 3
+    assert main.run_dedupe()["records_folded"] == 0
+
+    main.reset_all()
+    assert main.list_owners()["count"] == 0
+
+
+def test_pipeline_owner_listing_pages_by_keyset_cursor(db):
+    with database.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO owners (id, canonical_name, created_at, score) VALUES (?, ?, '', ?)",
+            [(f"own-{index}", f"Owner {index}", index / 10) for index in range(5)],
+        )
+    first = api.get_owners(limit=2, fields="id,score", min_score=0.1, output="json")
+    assert first["owners"] == [{"id": "own-4", "score": 0.4}, {"id": "own-3", "score": 0.3}]
+    second = api.get_owners(limit=2, cursor=first["next_cursor"], min_score=0.1, output="json")
+    assert [owner["id"] for owner in second["owners"]] == ["own-2", "own-1"]
+
+    response = api.get_owners(fields="id", output="ndjson")
+
+    async def collect():
+        return [chunk async for chunk in response.body_iterator]
+
+    lines = asyncio.run(collect())
+    assert [json.loads(line)["id"] for line in lines] == [f"own-{index}" for index in range(4, -1, -1)]
+
+    with pytest.raises(HTTPException):
+        api.get_owners(fields="id,password", output="json")
+
+
+def test_inbound_webhook_micro_batches_concurrent_requests(db, monkeypatch):
+    batches = []
+
+    def handle(messages):
+        batches.append(len(messages))
+        return api.ai_inbound_handler(
+            api.IntentClassifier(),
+            api.ResponseGenerator(api.SchedulingLink(url="https://cal.example.com")),
+            messages,
+        )
+
+    monkeypatch.setattr(api, "inbound_batcher", api.InboundBatcher(handle, max_batch_size=4))
+    replies = ["STOP", "yes please", "who is this?", "not now", "call me", "never"]
+
+    async def burst():
+        return await asyncio.gather(
+            *(
+                api.receive_inbound(api.InboundMessage(owner_id=f"owner-{i}", message=text))
+                for i, text in enumerate(replies)
+            )
+        )
+
+    results = asyncio.run(burst())
+    assert [result["intent"] for result in results] == [
+        "stop", "interested", "curious", "not_now", "interested", "never"
+    ]
+    assert batches == [4, 2]
+    with database.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) AS count FROM inbound_messages").fetchone()["count"] == 6
+        suppressed = {row["owner_id"] for row in conn.execute("SELECT owner_id FROM suppression")}
+    assert suppressed == {"owner-0", "owner-5"}
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pytest
+
+from app.ai.inbound_handler import IntentClassifier
+from app.models.schemas import IntentLabel
+from app.synthetic import chained_classify, inbound_messages
+
+
+@pytest.mark.parametrize(
+    "message, intent",
+    [
+        ("Yes but STOP texting", IntentLabel.stop),
+        ("Unsubscribe, not now", IntentLabel.stop),
+        ("Not now, I will never sell", IntentLabel.not_now),
+        ("Never. Do not contact me", IntentLabel.never),
+        ("Do not contact me, I'm not interested", IntentLabel.never),
+        ("Call me tomorrow", IntentLabel.interested),
+        ("Who is this?", IntentLabel.curious),
+        ("", IntentLabel.curious),
+    ],
+)
+def test_classify_keeps_rule_precedence(message, intent):
+    assert IntentClassifier().classify(message) == intent
+
+
+def test_classify_batch_matches_rule_chain():
+    messages = list(inbound_messages(5_000))
+    classifier = IntentClassifier()
+    expected = [chained_classify(message) for message in messages]
+    assert classifier.classify_batch(messages) == expected
+    assert [classifier.classify(message) for message in messages] == expected
@@ -0,0 +1,756 @@
+from __future__ import annotations
+
+import json
+import random
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from app.adapters.base import AddressStandardizer, AddressUpdateProvider
+from app.adapters.mock import (
+    MockAddressStandardizer,
+    MockAddressUpdateProvider,
+    MockAppendVendorClient,
+)
+from app.ai.inbound_handler import IntentClassifier, ResponseGenerator, SchedulingLink
+from app.db import database
+from app.pipeline import jobs, runner
+from app.pipeline.dispatch import ChannelLimits, dispatch_outreach
+from app.pipeline.identity import partition_records, resolve_owners, resolve_owners_parallel
+from app.pipeline.instrumentation import RunReport
+from app.models.schemas import Address
+from app.pipeline.steps import (
+    PipelineConfig,
+    address_standardize,
+    address_update,
+    ai_inbound_handler,
+    dashboard,
+    candidate_owners,
+    dedupe_identity,
+    export_for_append,
+    hot_lead_router,
+    import_appends,
+    index_owner_tokens,
+    ingest,
+    ingest_rows,
+    outreach_queue,
+    queue_entry,
+    score_owners,
+    score_owners_columnar,
+)
+from app.scoring.address import address_score
+from app.scoring.dedupe import OwnerMatchIndex, match_key
+from app.synthetic import source_rows
+
+SAMPLE_DIR = Path("app/sample_data")
+
+
+def count(table: str) -> int:
+    with database.get_connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) AS count FROM {table}").fetchone()["count"]
+
+
+def test_dedupe_identity_only_resolves_new_records(db):
+    ingest([SAMPLE_DIR / "leases.csv"])
+    dedupe_identity()
+    assert (count("owners"), count("addresses")) == (3, 3)
+
+    dedupe_identity()
+    assert (count("owners"), count("addresses")) == (3, 3)
+
+    ingest([SAMPLE_DIR / "permits.csv"])
+    dedupe_identity()
+    # Barker Family Trust merges with the existing owner; the others are new.
+    assert count("owners") == 5
+    assert count("addresses") == 6
+    assert count("source_record_owners") == 6
+
+
+def test_ingest_writes_in_batches(db):
+    stats = ingest([SAMPLE_DIR / "leases.csv", SAMPLE_DIR / "permits.csv"], batch_size=2)
+    assert stats.rows == 6
+    assert stats.seconds > 0
+    assert stats.rows_per_second == stats.rows / stats.seconds
+
+    with database.get_connection() as conn:
+        # The same rows again, in batches of a different size.
+        copied = [dict(row) for row in conn.execute("SELECT * FROM source_records")]
+        assert ingest_rows(conn, copied, batch_size=4).rows == 6
+        ids = {row["id"] for row in conn.execute("SELECT id FROM source_records")}
+        checkpoints = [row["rows"] for row in conn.execute("SELECT rows FROM ingested_files")]
+    assert len(ids) == count("source_records") == 12
+    assert checkpoints == [3, 3]
+    assert dashboard(PipelineConfig()).source_records == 12
+
+
+def test_ingest_resumes_appended_files_and_rejects_rewrites(db, tmp_path):
+    source = tmp_path / "leases.csv"
+    lines = (SAMPLE_DIR / "leases.csv").read_text().splitlines(keepends=True)
+    source.write_text("".join(lines))
+    assert ingest([source]).rows == 3
+
+    source.write_text("".join(lines) + lines[1].replace("LS-1001", "LS-1004"))
+    assert ingest([source]).rows == 1
+    assert ingest([source]).rows == 0
+    assert count("source_records") == 4
+
+    source.write_text("".join(lines).replace("Janet Miller", "Janet Q. Miller"))
+    with pytest.raises(ValueError):
+        ingest([source])
+    assert count("source_records") == 4
+
+
+def test_dedupe_loads_only_candidate_owners(db):
+    ingest([SAMPLE_DIR / "leases.csv"])
+    dedupe_identity()
+    with database.get_connection() as conn:
+        # Simulate owners indexed before owner_match_tokens existed.
+        conn.execute("DELETE FROM owner_match_tokens")
+        conn.execute("DELETE FROM pipeline_watermarks WHERE name = 'owner_match_tokens'")
+        conn.commit()
+
+    ingest([SAMPLE_DIR / "permits.csv"])
+    with database.get_connection() as conn:
+        assert index_owner_tokens(conn) == 3
+        records = conn.execute(
+            "SELECT * FROM source_records WHERE source_id LIKE 'PM-%'"
+        ).fetchall()
+        assert [name for _, name in candidate_owners(conn, records)] == ["Barker Family Trust"]
+        conn.commit()
+    dedupe_identity()
+    assert count("owners") == 5
+    assert count("owner_match_tokens") == 5
+
+
+def test_parallel_dedupe_matches_serial_run():
+    rows = list(source_rows(3000, seed=5))
+    rows += [
+        {**rows[0], "owner_name": name}
+        for name in ["", "!!", "A B C D E F G H I J", "B C D E F G H I J K", "A B C D E F G H I K"]
+    ]
+    records = [{**row, "id": f"src-{position}"} for position, row in enumerate(rows)]
+    existing = [(f"own-existing-{position}", row["owner_name"]) for position, row in enumerate(rows[:200:3])]
+
+    index = OwnerMatchIndex()
+    for owner_id, name in existing:
+        index.add(match_key(name), owner_id)
+    serial = resolve_owners(index, records)
+    parallel = resolve_owners_parallel(existing, records, workers=3)
+
+    def canonical(resolved):
+        owners, addresses, links = resolved
+        ids = {owner[0]: f"new-{position}" for position, owner in enumerate(owners)}
+        return (
+            [owner[1] for owner in owners],
+            [ids.get(address[1], address[1]) for address in addresses],
+            [(link[0], ids.get(link[1], link[1])) for link in links],
+        )
+
+    assert canonical(parallel) == canonical(serial)
+    assert len(partition_records(existing, records, "blocking_token", 3)) == 3
+    with pytest.raises(ValueError):
+        partition_records(existing, records, "state", 3)
+
+
+def test_parallel_dedupe_identity_resolves_like_serial(db):
+    ingest([SAMPLE_DIR / "leases.csv"])
+    dedupe_identity(workers=2)
+    assert (count("owners"), count("addresses")) == (3, 3)
+
+    ingest([SAMPLE_DIR / "permits.csv"])
+    dedupe_identity(workers=2)
+    assert count("owners") == 5
+    assert count("addresses") == 6
+    assert count("source_record_owners") == 6
+
+
+def test_address_steps_process_every_chunk(db):
+    ingest([SAMPLE_DIR / "leases.csv", SAMPLE_DIR / "permits.csv"])
+    dedupe_identity()
+    address_update(MockAddressUpdateProvider(max_batch_size=2), batch_size=4, max_workers=3)
+    address_standardize(MockAddressStandardizer(), batch_size=4, max_workers=3)
+    with database.get_connection() as conn:
+        rows = conn.execute("SELECT confidence, city FROM addresses").fetchall()
+    assert len(rows) == 6
+    assert all(row["confidence"] == 0.6 for row in rows)
+    assert all(row["city"].isupper() for row in rows)
+
+
+def test_address_steps_match_validated_adapter_path(db):
+    class ValidatingProvider(MockAddressUpdateProvider):
+        update_records = AddressUpdateProvider.update_records
+
+    class ValidatingStandardizer(MockAddressStandardizer):
+        standardize_records = AddressStandardizer.standardize_records
+
+    ingest([SAMPLE_DIR / "leases.csv", SAMPLE_DIR / "permits.csv"])
+    dedupe_identity()
+    columns = "id, line1, city, state, postal_code, confidence, is_deliverable"
+
+    def snapshot():
+        with database.get_connection() as conn:
+            return [tuple(row) for row in conn.execute(f"SELECT {columns} FROM addresses")]
+
+    address_update(ValidatingProvider())
+    address_standardize(ValidatingStandardizer())
+    validated = snapshot()
+    with database.get_connection() as conn:
+        conn.execute("UPDATE addresses SET update_version = NULL, standardize_version = NULL")
+        conn.execute("UPDATE addresses SET confidence = 0.5, city = lower(city)")
+        conn.commit()
+    address_update(MockAddressUpdateProvider())
+    address_standardize(MockAddressStandardizer())
+    assert snapshot() == validated
+
+
+def test_address_steps_only_write_dirty_rows(db):
+    ingest([SAMPLE_DIR / "leases.csv"])
+    dedupe_identity()
+    with database.get_connection() as conn:
+        conn.execute(
+            "UPDATE addresses SET line1 = UPPER(line1), city = UPPER(city)"
+            " WHERE line1 = '123 Elm St'"
+        )
+    first = address_standardize(MockAddressStandardizer())
+    assert (first.changed, first.unchanged, first.skipped) == (2, 1, 0)
+
+    with database.count_queries() as counters:
+        again = address_standardize(MockAddressStandardizer())
+    assert (again.changed, again.unchanged, again.skipped) == (0, 0, 3)
+    # Only the address counter is read when nothing is dirty.
+    assert counters.rows_read == 1
+
+    provider = MockAddressUpdateProvider()
+    provider.version = "2"
+    assert address_update(provider).changed == 3
+    assert address_update(provider).skipped == 3
+
+
+def test_address_update_changes_are_standardized_again(db):
+    class MovingProvider(MockAddressUpdateProvider):
+        def update_records(self, records):
+            return [replace(record, line1="99 new st", city="akron") for record in records]
+
+    ingest([SAMPLE_DIR / "leases.csv"])
+    dedupe_identity()
+    address_update(MockAddressUpdateProvider())
+    assert address_standardize(MockAddressStandardizer()).changed == 3
+
+    provider = MovingProvider()
+    provider.version = "2"
+    assert address_update(provider).changed == 3
+    restandardized = address_standardize(MockAddressStandardizer())
+    assert (restandardized.changed, restandardized.skipped) == (3, 0)
+    with database.get_connection() as conn:
+        rows = conn.execute("SELECT line1, city FROM addresses").fetchall()
+    assert {(row["line1"], row["city"]) for row in rows} == {("99 NEW ST", "AKRON")}
+
+
+def test_run_report_records_stage_metrics(db):
+    report = RunReport()
+    with report.stage("ingest"):
+        ingest([SAMPLE_DIR / "leases.csv"])
+    with report.stage("dedupe_identity"):
+        dedupe_identity()
+    report.finish()
+    ingest_metrics, dedupe_metrics = report.stages
+    # Records, the dashboard counter bump, and the file checkpoints.
+    assert ingest_metrics.rows_written == 3 + 1 + 2
+    assert ingest_metrics.sql_statements >= 3
+    assert dedupe_metrics.rows_read >= 3
+    # Owners, addresses, links and the watermark, counter bumps for owners,
+    # addresses and deliverable addresses, then match tokens and their watermark.
+    assert dedupe_metrics.rows_written == 3 + 3 + 3 + 1 + 3 + 3 + 3 + 3 + 1
+    assert report.to_dict()["stages"][0]["name"] == "ingest"
+
+
+def test_connections_are_pooled_with_wal(db):
+    with database.get_connection() as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        first = id(conn)
+    with database.get_connection() as conn:
+        assert id(conn) == first
+    assert mode == "wal"
+
+
+def test_pooled_connections_are_dropped_after_rebuild(db):
+    # Stands in for the pool of another worker process.
+    other = database.ConnectionPool(database.DB_PATH)
+    stale = other.acquire()
+    other.release(stale)
+    with database.get_connection() as streaming:
+        database.drop_database()
+        database.run_migrations()
+        with database.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO owners (id, canonical_name, created_at, score)"
+                " VALUES ('own-1', 'A', '', 0)"
+            )
+            conn.commit()
+    fresh = other.acquire()
+    assert fresh is not stale
+    assert fresh.execute("SELECT COUNT(*) FROM owners").fetchone()[0] == 1
+    other.release(fresh)
+    with database.get_connection() as conn:
+        assert conn is not streaming
+        assert conn.execute("SELECT COUNT(*) FROM owners").fetchone()[0] == 1
+
+
+def test_score_owners_matches_address_score(db):
+    addresses = [
+        Address(id="a1", owner_id="o1", line1="1 A", city="C", state="OH",
+                postal_code="1", confidence=0.95, is_deliverable=True),
+        Address(id="a2", owner_id="o1", line1="2 A", city="C", state="OH",
+                postal_code="1", confidence=0.55, is_deliverable=True),
+        Address(id="a3", owner_id="o2", line1="3 A", city="C", state="OH",
+                postal_code="1", confidence=0.7, is_deliverable=False),
+        Address(id="a4", owner_id="o2", line1="4 A", city="C", state="OH",
+                postal_code="1", confidence=0.6, is_deliverable=True),
+    ]
+    with database.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO owners (id, canonical_name, created_at, score) VALUES (?, ?, '', 0)",
+            [("o1", "One"), ("o2", "Two"), ("o3", "No Address")],
+        )
+        conn.executemany(
+            "INSERT INTO addresses (id, owner_id, line1, city, state, postal_code,"
+            " confidence, is_deliverable, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, '')",
+            [
+                (a.id, a.owner_id, a.line1, a.city, a.state, a.postal_code,
+                 a.confidence, int(a.is_deliverable))
+                for a in addresses
+            ],
+        )
+    score_owners()
+    with database.get_connection() as conn:
+        sql_scores = {row["id"]: row["score"] for row in conn.execute("SELECT id, score FROM owners")}
+        conn.execute("UPDATE owners SET score = 0")
+        conn.commit()
+    assert score_owners_columnar() == 2
+    expected = {"o3": 0.0}
+    for address in addresses:
+        score = address_score(address)
+        expected[address.owner_id] = max(expected.get(address.owner_id, 0.0), score)
+    with database.get_connection() as conn:
+        scores = {row["id"]: row["score"] for row in conn.execute("SELECT id, score FROM owners")}
+        conn.execute("UPDATE owners SET score = 0")
+        conn.commit()
+    assert scores == sql_scores == expected
+
+    runner.stage_score_owners(
+        runner.PipelineContext(SAMPLE_DIR, PipelineConfig(score_engine="columnar"))
+    )
+    with database.get_connection() as conn:
+        staged = {row["id"]: row["score"] for row in conn.execute("SELECT id, score FROM owners")}
+    assert staged == expected
+
+
+def test_outreach_queue_applies_rules_and_skips_pending_owners(db):
+    recent = datetime.utcnow().isoformat()
+    stale = (datetime.utcnow() - timedelta(days=30)).isoformat()
+    with database.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO owners (id, canonical_name, created_at, score) VALUES (?, ?, '', 0)",
+            [(owner_id, owner_id) for owner_id in ("o1", "o2", "o3", "o4")],
+        )
+        conn.executemany(
+            "INSERT INTO contacts VALUES (?, ?, ?, ?, ?, ?, '')",
+            [
+                ("c1", "o1", "5551", "phone", "mobile", 0.85),
+                ("c2", "o1", "o1@example.com", "email", None, 0.8),
+                ("c3", "o2", "5552", "phone", "mobile", 0.85),
+                ("c4", "o3", "5553", "phone", "mobile", 0.85),
+                ("c5", "o4", "5554", "phone", "landline", 0.85),
+            ],
+        )
+        conn.execute("INSERT INTO suppression VALUES ('o2', 'stop', ?)", (recent,))
+        conn.executemany(
+            "INSERT INTO contact_attempts VALUES (?, ?, 'sms', 'sent', ?)",
+            [("t1", "o3", recent), ("t2", "o3", recent), ("t3", "o4", stale), ("t4", "o4", stale)],
+        )
+    outreach_queue(PipelineConfig())
+    outreach_queue(PipelineConfig())
+    with database.get_connection() as conn:
+        queued = sorted(
+            (row["owner_id"], row["channel"])
+            for row in conn.execute("SELECT owner_id, channel FROM outreach_queue")
+        )
+    assert queued == [
+        ("o1", "email"),
+        ("o1", "ringless_voicemail"),
+        ("o1", "sms"),
+        ("o4", "ringless_voicemail"),
+    ]
+
+
+def test_dashboard_counters_match_full_recount(db):
+    ingest([SAMPLE_DIR / "leases.csv", SAMPLE_DIR / "permits.csv"])
+    dedupe_identity()
+    address_update(MockAddressUpdateProvider())
+    now = datetime.utcnow()
+    with database.get_connection() as conn:
+        owner_ids = [row["id"] for row in conn.execute("SELECT id FROM owners")]
+        conn.executemany(
+            "INSERT INTO contacts (id, owner_id, value, contact_type, phone_type, confidence, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                ("c1", owner_ids[0], "555-0001", "phone", "mobile", 0.9, now.isoformat()),
+                ("c2", owner_ids[1], "555-0002", "phone", "mobile", 0.5, now.isoformat()),
+                ("c3", owner_ids[2], "555-0003", "phone", "landline", 0.95, now.isoformat()),
+            ],
+        )
+        # Replacing and updating rows must move them between buckets.
+        conn.execute(
+            "INSERT OR REPLACE INTO contacts (id, owner_id, value, contact_type, phone_type, confidence, updated_at)"
+            " VALUES ('c2', ?, '555-0002', 'phone', 'mobile', 0.8, ?)",
+            (owner_ids[1], now.isoformat()),
+        )
+        conn.execute("UPDATE contacts SET phone_type = 'mobile' WHERE id = 'c3'")
+        conn.execute("UPDATE addresses SET is_deliverable = 0 WHERE owner_id = ?", (owner_ids[0],))
+        conn.executemany(
+            "INSERT OR REPLACE INTO hot_leads (owner_id, reason, created_at) VALUES (?, 'test', ?)",
+            [
+                (owner_ids[0], (now - timedelta(hours=2)).isoformat()),
+                (owner_ids[1], (now - timedelta(hours=23, minutes=59)).isoformat()),
+                (owner_ids[2], (now - timedelta(days=2)).isoformat()),
+                (owner_ids[0], (now - timedelta(minutes=5)).isoformat()),
+            ],
+        )
+        conn.commit()
+
+    config = PipelineConfig()
+    counted = dashboard(config)
+    recounted = dashboard(config, recount=True)
+    assert counted.refreshed_at is not None
+    counted.refreshed_at = recounted.refreshed_at = None
+    assert counted == recounted
+    assert (counted.source_records, counted.contacts, counted.daily_hot_leads) == (6, 3, 2)
+    assert counted.mobile_confirmed == 3
+
+
+def test_confidence_counters_use_a_fixed_grid(db):
+    rng = random.Random(4)
+    confidences = [round(rng.random(), 6) for _ in range(3000)] + [0.29, 0.6, 0.7, 0.7345, 1.0]
+    with database.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO contacts (id, owner_id, value, contact_type, phone_type, confidence, updated_at)"
+            " VALUES (?, 'o1', '', 'phone', 'mobile', ?, '')",
+            [(f"c{position}", confidence) for position, confidence in enumerate(confidences)],
+        )
+        conn.commit()
+        buckets = conn.execute(
+            "SELECT COUNT(*) FROM dashboard_counters WHERE metric = 'mobile_contacts'"
+        ).fetchone()[0]
+    assert buckets <= 1001
+    for threshold in (0.0, 0.29, 0.6, 0.7, 0.7345, 0.99999, 1.0):
+        config = PipelineConfig(sms_confidence_threshold=threshold)
+        expected = sum(1 for confidence in confidences if confidence >= threshold)
+        assert dashboard(config).mobile_confirmed == expected
+        assert dashboard(config, recount=True).mobile_confirmed == expected
+
+
+def test_hot_lead_router_only_evaluates_new_messages(db):
+    ingest([SAMPLE_DIR / "leases.csv"])
+    dedupe_identity()
+    with database.get_connection() as conn:
+        first, second, third = [row["id"] for row in conn.execute("SELECT id FROM owners")]
+        # Stored before intents were persisted; the router labels it itself.
+        conn.execute(
+            "INSERT INTO inbound_messages (id, owner_id, channel, message, created_at)"
+            " VALUES ('legacy', ?, 'sms', 'Who is this?', '2024-01-01T00:00:00')",
+            (first,),
+        )
+        conn.commit()
+    ai_inbound = [
+        {"owner_id": second, "channel": "sms", "message": "Yes, I'm interested"},
+        {"owner_id": third, "channel": "sms", "message": "What is this about?"},
+    ]
+    responder = ResponseGenerator(SchedulingLink(url="https://example.com"))
+    ai_inbound_handler(IntentClassifier(), responder, ai_inbound)
+    hot_lead_router()
+    with database.get_connection() as conn:
+        assert conn.execute(
+            "SELECT COUNT(*) AS count FROM inbound_messages WHERE intent IS NULL"
+        ).fetchone()["count"] == 0
+        leads = {row["owner_id"]: row["reason"] for row in conn.execute("SELECT * FROM hot_leads")}
+    assert leads == {second: "intent:interested|messages:1"}
+
+    with database.count_queries() as counters:
+        hot_lead_router()
+    assert counters.rows_written == 0
+
+    ai_inbound_handler(
+        IntentClassifier(),
+        responder,
+        [{"owner_id": first, "channel": "sms", "message": "Tell me more"}],
+    )
+    hot_lead_router()
+    with database.get_connection() as conn:
+        leads = {row["owner_id"]: row["reason"] for row in conn.execute("SELECT * FROM hot_leads")}
+        stats = conn.execute(
+            "SELECT message_count FROM owner_message_stats WHERE owner_id = ?", (first,)
+        ).fetchone()
+    assert stats["message_count"] == 2
+    assert leads == {
+        second: "intent:interested|messages:1",
+        first: "intent:curious|messages:2",
+    }
+
+
+def test_ai_inbound_handler_applies_batch_in_order(db):
+    ingest([SAMPLE_DIR / "leases.csv"])
+    dedupe_identity()
+    with database.get_connection() as conn:
+        first, second, third = [row["id"] for row in conn.execute("SELECT id FROM owners")]
+        conn.executemany(
+            "INSERT INTO outreach_queue (id, owner_id, channel, payload, scheduled_for, status)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                queue_entry(owner_id, "sms", {}, "2024-01-01T00:00:00")
+                for owner_id in (first, second, third)
+            ],
+        )
+        conn.execute(
+            "INSERT INTO outreach_queue (id, owner_id, channel, payload, scheduled_for, status)"
+            " VALUES ('q-sent', ?, 'email', '{}', '2023-12-01T00:00:00', 'sent')",
+            (first,),
+        )
+        conn.commit()
+
+    intents = ai_inbound_handler(
+        IntentClassifier(),
+        ResponseGenerator(SchedulingLink(url="https://example.com")),
+        [
+            {"owner_id": first, "channel": "sms", "message": "STOP"},
+            {"owner_id": first, "channel": "sms", "message": "I will never sell"},
+            {"owner_id": second, "channel": "sms", "message": "Yes"},
+            {"owner_id": third, "channel": "sms", "message": "Unsubscribe"},
+        ],
+    )
+    assert [intent.value for intent in intents] == ["stop", "never", "interested", "stop"]
+    with database.get_connection() as conn:
+        suppression = {
+            row["owner_id"]: row["reason"] for row in conn.execute("SELECT * FROM suppression")
+        }
+        queued = {
+            (row["owner_id"], row["status"])
+            for row in conn.execute("SELECT owner_id, status FROM outreach_queue")
+        }
+    assert suppression == {first: "never", third: "stop"}
+    # Pending sends are cancelled; the send history stays.
+    assert queued == {(second, "queued"), (first, "sent")}
+    assert count("inbound_messages") == count("contact_attempts") == 4
+
+
+def test_sample_inbound_messages_are_injected_once(db):
+    ingest([SAMPLE_DIR / "leases.csv"])
+    dedupe_identity()
+    context = runner.PipelineContext(sample_dir=SAMPLE_DIR, config=PipelineConfig())
+    for _ in range(2):
+        runner.stage_ai_inbound_handler(context)
+        runner.stage_hot_lead_router(context)
+    with database.get_connection() as conn:
+        leads = [row["reason"] for row in conn.execute("SELECT reason FROM hot_leads")]
+    assert count("inbound_messages") == count("contact_attempts") == 3
+    assert leads == ["intent:interested|messages:1"]
+
+
+class RecordingClient:
+    def __init__(self, fail_for: str | None = None) -> None:
+        self.fail_for = fail_for
+        self.sent: list[tuple[str, str]] = []
+
+    def send(self, owner_id: str, target: str, message: str) -> str:
+        if owner_id == self.fail_for:
+            raise RuntimeError("carrier rejected")
+        self.sent.append((owner_id, target))
+        return f"msg-{owner_id}"
+
+
+def test_dispatch_outreach_sends_due_rows_once(db):
+    now = datetime.utcnow()
+    past = (now - timedelta(minutes=1)).isoformat()
+    entries = [
+        queue_entry("due-sms", "sms", {"phone": "555-0001"}, past),
+        queue_entry("bad-sms", "sms", {"phone": "555-0002"}, past),
+        queue_entry("due-email", "email", {"email": "a@example.com"}, past),
+        queue_entry("later", "sms", {"phone": "555-0003"}, (now + timedelta(hours=1)).isoformat()),
+        queue_entry("opted-out", "sms", {"phone": "555-0004"}, past),
+    ]
+    with database.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO outreach_queue (id, owner_id, channel, payload, scheduled_for, status)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            entries,
+        )
+        # Claims left behind by crashed workers: one long stale, one recent.
+        conn.executemany(
+            "INSERT INTO outreach_queue (id, owner_id, channel, payload, scheduled_for, status,"
+            " claim_id, claimed_at) VALUES (?, ?, 'sms', '{}', ?, 'sending', 'old', ?)",
+            [
+                ("q-stale", "crashed", past, (now - timedelta(hours=1)).isoformat()),
+                ("q-recent", "in-flight", past, now.isoformat()),
+            ],
+        )
+        conn.execute(
+            "INSERT INTO suppression (owner_id, reason, created_at) VALUES ('opted-out', 'stop', ?)",
+            (now.isoformat(),),
+        )
+        conn.commit()
+
+    sms, email = RecordingClient(fail_for="bad-sms"), RecordingClient()
+    clients = {"sms": sms, "email": email}
+    limits = {"sms": ChannelLimits(concurrency=2, per_second=1000)}
+    with database.count_queries() as counters:
+        stats = dispatch_outreach(clients, limits, batch_size=1)
+    assert (stats.claimed, stats.sent, stats.failed, stats.abandoned) == (3, 2, 1, 1)
+    # Channel threads report to the caller's counters: the stale claim and
+    # three claimed rows are read back, and every queue change is written.
+    assert (counters.rows_read, counters.rows_written) == (4, 15)
+    assert sms.sent == [("due-sms", "555-0001")]
+    assert email.sent == [("due-email", "a@example.com")]
+
+    with database.get_connection() as conn:
+        statuses = {
+            row["owner_id"]: row["status"]
+            for row in conn.execute("SELECT owner_id, status FROM outreach_queue")
+        }
+        attempts = {
+            row["owner_id"]: row["status"]
+            for row in conn.execute("SELECT owner_id, status FROM contact_attempts")
+        }
+    assert statuses == {
+        "due-sms": "sent",
+        "bad-sms": "failed",
+        "due-email": "sent",
+        "later": "queued",
+        "opted-out": "queued",
+        "crashed": "abandoned",
+        "in-flight": "sending",
+    }
+    assert attempts == {
+        "due-sms": "sent:msg-due-sms",
+        "bad-sms": "failed:carrier rejected",
+        "due-email": "sent:msg-due-email",
+        "crashed": "unconfirmed",
+    }
+
+    assert dispatch_outreach(clients, limits).claimed == 0
+    assert len(sms.sent) == len(email.sent) == 1
+    # Only later, opted-out and in-flight are still pending.
+    config = PipelineConfig()
+    assert dashboard(config).outreach_queued == dashboard(config, recount=True).outreach_queued == 3
+
+
+def test_append_handoff_streams_ndjson_and_upserts_contacts(db, tmp_path):
+    ingest([SAMPLE_DIR / "leases.csv", SAMPLE_DIR / "permits.csv"])
+    dedupe_identity()
+    handoff = tmp_path / "append_export.ndjson"
+    client = MockAppendVendorClient()
+
+    assert export_for_append(client, handoff, 0.5) == 6
+    lines = [json.loads(line) for line in handoff.read_text().splitlines()]
+    assert len(lines) == 6
+    assert all(isinstance(line["is_deliverable"], bool) for line in lines)
+
+    assert import_appends(client, handoff, batch_size=4) == 12
+    assert count("contacts") == 10  # one phone and one email per owner
+    with database.get_connection() as conn:
+        conn.execute("UPDATE contacts SET confidence = 0.1")
+        conn.commit()
+
+    import_appends(client, handoff, batch_size=4)
+    assert count("contacts") == 10
+    with database.get_connection() as conn:
+        confidences = {row["confidence"] for row in conn.execute("SELECT confidence FROM contacts")}
+    assert confidences == {0.85, 0.8}
+
+
+def test_run_pipeline_resumes_after_failed_stage(db, monkeypatch):
+    calls = []
+
+    def flaky(context):
+        calls.append("flaky")
+        if len(calls) == 1:
+            raise RuntimeError("vendor down")
+
+    monkeypatch.setattr(
+        runner,
+        "STAGES",
+        {
+            "ingest": runner.stage_ingest,
+            "dedupe_identity": runner.stage_dedupe_identity,
+            "flaky": flaky,
+            "score_owners": runner.stage_score_owners,
+        },
+    )
+    with pytest.raises(RuntimeError):
+        runner.run_pipeline(SAMPLE_DIR)
+    report = runner.run_pipeline(SAMPLE_DIR)
+    assert [(stage.name, stage.error) for stage in report.stages] == [
+        ("ingest", None),
+        ("dedupe_identity", None),
+        ("flaky", "vendor down"),
+        ("flaky", None),
+        ("score_owners", None),
+        ("dashboard", None),
+    ]
+    assert calls == ["flaky", "flaky"]
+    assert count("source_records") == 6
+
+    runner.run_pipeline(SAMPLE_DIR)
+    assert count("source_records") == 6
+    with pytest.raises(ValueError):
+        runner.select_stages(from_stage="missing")
+    assert runner.select_stages(only_stages=["score_owners"]) == ["score_owners"]
+
+
+def test_full_run_does_not_resume_failed_partial_run(db, monkeypatch):
+    calls = []
+
+    def flaky(context):
+        calls.append("flaky")
+        if len(calls) == 1:
+            raise RuntimeError("vendor down")
+
+    monkeypatch.setattr(
+        runner,
+        "STAGES",
+        {"ingest": runner.stage_ingest, "flaky": flaky, "score_owners": runner.stage_score_owners},
+    )
+    with pytest.raises(RuntimeError):
+        runner.run_pipeline(SAMPLE_DIR, only_stages=["flaky"])
+    report = runner.run_pipeline(SAMPLE_DIR)
+    assert [stage.name for stage in report.stages] == [
+        "ingest",
+        "flaky",
+        "score_owners",
+        "dashboard",
+    ]
+    assert count("source_records") == 6
+
+
+def test_pipeline_jobs_run_in_background_one_at_a_time(db, monkeypatch):
+    monkeypatch.setattr(runner, "STAGES", {"ingest": runner.stage_ingest})
+    job_runner = jobs.PipelineJobRunner()
+    lock = jobs.acquire_run_lock()
+    with pytest.raises(jobs.PipelineBusyError):
+        job_runner.submit(SAMPLE_DIR)
+    # Direct runs (the CLI) take the same lock.
+    with pytest.raises(runner.PipelineBusyError):
+        runner.run_pipeline(SAMPLE_DIR, rebuild=True)
+    assert database.DB_PATH.exists()
+    lock.close()
+
+    job = job_runner.submit(SAMPLE_DIR)
+    deadline = time.monotonic() + 10
+    while jobs.get_job(job.id).status in {"queued", "running"}:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    finished = jobs.get_job(job.id)
+    assert finished.status == "succeeded"
+    assert finished.progress()["percent"] == 100.0
+    assert [stage["name"] for stage in finished.report["stages"]] == ["ingest", "dashboard"]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import io
+import re
+import shutil
+import sqlite3
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+
+from app import api, main
+from app.db import database
+from app.pipeline import runner
+from app.pipeline.steps import PipelineConfig, dashboard
+
+LARGE_TABLES = {
+    "owners",
+    "source_records",
+    "addresses",
+    "contacts",
+    "contact_attempts",
+    "outreach_queue",
+    "inbound_messages",
+    "hot_leads",
+    "owner_message_stats",
+    "source_record_owners",
+    "owner_match_tokens",
+    "api_raw_records",
+    "api_owners",
+    "api_owner_records",
+    "api_owner_attributes",
+}
+
+# Full passes that are the point of a phase, by phase. Any other scan of a
+# large table is a missing index or a query that has stopped using one.
+INTENTIONAL_SCANS = {
+    # Every contact is weighed for the queue on each run.
+    "outreach_queue": {"contacts"},
+    # Owners are rescored from all of their addresses in one UPDATE.
+    "score_owners": {"addresses"},
+    # The demo replies: an emptiness check and the first three owners.
+    "ai_inbound_handler": {"inbound_messages", "owners"},
+    "dashboard_recount": LARGE_TABLES,
+    # Upload and dedupe responses report table totals.
+    "api_ingest": {"api_raw_records"},
+    "api_dedupe": {"api_raw_records", "api_owners"},
+}
+
+CSV = (
+    "Owner_Name,Mailing_Address,County,Source\n"
+    "Janet Miller,123 Elm St,Stark,lease\n"
+    "janet  miller,123 Elm St,Wayne,permit\n"
+    "Barker Family Trust,45 Ridge Rd,Washington,lease\n"
+)
+
+_DATA_STATEMENT = re.compile(r"\s*(SELECT|INSERT|UPDATE|DELETE|REPLACE|WITH)\b", re.IGNORECASE)
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_TABLE_ALIAS = re.compile(r"\b(?:FROM|JOIN|UPDATE)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+
+
+class StatementTrace:
+    """Distinct data statements issued on pooled connections, by phase.
+
+    Statements arrive with their parameters expanded; literals are folded
+    so repeated calls collapse to one example per statement and phase.
+    """
+
+    def __init__(self) -> None:
+        self.phase = ""
+        self.statements: dict[tuple[str, str], tuple[Path, str]] = {}
+
+    def record(self, path: Path, sql: str) -> None:
+        if _DATA_STATEMENT.match(sql):
+            shape = " ".join(_LITERAL.sub("?", sql).split())
+            self.statements.setdefault((self.phase, shape), (path, sql))
+
+
+@pytest.fixture
+def trace(db, monkeypatch):
+    statements = StatementTrace()
+    acquire = database.ConnectionPool.acquire
+
+    def traced_acquire(pool):
+        conn = acquire(pool)
+        conn.set_trace_callback(lambda sql: statements.record(pool.path, sql))
+        return conn
+
+    monkeypatch.setattr(database.ConnectionPool, "acquire", traced_acquire)
+    return statements
+
+
+def scanned_tables(conn, sql: str) -> set[str]:
+    """Large tables ``sql`` reads in full, with aliases resolved."""
+    tables = {}
+    for table, alias in _TABLE_ALIAS.findall(sql):
+        if table in LARGE_TABLES:
+            tables[table] = table
+            if alias:
+                tables[alias] = table
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    return {
+        tables[row["detail"].split()[1]]
+        for row in plan
+        if row["detail"].startswith("SCAN ") and row["detail"].split()[1] in tables
+    }
+
+
+def run_phases(trace: StatementTrace, sample_dir: Path) -> None:
+    # Stages are called directly: run_pipeline's query counters would
+    # replace the trace callback.
+    context = runner.PipelineContext(sample_dir=sample_dir, config=PipelineConfig())
+    for _ in range(2):  # a fresh run, then an incremental one
+        for name, stage in runner.STAGES.items():
+            trace.phase = name
+            stage(context)
+
+    trace.phase = "dashboard"
+    dashboard(context.config)
+    trace.phase = "dashboard_recount"
+    dashboard(context.config, recount=True)
+
+    for _ in range(2):
+        trace.phase = "api_ingest"
+        main.ingest(UploadFile(file=io.BytesIO(CSV.encode()), filename="owners.csv"))
+        trace.phase = "api_dedupe"
+        main.run_dedupe()
+    trace.phase = "api_listing"
+    page = main.list_owners(limit=1)
+    main.list_owners(limit=1, cursor=page["next_cursor"])
+    page = api.get_owners(limit=1, min_score=0.1, output="json")
+    api.get_owners(limit=1, cursor=page["next_cursor"], min_score=0.1, output="json")
+    since = (datetime.utcnow() - timedelta(days=1)).isoformat()
+    page = api.get_hot_leads(limit=1, since=since, output="json")
+    api.get_hot_leads(limit=1, cursor=page["next_cursor"], since=since, output="json")
+    api.get_dashboard()
+
+
+def test_pipeline_and_api_queries_use_indexes(trace, tmp_path):
+    sample_dir = tmp_path / "sample"
+    shutil.copytree(Path("app/sample_data"), sample_dir)
+    run_phases(trace, sample_dir)
+
+    traced_phases = {phase for phase, _ in trace.statements}
+    assert traced_phases == {
+        *runner.STAGES,
+        "dashboard",
+        "dashboard_recount",
+        "api_ingest",
+        "api_dedupe",
+        "api_listing",
+    }
+    unexpected = defaultdict(list)
+    for (phase, shape), (path, sql) in trace.statements.items():
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        try:
+            scans = scanned_tables(conn, sql) - INTENTIONAL_SCANS.get(phase, set())
+        finally:
+            conn.close()
+        if scans:
+            unexpected[phase].append((sorted(scans), shape))
+    assert dict(unexpected) == {}
+
+
+def test_scans_of_aliased_tables_are_found(db):
+    with database.get_connection() as conn:
+        assert scanned_tables(conn, "SELECT c.value FROM contacts c WHERE c.value = 'x'") == {
+            "contacts"
+        }
+        assert scanned_tables(conn, "SELECT * FROM contacts AS c WHERE c.owner_id = 'x'") == set()
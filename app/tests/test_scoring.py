@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import gc
+import random
 from datetime import datetime, timedelta
 
 from app.compliance.rules import is_suppressed, should_allow_outreach
 from app.models.schemas import Address, IntentLabel
 from app.scoring.address import address_score
-from app.scoring.dedupe import dedupe_score
+from app.scoring.batch import AddressColumns, address_scores, hot_lead_flags, max_by_owner
+from app.scoring.dedupe import (
+    DEDUPE_THRESHOLD,
+    MatchKey,
+    OwnerMatchIndex,
+    dedupe_score,
+    frozen_gc,
+    match_key,
+    match_score,
+    normalize_name,
+)
 from app.scoring.hot_lead import is_hot_lead
 
 
@@ -14,6 +26,27 @@ def test_dedupe_score_matches():
     assert dedupe_score("Janet Miller", "Janet A. Miller") >= 0.5
 
 
+def test_match_keys_score_like_names():
+    assert match_key("Ridge Creek, LLC") is match_key("Ridge Creek, LLC")
+    assert match_key("Ridge Creek, LLC") == MatchKey.from_normalized("RIDGE CREEK LLC")
+    assert normalize_name(normalize_name("Estate of  Ann Roe.")) == "ESTATE OF ANN ROE"
+    trust = match_key("Barker Family Trust")
+    assert match_score(trust, match_key("The Barker Family Trust")) == 0.75
+    assert match_score(trust, MatchKey.from_normalized("BARKER FAMILY TRUST")) == 1.0
+    assert match_score(trust, match_key("!!")) == 0.0
+    assert match_score(match_key(""), match_key("!!")) == 1.0
+
+
+def test_frozen_gc_nests_and_keeps_collection_enabled():
+    assert gc.isenabled()
+    with frozen_gc():
+        with frozen_gc():
+            assert gc.get_freeze_count() > 0
+        assert gc.get_freeze_count() > 0
+        assert gc.isenabled()
+    assert gc.get_freeze_count() == 0
+
+
 def test_address_score_caps():
     address = Address(
         id="addr-1",
@@ -45,3 +78,72 @@ def test_hot_lead_routing():
     assert is_hot_lead(IntentLabel.interested, meaningful_messages=1) is True
     assert is_hot_lead(IntentLabel.curious, meaningful_messages=2) is True
     assert is_hot_lead(IntentLabel.curious, meaningful_messages=1) is False
+
+
+def test_match_index_agrees_with_linear_scan():
+    names = [
+        "Janet Miller",
+        "Janet A. Miller",
+        "MILLER, JANET",
+        "Barker Family Trust",
+        "The Barker Family Trust",
+        "Estate of Janet Miller",
+        "A B C D E F G H I J",
+        "A B C D E F G H I K",
+        "A B C D E F G H I J K",
+        "",
+        "!!",
+        "Ridge Creek Minerals LLC",
+    ]
+    index = OwnerMatchIndex()
+    owner_map: dict[str, str] = {}
+    for position, name in enumerate(names):
+        normalized = normalize_name(name)
+        expected = None
+        for key, owner_id in owner_map.items():
+            if dedupe_score(normalized, key) >= DEDUPE_THRESHOLD:
+                expected = owner_id
+                break
+        assert index.match(normalized) == expected
+        if expected is None:
+            owner_map[normalized] = str(position)
+            index.add(normalized, str(position))
+
+
+def test_columnar_address_scores_match_scalar():
+    rng = random.Random(3)
+    confidences = [0.0, 0.55, 0.6, 0.7, 0.9, 0.95, 1.0] + [rng.random() for _ in range(500)]
+    addresses = [
+        Address(
+            id=f"addr-{i}",
+            owner_id=f"own-{i % 37}",
+            line1="1 Main",
+            city="Canton",
+            state="OH",
+            postal_code="44702",
+            confidence=confidence,
+            is_deliverable=rng.random() < 0.5,
+        )
+        for i, confidence in enumerate(confidences)
+    ]
+    columns = AddressColumns.from_rows(address.model_dump() for address in addresses)
+    scores = address_scores(columns)
+    assert list(scores) == [address_score(address) for address in addresses]
+
+    expected: dict[str, float] = {}
+    for address in addresses:
+        expected[address.owner_id] = max(
+            expected.get(address.owner_id, 0.0), address_score(address)
+        )
+    assert max_by_owner(columns.owner_id, scores) == expected
+
+
+def test_hot_lead_flags_match_scalar():
+    intents = list(IntentLabel) * 4
+    counts = [count for count in range(4) for _ in IntentLabel]
+    assert hot_lead_flags(intents, counts) == [
+        is_hot_lead(intent, count) for intent, count in zip(intents, counts)
+    ]
+    assert hot_lead_flags([intent.value for intent in intents], counts) == hot_lead_flags(
+        intents, counts
+    )